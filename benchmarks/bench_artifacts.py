@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Checkpoint cost of inline planning payloads versus artifact references.
+
+Runs a graph shaped like a sprint over SprintWorkflowState with a SQLite
+checkpointer: a planning node emits PM, UX and engineering outputs and
+a synthesized plan of ``--stories`` stories, ``--feedback`` gap analysis
+and feedback iterations follow (the gap analysis is the same each time,
+the plan changes on every other iteration), then ``--steps``
+implementation supersteps that only append status messages.
+
+The ``inline`` variant keeps the payloads in state. The ``artifacts``
+variant stores them in an ArtifactStore and keeps references. Reports
+wall time, checkpoint database size, artifact directory size, and the
+time to load the latest checkpoint with ``get_state``.
+
+Usage:
+    python benchmarks/bench_artifacts.py [--stories 200,1000] [--feedback 4] [--steps 200]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from langgraph.graph import END, START, StateGraph
+
+from graph.artifacts import ArtifactStore, externalize, load_artifact, set_artifact_store
+from graph.checkpoint import SqliteCheckpointSaver
+from graph.state import SprintWorkflowState
+
+
+def planning_output(kind: str, stories: int) -> dict:
+    return {
+        "kind": kind,
+        "items": [
+            {"id": f"{kind}-{i}", "title": f"{kind} item {i} " * 4,
+             "criteria": [f"criterion {j} for {kind} item {i}" for j in range(4)]}
+            for i in range(stories)
+        ],
+    }
+
+
+def build(stories: int, feedback: int, steps: int):
+    def plan(state):
+        return externalize({
+            "pm_output": planning_output("pm", stories),
+            "ux_output": planning_output("ux", stories),
+            "engineering_output": planning_output("eng", stories),
+            "synthesized_plan": planning_output("plan", stories),
+            "retry_counts": {"gap_analysis": 0},
+        })
+
+    def gap(state):
+        count = state["retry_counts"]["gap_analysis"] + 1
+        return externalize({
+            "gap_analysis": {"issues_found": [{"severity": "high", "detail": "x" * 2000}]},
+            "retry_counts": {"gap_analysis": count},
+        })
+
+    def update_plan(state):
+        count = state["retry_counts"]["gap_analysis"]
+        if count % 2:
+            return {"status_messages": [f"Feedback pass {count}: no changes"]}
+        plan = load_artifact(state, "synthesized_plan")
+        plan["items"].append({"id": f"fix-{count}", "title": "Address gap", "criteria": []})
+        return externalize({"synthesized_plan": plan, "status_messages": [f"Feedback pass {count}"]})
+
+    def implement(state):
+        step = state["retry_counts"].get("implementation", 0) + 1
+        return {"retry_counts": {"implementation": step}, "status_messages": [f"Step {step}"]}
+
+    builder = StateGraph(SprintWorkflowState)
+    builder.add_node("plan", plan)
+    builder.add_node("gap", gap)
+    builder.add_node("update_plan", update_plan)
+    builder.add_node("implement", implement)
+    builder.add_edge(START, "plan")
+    builder.add_edge("plan", "gap")
+    builder.add_conditional_edges(
+        "gap", lambda s: "update_plan" if s["retry_counts"]["gap_analysis"] <= feedback else "implement"
+    )
+    builder.add_edge("update_plan", "gap")
+    builder.add_conditional_edges(
+        "implement", lambda s: "implement" if s["retry_counts"]["implementation"] < steps else END
+    )
+    return builder
+
+
+def directory_bytes(path: str) -> int:
+    return sum(f.stat().st_size for f in Path(path).rglob("*") if f.is_file())
+
+
+def measure(variant: str, stories: int, feedback: int, steps: int, loads: int = 20) -> dict:
+    workdir = tempfile.mkdtemp(prefix="artifact-bench-")
+    try:
+        store = ArtifactStore(os.path.join(workdir, "artifacts")) if variant == "artifacts" else None
+        set_artifact_store(store)
+        db = os.path.join(workdir, "checkpoints.db")
+        saver = SqliteCheckpointSaver(db)
+        app = build(stories, feedback, steps).compile(checkpointer=saver)
+        config = {"configurable": {"thread_id": "bench"}, "recursion_limit": steps + 4 * feedback + 20}
+
+        start = time.perf_counter()
+        app.invoke({"status_messages": [], "retry_counts": {}}, config)
+        wall = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(loads):
+            app.get_state(config)
+        load = (time.perf_counter() - start) / loads
+
+        saver.close()
+        return {
+            "wall": wall,
+            "db": sum(os.path.getsize(db + s) for s in ("", "-wal") if os.path.exists(db + s)),
+            "store": directory_bytes(store.root) if store else 0,
+            "load": load,
+        }
+    finally:
+        set_artifact_store(None)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stories", default="200,1000")
+    parser.add_argument("--feedback", type=int, default=4)
+    parser.add_argument("--steps", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'stories':>7} {'variant':<10} {'wall':>8} {'checkpoints':>12} {'artifacts':>10} {'get_state':>10}")
+    for stories in (int(s) for s in args.stories.split(",")):
+        for variant in ("inline", "artifacts"):
+            r = measure(variant, stories, args.feedback, args.steps)
+            print(
+                f"{stories:>7} {variant:<10} {r['wall']:>7.2f}s {r['db'] / 1024:>10.0f}KB "
+                f"{r['store'] / 1024:>8.0f}KB {r['load'] * 1e3:>8.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Per-call compile overhead with and without the compiled graph cache.
+
+For each graph variant this times ``builder().compile(...)`` (what every
+call used to do) against ``get_compiled_graph`` (what the compile
+functions and execute_sprint do now).
+
+Usage:
+    python benchmarks/bench_compile_cache.py [--calls 200]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "mcp-servers"))
+
+from graph.cache import get_compiled_graph, invalidate_compiled_graphs, make_checkpointer
+from graph.workflow import build_workflow
+from graph.workflow_complete import build_complete_workflow
+from langgraph_sprint_executor import build_sprint_workflow
+
+VARIANTS = {
+    "workflow": build_workflow,
+    "complete": build_complete_workflow,
+    "executor": build_sprint_workflow,
+}
+
+
+def time_calls(fn, calls: int) -> float:
+    """Mean seconds per call"""
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'variant':<10} {'uncached':>12} {'cached':>12} {'speedup':>10}")
+    for variant, builder in VARIANTS.items():
+        uncached = time_calls(
+            lambda: builder().compile(checkpointer=make_checkpointer("memory")),
+            args.calls,
+        )
+
+        invalidate_compiled_graphs()
+        get_compiled_graph(variant, builder, "memory")
+        cached = time_calls(
+            lambda: get_compiled_graph(variant, builder, "memory"),
+            args.calls,
+        )
+
+        print(
+            f"{variant:<10} {uncached * 1e3:>10.3f}ms {cached * 1e6:>10.3f}us "
+            f"{uncached / cached:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
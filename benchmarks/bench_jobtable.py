@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Memory and aggregation cost of JobSpec dicts versus JobTable.
+
+Builds N jobs shaped like the ones the executor creates (name, status,
+story points, worktree, branch, repository, todos, files and
+dependencies) and measures, with tracemalloc, the memory held by a list
+of JobSpec dicts and by a JobTable holding the same jobs. It then times
+per-status counts and story points: a Python loop over the dicts against
+the table's column operations. Finally it checks that the table
+round-trips back to the original dicts.
+
+Usage:
+    python benchmarks/bench_jobtable.py [--sizes 5000,50000] [--repeat 20]
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from graph.jobtable import JobTable
+from graph.registry import JOB_STATUSES
+
+
+def make_jobs(count: int, seed: int = 0):
+    """Synthetic jobs, built fresh so no strings are shared by accident"""
+    rng = random.Random(seed)
+    names = [f"job-{i:05d}" for i in range(count)]
+    jobs = []
+    for i, name in enumerate(names):
+        repo = f"/work/repos/repo-{i % 8}"
+        jobs.append({
+            "name": name,
+            "task_file": f"/work/tasks/{name}.md",
+            "worktree": f"/work/worktrees/feat-{name}",
+            "repo_root": "".join(repo),
+            "branch": f"feat/{name}",
+            "todos": [f"Step {s + 1} of {name}" for s in range(rng.randint(2, 8))],
+            "story_points": rng.choice((1, 2, 3, 5, 8)),
+            "status": rng.choice(JOB_STATUSES),
+            "retry_count": rng.randint(0, 3),
+            "error_message": None,
+            "files_to_modify": [f"src/module_{rng.randrange(50)}.py" for _ in range(rng.randint(1, 3))],
+            "dependencies": [names[j] for j in rng.sample(range(max(0, i - 50), i), min(2, i))],
+        })
+    return jobs
+
+
+def allocated(build):
+    """Bytes still allocated after ``build()``, with its result kept alive"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return size, result
+
+
+def dict_aggregates(jobs):
+    counts = dict.fromkeys(JOB_STATUSES, 0)
+    points = dict.fromkeys(JOB_STATUSES, 0)
+    for job in jobs:
+        counts[job["status"]] += 1
+        points[job["status"]] += job["story_points"]
+    return counts, points
+
+
+def table_aggregates(table):
+    return table.counts(), table.points_by_status()
+
+
+def timed(func, arg, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(arg)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="5000,50000")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'jobs':>6} {'dicts':>9} {'table':>9} {'ratio':>6} {'loop agg':>10} {'table agg':>10}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        dict_bytes, jobs = allocated(lambda: make_jobs(size))
+        table_bytes, table = allocated(lambda: JobTable(make_jobs(size)))
+        assert table.to_jobs() == jobs
+        assert table_aggregates(table) == dict_aggregates(jobs)
+
+        loop = timed(dict_aggregates, jobs, args.repeat)
+        vector = timed(table_aggregates, table, args.repeat)
+        print(
+            f"{size:>6} {dict_bytes / 2**20:>7.1f}MB {table_bytes / 2**20:>7.1f}MB "
+            f"{dict_bytes / table_bytes:>5.1f}x {loop * 1e3:>8.2f}ms {vector * 1e3:>8.2f}ms"
+        )
+        del jobs, table
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Round-trip latency micro-benchmark for the MCP server stdio transport.
+
+Spawns the server once per transport (``pipe`` and ``thread``), sends
+``initialize`` and ``tools/list`` requests one at a time and reports the
+latency distribution of each method.
+
+Usage:
+    python benchmarks/bench_mcp_roundtrip.py [--requests 500]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+SERVER = Path(__file__).resolve().parent.parent / "mcp-servers" / "langgraph_sprint_executor.py"
+
+
+async def measure(transport: str, requests: int) -> dict:
+    """Measure per-request round-trip latency against one transport"""
+    env = {**os.environ, "MCP_STDIO_TRANSPORT": transport}
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, str(SERVER),
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        env=env,
+    )
+
+    latencies = {"initialize": [], "tools/list": []}
+    request_id = 0
+
+    # Warm up so interpreter start-up is not measured
+    for method in latencies:
+        request_id += 1
+        proc.stdin.write(json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method}).encode() + b"\n")
+        await proc.stdin.drain()
+        await proc.stdout.readline()
+
+    for i in range(requests):
+        method = "initialize" if i % 2 == 0 else "tools/list"
+        request_id += 1
+        payload = json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method}).encode() + b"\n"
+
+        start = time.perf_counter()
+        proc.stdin.write(payload)
+        await proc.stdin.drain()
+        response = json.loads(await proc.stdout.readline())
+        latencies[method].append(time.perf_counter() - start)
+
+        assert response["id"] == request_id
+
+    proc.stdin.close()
+    await proc.wait()
+    return latencies
+
+
+def summarize(samples: list) -> str:
+    samples = sorted(samples)
+    p50 = samples[len(samples) // 2] * 1e6
+    p95 = samples[int(len(samples) * 0.95)] * 1e6
+    mean = statistics.mean(samples) * 1e6
+    return f"mean {mean:8.1f}us  p50 {p50:8.1f}us  p95 {p95:8.1f}us"
+
+
+async def run(requests: int):
+    for transport in ("thread", "pipe"):
+        latencies = await measure(transport, requests)
+        for method, samples in latencies.items():
+            print(f"{transport:>6}  {method:<11} {summarize(samples)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
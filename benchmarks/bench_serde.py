@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Checkpoint serialize/deserialize throughput by serializer.
+
+Builds SprintWorkflowState-shaped states of increasing job counts (jobs
+keyed by id, status lists, retry counters, a status log and a planning
+payload) and times ``dumps_typed`` and ``loads_typed`` on each channel
+value, the way a checkpointer stores them. Compares LangGraph's
+JsonPlusSerializer with CheckpointSerializer's msgpack and JSON codecs,
+reporting encoded size and MB/s of encoded bytes in each direction.
+
+Usage:
+    python benchmarks/bench_serde.py [--sizes 100,1000,10000,50000] [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from graph.serde import CheckpointSerializer
+
+
+def make_state(jobs: int) -> dict:
+    statuses = ("pending", "implementing", "verifying", "verified", "failed")
+    job_map = {
+        f"job-{i}": {
+            "id": f"job-{i}",
+            "name": f"feature-{i}",
+            "task_file": f"tasks/feature-{i}.md",
+            "worktree": f"../worktrees/feat-feature-{i}",
+            "repo_root": f"/work/repo-{i % 4}",
+            "branch": f"feat/feature-{i}",
+            "todos": [f"Step {s} of feature {i}" for s in range(4)],
+            "story_points": i % 8,
+            "status": statuses[i % 5],
+            "retry_count": i % 3,
+            "error_message": None,
+            "files_to_modify": [f"src/module_{(i + k) % 50}.py" for k in range(2)],
+            "dependencies": [f"feature-{i - 1}"] if i else [],
+        }
+        for i in range(jobs)
+    }
+    return {
+        "project_name": "bench",
+        "phase": "verification",
+        "jobs": job_map,
+        "jobs_verified": [job["name"] for job in job_map.values() if job["status"] == "verified"],
+        "jobs_failed": [job["name"] for job in job_map.values() if job["status"] == "failed"],
+        "retry_counts": {"verification": 3, "gap_analysis": 1},
+        "status_messages": [f"Verified job-{i}" for i in range(jobs // 2)],
+        "synthesized_plan": {
+            "integrated_stories": [{"id": f"US-{i}", "title": f"Story {i}", "points": i % 8}
+                                   for i in range(max(10, jobs // 10))],
+        },
+    }
+
+
+def throughput(serde, state: dict, repeat: int):
+    """(encoded bytes, dump seconds, load seconds) per pass over the channels"""
+    encoded = [serde.dumps_typed(value) for value in state.values()]
+    size = sum(len(data) for _, data in encoded)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for value in state.values():
+            serde.dumps_typed(value)
+    dump = (time.perf_counter() - start) / repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in encoded:
+            serde.loads_typed(item)
+    load = (time.perf_counter() - start) / repeat
+
+    assert [serde.loads_typed(item) for item in encoded] == list(state.values())
+    return size, dump, load
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,10000,50000")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    serializers = (
+        ("langgraph", JsonPlusSerializer()),
+        ("msgpack", CheckpointSerializer("msgpack")),
+        ("json", CheckpointSerializer("json")),
+    )
+    print(f"{'jobs':>6} {'serializer':<10} {'size':>9} {'dump':>9} {'load':>9} {'dump MB/s':>10} {'load MB/s':>10}")
+    for jobs in (int(s) for s in args.sizes.split(",")):
+        state = make_state(jobs)
+        for name, serde in serializers:
+            size, dump, load = throughput(serde, state, args.repeat)
+            mb = size / 2**20
+            print(
+                f"{jobs:>6} {name:<10} {size / 1024:>7.0f}KB {dump * 1e3:>7.2f}ms {load * 1e3:>7.2f}ms "
+                f"{mb / dump:>10.0f} {mb / load:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
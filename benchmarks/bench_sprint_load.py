@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""End-to-end load benchmark for the sprint executor.
+
+For each sprint size, generates a synthetic sprint (see
+synthetic_sprint.py) and runs the executor graph over it from start to
+finish, with a SQLite checkpointer and the seeded simulated verifier.
+The fixed per-job sleeps are set to zero, so the numbers measure the
+executor itself. Reports wall time, time per phase (summed over
+revisits), peak RSS and checkpoint database size.
+
+Each size runs in a fresh interpreter, so peak RSS belongs to that size
+alone.
+
+Usage:
+    python benchmarks/bench_sprint_load.py [--sizes 50,200,1000] [--repos 4] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "mcp-servers"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def run_sprint(jobs: int, repos: int, pool_size: int, seed: int) -> dict:
+    """Generate and execute one sprint, returning its measurements"""
+    from synthetic_sprint import generate_sprint
+
+    workdir = tempfile.mkdtemp(prefix="sprint-bench-")
+    generate_sprint(workdir, jobs=jobs, repos=repos, seed=seed)
+    os.chdir(workdir)
+    os.environ.update({
+        "SPRINT_VERIFIER": "simulate",
+        "SPRINT_SIM_SEED": str(seed),
+        "SPRINT_SIM_TIME_SCALE": "0",
+    })
+
+    import langgraph_sprint_executor as executor
+    from graph.checkpoint import SqliteCheckpointSaver
+
+    executor.SIMULATED_DELAY = 0.0
+    db = os.path.join(workdir, "checkpoints.db")
+    saver = SqliteCheckpointSaver(db)
+    app = executor.build_sprint_workflow().compile(checkpointer=saver)
+    config = {"configurable": {"thread_id": "bench"}}
+    state = executor.new_sprint_state("bench", "prd.md", "todos.md", pool_size)
+
+    phases = {}
+    steps = 0
+    start = last = time.perf_counter()
+    async for update in app.astream(state, config, stream_mode="updates"):
+        now = time.perf_counter()
+        for node in update:
+            phases[node] = phases.get(node, 0.0) + now - last
+        steps += 1
+        last = now
+    wall = time.perf_counter() - start
+
+    await executor.flush_status_dashboard()
+    saver.close()
+    checkpoint_bytes = sum(
+        os.path.getsize(db + suffix) for suffix in ("", "-wal") if os.path.exists(db + suffix)
+    )
+    os.chdir(ROOT)
+    shutil.rmtree(workdir, ignore_errors=True)
+    return {
+        "jobs": jobs,
+        "repos": repos,
+        "wall_s": wall,
+        "steps": steps,
+        "phases_s": phases,
+        "peak_rss_mb": peak_rss_mb(),
+        "checkpoint_bytes": checkpoint_bytes,
+    }
+
+
+def run_child(size: int, args) -> dict:
+    """Run one size in a fresh interpreter"""
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", str(size), "--repos", str(args.repos),
+         "--pool-size", str(args.pool_size), "--seed", str(args.seed)],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="50,200,1000")
+    parser.add_argument("--repos", type=int, default=4)
+    parser.add_argument("--pool-size", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print one JSON object per size")
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        result = asyncio.run(run_sprint(args.child, args.repos, args.pool_size, args.seed))
+        print(json.dumps(result))
+        return
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    if not args.json:
+        print(f"{'jobs':>6} {'wall':>9} {'steps':>6} {'peak rss':>10} {'checkpoints':>12}  phases")
+    for size in sizes:
+        result = run_child(size, args)
+        if args.json:
+            print(json.dumps(result))
+            continue
+        phases = "  ".join(f"{node} {seconds:.2f}s" for node, seconds in result["phases_s"].items())
+        print(
+            f"{result['jobs']:>6} {result['wall_s']:>8.2f}s {result['steps']:>6} "
+            f"{result['peak_rss_mb']:>8.1f}MB {result['checkpoint_bytes'] / 1024:>10.0f}KB  {phases}"
+        )
+
+
+if __name__ == "__main__":
+    main()
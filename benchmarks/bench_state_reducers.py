@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Cost of full-copy state updates versus reducer deltas in long loops.
+
+Runs a single-node verification loop for K supersteps over two schemas.
+The ``plain`` schema is SprintWorkflowState with its reducers stripped,
+so every iteration has to copy ``status_messages``, ``errors`` and
+``retry_counts`` and return the whole thing. The ``reducers`` schema is
+SprintWorkflowState as shipped, where the node returns only the new
+message, the new error and the changed counter. Both runs use
+MemorySaver; afterwards the bytes it stored are summed, split into
+channel blobs (the checkpointed state) and pending writes (node outputs).
+
+A second loop does the same for ``jobs``: each step moves a few of
+``--jobs`` jobs forward, returning either the whole job list (plain) or
+patches for just those jobs (reducers). MemorySaver still stores the
+whole jobs mapping whenever it changes, so the loop also runs the
+reducers variant on SqliteCheckpointSaver (``keyed``), which stores only
+the changed jobs plus a manifest; its blobs column counts channel blobs,
+manifests and job entries.
+
+Usage:
+    python benchmarks/bench_state_reducers.py [--steps 50,200,1000] [--jobs 5000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TypedDict, get_type_hints
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+
+from graph.checkpoint import SqliteCheckpointSaver
+from graph.state import SprintWorkflowState
+
+PlainSprintState = TypedDict("PlainSprintState", get_type_hints(SprintWorkflowState), total=False)
+
+
+def plain_verify(state):
+    """Loop body that rebuilds every accumulated field"""
+    step = state["retry_counts"].get("verification", 0) + 1
+    update = {
+        "retry_counts": {**state["retry_counts"], "verification": step},
+        "status_messages": state["status_messages"] + [f"Verification pass {step}: 1 job failed"],
+    }
+    if step % 5 == 0:
+        update["errors"] = state["errors"] + [{"job": f"job-{step}", "error": "Tests failed"}]
+    return update
+
+
+def delta_verify(state):
+    """Loop body that returns only what changed"""
+    step = state["retry_counts"].get("verification", 0) + 1
+    update = {
+        "retry_counts": {"verification": step},
+        "status_messages": [f"Verification pass {step}: 1 job failed"],
+    }
+    if step % 5 == 0:
+        update["errors"] = [{"job": f"job-{step}", "error": "Tests failed"}]
+    return update
+
+
+JOBS_PER_STEP = 10
+
+
+def plain_jobs_step(state):
+    """Loop body that updates jobs in place and returns the whole list"""
+    step = state["retry_counts"].get("verification", 0) + 1
+    jobs = list(state["jobs"].values()) if isinstance(state["jobs"], dict) else state["jobs"]
+    for job in jobs[step * JOBS_PER_STEP:(step + 1) * JOBS_PER_STEP]:
+        job["status"] = "verified"
+    return {"jobs": jobs, "retry_counts": {**state["retry_counts"], "verification": step}}
+
+
+def delta_jobs_step(state):
+    """Loop body that returns patches for the jobs it changed"""
+    step = state["retry_counts"].get("verification", 0) + 1
+    changed = list(state["jobs"])[step * JOBS_PER_STEP:(step + 1) * JOBS_PER_STEP]
+    return {
+        "jobs": {key: {"status": "verified"} for key in changed},
+        "retry_counts": {"verification": step},
+    }
+
+
+def build(schema, node, steps: int, saver=None):
+    builder = StateGraph(schema)
+    builder.add_node("verify", node)
+    builder.add_edge(START, "verify")
+    builder.add_conditional_edges(
+        "verify",
+        lambda state: "verify" if state["retry_counts"]["verification"] < steps else END,
+    )
+    saver = saver or MemorySaver()
+    return builder.compile(checkpointer=saver), saver
+
+
+def stored_bytes(saver):
+    """(channel blob bytes, pending write bytes) held by a saver"""
+    if isinstance(saver, SqliteCheckpointSaver):
+        saver.flush()
+        query = "SELECT COALESCE(SUM(LENGTH(value)), 0) FROM {}"
+        blobs = sum(saver._conn.execute(query.format(table)).fetchone()[0] for table in ("blobs", "entries"))
+        return blobs, saver._conn.execute(query.format("writes")).fetchone()[0]
+    blobs = sum(len(data) for _, data in saver.blobs.values())
+    writes = sum(len(write[2][1]) for inner in saver.writes.values() for write in inner.values())
+    return blobs, writes
+
+
+def measure(schema, node, steps: int, jobs: int = 0, sqlite: bool = False):
+    if sqlite:
+        workdir = tempfile.mkdtemp(prefix="reducer-bench-")
+        app, saver = build(schema, node, steps, SqliteCheckpointSaver(os.path.join(workdir, "cp.db")))
+    else:
+        app, saver = build(schema, node, steps)
+    initial = {"status_messages": [], "errors": [], "retry_counts": {}, "checkpoints": []}
+    if jobs:
+        initial["jobs"] = [
+            {"id": f"job-{i}", "name": f"job-{i}", "status": "pending", "story_points": 3,
+             "todos": ["Implement", "Test"], "branch": f"feat/job-{i}"}
+            for i in range(jobs)
+        ]
+    config = {"configurable": {"thread_id": "bench"}, "recursion_limit": steps + 10}
+
+    start = time.perf_counter()
+    app.invoke(initial, config)
+    elapsed = time.perf_counter() - start
+    stored = stored_bytes(saver)
+    if sqlite:
+        saver.close()
+    return elapsed, *stored
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", default="50,200,1000")
+    parser.add_argument("--jobs", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'loop':<5} {'steps':>6} {'variant':<9} {'per step':>10} {'blobs':>10} {'writes':>10}")
+    for steps in (int(s) for s in args.steps.split(",")):
+        for loop, jobs, variants in (
+            ("log", 0, (("plain", PlainSprintState, plain_verify, False),
+                        ("reducers", SprintWorkflowState, delta_verify, False))),
+            ("jobs", args.jobs, (("plain", PlainSprintState, plain_jobs_step, False),
+                                 ("reducers", SprintWorkflowState, delta_jobs_step, False),
+                                 ("keyed", SprintWorkflowState, delta_jobs_step, True))),
+        ):
+            for variant, schema, node, sqlite in variants:
+                elapsed, blobs, writes = measure(schema, node, steps, jobs, sqlite)
+                print(
+                    f"{loop:<5} {steps:>6} {variant:<9} {elapsed / steps * 1e6:>8.0f}us "
+                    f"{blobs / 1024:>8.0f}KB {writes / 1024:>8.0f}KB"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Generate a synthetic sprint for load-testing the executor.
+
+Writes N task files to ``<root>/tasks`` and spreads their jobs across M
+local git repositories under ``<root>/repos``. Each task has story
+points, todo checkboxes, files to modify drawn from its repository's
+file pool (so some jobs overlap), and dependencies on earlier jobs (so
+the dependency graph is always acyclic).
+
+Every job's worktree, ``<root>/worktrees/feat-<name>``, is a symlink to
+its repository. That is enough for repository detection and branch
+checks, and avoids creating N real git worktrees.
+
+Usage:
+    python benchmarks/synthetic_sprint.py DIR [--jobs 100] [--repos 4] [--seed 0]
+"""
+
+import argparse
+import os
+import random
+import subprocess
+from pathlib import Path
+from typing import Dict
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "bench", "GIT_AUTHOR_EMAIL": "bench@example.com",
+    "GIT_COMMITTER_NAME": "bench", "GIT_COMMITTER_EMAIL": "bench@example.com",
+}
+
+
+def git(cwd: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, env={**os.environ, **GIT_ENV})
+
+
+def task_markdown(name: str, rng: random.Random, earlier: list, files: list, dependency_rate: float) -> str:
+    """Render one task file"""
+    points = rng.choice((1, 2, 3, 5, 8))
+    deps = [dep for dep in rng.sample(earlier, min(3, len(earlier))) if rng.random() < dependency_rate]
+    touched = rng.sample(files, rng.randint(1, min(3, len(files))))
+    todos = "\n".join(f"- [ ] Step {i + 1} of {name}" for i in range(rng.randint(2, 8)))
+    return (
+        f"# {name}\n\n"
+        f"Story Points: {points}\n"
+        f"Dependencies: {', '.join(deps) or 'none'}\n"
+        f"Files to modify: {', '.join(touched)}\n\n"
+        f"## Todos\n{todos}\n"
+    )
+
+
+def generate_sprint(
+    root: str,
+    jobs: int = 100,
+    repos: int = 4,
+    seed: int = 0,
+    dependency_rate: float = 0.2,
+    files_per_repo: int = 50,
+) -> Dict[str, int]:
+    """Write a synthetic sprint under ``root``.
+
+    Args:
+        root: Directory to create the sprint in; becomes the working
+            directory the executor runs from
+        jobs: Number of task files
+        repos: Number of local git repositories
+        seed: Seed for every random choice
+        dependency_rate: Chance each candidate earlier job becomes a
+            dependency (up to three candidates per job)
+        files_per_repo: Size of each repository's file pool
+
+    Returns:
+        Counts of jobs, repos and dependency edges written
+    """
+    rng = random.Random(seed)
+    root_path = Path(root)
+    (root_path / "tasks").mkdir(parents=True, exist_ok=True)
+    (root_path / "worktrees").mkdir(exist_ok=True)
+
+    repo_paths = []
+    for i in range(repos):
+        repo = root_path / "repos" / f"repo-{i}"
+        repo.mkdir(parents=True, exist_ok=True)
+        git(repo, "init", "-q", "-b", "main")
+        (repo / "README.md").write_text(f"# repo-{i}\n")
+        git(repo, "add", "README.md")
+        git(repo, "commit", "-q", "-m", "init")
+        repo_paths.append(repo)
+
+    file_pool = [f"src/module_{i}.py" for i in range(files_per_repo)]
+    names = [f"job-{i:05d}" for i in range(jobs)]
+    edges = 0
+    for i, name in enumerate(names):
+        content = task_markdown(name, rng, names[max(0, i - 50):i], file_pool, dependency_rate)
+        edges += content.split("Dependencies: ", 1)[1].split("\n", 1)[0].count("job-")
+        (root_path / "tasks" / f"{name}.md").write_text(content)
+
+        worktree = root_path / "worktrees" / f"feat-{name}"
+        if not worktree.exists():
+            worktree.symlink_to(repo_paths[i % repos].resolve(), target_is_directory=True)
+
+    return {"jobs": jobs, "repos": repos, "dependencies": edges}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("root")
+    parser.add_argument("--jobs", type=int, default=100)
+    parser.add_argument("--repos", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dependency-rate", type=float, default=0.2)
+    args = parser.parse_args()
+
+    counts = generate_sprint(args.root, args.jobs, args.repos, args.seed, args.dependency_rate)
+    print(f"Wrote {counts['jobs']} tasks across {counts['repos']} repos "
+          f"with {counts['dependencies']} dependencies to {args.root}")
+
+
+if __name__ == "__main__":
+    main()
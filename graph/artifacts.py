@@ -0,0 +1,298 @@
+"""Content-addressed store for large planning payloads.
+
+Planning outputs (``pm_output``, ``ux_output``, ``engineering_output``,
+``synthesized_plan``, ``gap_analysis``, ``sprint_prd``) are large nested
+dicts. Kept inline, every checkpoint that touches them serializes the
+whole payload again, every feedback iteration stores a fresh copy even
+when nothing changed, and every checkpoint load deserializes them long
+after planning is over.
+
+ArtifactStore writes each payload once to ``<root>/<2 hex>/<sha256>.json``
+and hands back a small reference, ``{"$artifact": <sha256>, "size": n}``.
+Nodes put references in state with ``externalize`` and read payloads
+back with ``load_artifact``, which accepts an inline value too. Equal
+payloads hash to the same file, so they are shared across checkpoints,
+feedback iterations and threads.
+
+The store is process-wide and off until configured, either with
+``set_artifact_store`` or by pointing ``SPRINT_ARTIFACT_DIR`` at a
+directory; without it payloads stay inline exactly as before.
+
+Recently used payload texts are kept in memory up to ``cache_bytes``,
+least recently used first out. Nothing deletes payload files on its
+own: the store can be shared by runs with separate checkpointers, even
+by other processes, and no single run can see every reference to it.
+``prune_artifacts`` is for maintenance when the checkpointers passed to
+it hold every live reference; every ``put`` and ``get`` refreshes a
+file's mtime, so payloads in recent use are also spared.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional, Set, Tuple
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
+from .writers import atomic_write_text
+
+ARTIFACT_FIELDS = (
+    "pm_output",
+    "ux_output",
+    "engineering_output",
+    "synthesized_plan",
+    "gap_analysis",
+    "sprint_prd",
+)
+"""State keys holding planning payloads that are stored by reference"""
+
+ARTIFACT_DIR_ENV = "SPRINT_ARTIFACT_DIR"
+
+CACHE_BYTES = 32 * 1024 * 1024
+"""Default budget for payload texts an ArtifactStore keeps in memory"""
+
+PRUNE_MIN_AGE = 600.0
+"""Seconds since a payload was last written, stored again or read
+before prune_artifacts may delete it"""
+
+_MISSING = object()
+
+
+def is_artifact_ref(value: Any) -> bool:
+    """Whether a state value is a reference produced by ArtifactStore.put"""
+    return isinstance(value, dict) and "$artifact" in value
+
+
+class ArtifactStore:
+    """Payloads on local disk, keyed by the SHA-256 of their canonical JSON"""
+
+    def __init__(self, root: str, min_bytes: int = 1024, cache_bytes: int = CACHE_BYTES):
+        """
+        Args:
+            root: Directory to keep payloads in; created if missing
+            min_bytes: Payloads whose JSON is shorter than this stay inline
+            cache_bytes: Most payload text, in UTF-8 bytes, kept in memory
+                for ``get``; 0 disables the cache
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.min_bytes = min_bytes
+        self.cache_bytes = cache_bytes
+        self.writes = 0
+        self._texts: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        self._cached = 0
+
+    def path(self, digest: str) -> Path:
+        """File holding the payload with this digest"""
+        return self.root / digest[:2] / f"{digest}.json"
+
+    def _remember(self, digest: str, text: str, size: int) -> None:
+        """Cache a payload's text, evicting the least recently used over budget"""
+        self._forget(digest)
+        if size > self.cache_bytes:
+            return
+        self._texts[digest] = (text, size)
+        self._cached += size
+        while self._cached > self.cache_bytes:
+            _, (_, evicted) = self._texts.popitem(last=False)
+            self._cached -= evicted
+
+    def _touch(self, digest: str) -> None:
+        """Refresh a payload file's mtime so prune sees it as in use"""
+        try:
+            os.utime(self.path(digest))
+        except FileNotFoundError:
+            pass
+
+    def _forget(self, digest: str) -> None:
+        entry = self._texts.pop(digest, None)
+        if entry is not None:
+            self._cached -= entry[1]
+
+    def put(self, payload: Any) -> Any:
+        """Store a payload and return its reference.
+
+        Payloads that are small or not JSON-serializable are returned
+        unchanged. A payload already in the store is not written again,
+        but its file's mtime is refreshed so ``prune`` sees it as in use.
+        """
+        if payload is None or is_artifact_ref(payload):
+            return payload
+        try:
+            text = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        except (TypeError, ValueError):
+            return payload
+        data = text.encode("utf-8")
+        size = len(data)
+        if size < self.min_bytes:
+            return payload
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            path.parent.mkdir(exist_ok=True)
+            atomic_write_text(str(path), text)
+            self.writes += 1
+        self._remember(digest, text, size)
+        return {"$artifact": digest, "size": size}
+
+    def get(self, ref: Mapping[str, Any]) -> Any:
+        """Load the payload behind a reference.
+
+        Each call parses a fresh copy, so callers may mutate the result,
+        and refreshes the file's mtime.
+
+        Raises:
+            KeyError: If the store has no payload with that digest
+        """
+        digest = ref["$artifact"]
+        entry = self._texts.get(digest)
+        if entry is not None:
+            self._texts.move_to_end(digest)
+            self._touch(digest)
+            return json.loads(entry[0])
+        try:
+            data = self.path(digest).read_bytes()
+        except FileNotFoundError:
+            raise KeyError(f"Artifact not found: {digest}") from None
+        text = data.decode("utf-8")
+        self._touch(digest)
+        self._remember(digest, text, len(data))
+        return json.loads(text)
+
+    def __contains__(self, digest: object) -> bool:
+        return isinstance(digest, str) and (digest in self._texts or self.path(digest).exists())
+
+    def prune(self, keep: Iterable[str], min_age: float = 0.0) -> int:
+        """Delete payloads whose digest is not in ``keep``; return how many
+
+        Args:
+            keep: Digests to keep
+            min_age: Also keep payloads written, stored again or read less
+                than this many seconds ago
+        """
+        keep = set(keep)
+        cutoff = time.time() - min_age
+        removed = 0
+        for path in self.root.glob("*/*.json"):
+            if path.stem in keep:
+                continue
+            try:
+                if min_age and path.stat().st_mtime > cutoff:
+                    continue
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            self._forget(path.stem)
+            removed += 1
+        return removed
+
+
+_store: Optional[ArtifactStore] = None
+
+
+def get_artifact_store() -> Optional[ArtifactStore]:
+    """The configured store, created from SPRINT_ARTIFACT_DIR on first use"""
+    global _store
+    if _store is None and os.environ.get(ARTIFACT_DIR_ENV):
+        _store = ArtifactStore(os.environ[ARTIFACT_DIR_ENV])
+    return _store
+
+
+def set_artifact_store(store: Optional[ArtifactStore]) -> None:
+    """Use ``store`` for all nodes in this process; None turns storage off"""
+    global _store
+    _store = store
+
+
+def artifact_digests(values: Mapping[str, Any]) -> Set[str]:
+    """Digests of the references in a state's (or update's) ARTIFACT_FIELDS"""
+    return {
+        value["$artifact"] for key, value in values.items()
+        if key in ARTIFACT_FIELDS and is_artifact_ref(value)
+    }
+
+
+def live_artifacts(checkpointer: BaseCheckpointSaver) -> Set[str]:
+    """Digests referenced by any checkpoint or pending write this checkpointer holds"""
+    live: Set[str] = set()
+    for item in checkpointer.list(None):
+        live |= artifact_digests(item.checkpoint["channel_values"])
+        for _, channel, value in item.pending_writes or ():
+            if channel in ARTIFACT_FIELDS and is_artifact_ref(value):
+                live.add(value["$artifact"])
+    return live
+
+
+def prune_artifacts(
+    checkpointers: Iterable[BaseCheckpointSaver],
+    states: Iterable[Mapping[str, Any]] = (),
+    store: Optional[ArtifactStore] = None,
+    min_age: float = PRUNE_MIN_AGE,
+) -> int:
+    """Delete stored payloads that none of the given runs refers to.
+
+    Only references held by ``checkpointers`` (on all of their threads)
+    and ``states`` are seen. A run with another checkpointer, such as an
+    in-memory one or one in another process, keeps its payloads only
+    while they are younger than ``min_age``; pass every checkpointer
+    sharing the store, or stop the other runs, before pruning.
+
+    Args:
+        checkpointers: Checkpointers whose checkpoints hold live references
+        states: States whose latest values may not be checkpointed yet
+        store: Store to prune instead of the configured one
+        min_age: Keep payloads written, stored again or read this recently
+
+    Returns:
+        Number of payloads deleted; 0 when no store is configured
+    """
+    store = store or get_artifact_store()
+    if store is None:
+        return 0
+    live: Set[str] = set()
+    for checkpointer in checkpointers:
+        live |= live_artifacts(checkpointer)
+    for state in states:
+        live |= artifact_digests(state)
+    return store.prune(live, min_age)
+
+
+def externalize(update: Dict[str, Any], store: Optional[ArtifactStore] = None) -> Dict[str, Any]:
+    """Replace planning payloads in a node's update with references.
+
+    Args:
+        update: Dict a node is about to return
+        store: Store to use instead of the configured one
+
+    Returns:
+        The update with ARTIFACT_FIELDS values swapped for references, or
+        the update itself when no store is configured
+    """
+    store = store or get_artifact_store()
+    if store is None:
+        return update
+    return {key: store.put(value) if key in ARTIFACT_FIELDS else value for key, value in update.items()}
+
+
+def load_artifact(
+    state: Mapping[str, Any], key: str, default: Any = None, store: Optional[ArtifactStore] = None
+) -> Any:
+    """``state.get(key, default)``, with references resolved to their payload
+
+    Raises:
+        LookupError: If the value is a reference and no store is configured
+    """
+    value = state.get(key, _MISSING)
+    if value is _MISSING:
+        return default
+    if not is_artifact_ref(value):
+        return value
+    store = store or get_artifact_store()
+    if store is None:
+        raise LookupError(f"{key} is stored as an artifact but no artifact store is configured")
+    return store.get(value)
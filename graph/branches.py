@@ -0,0 +1,160 @@
+"""Concurrent, per-repository branch management.
+
+Before merging, every verified job branch is rebased onto its
+repository's default branch. Jobs are grouped by ``repo_root`` and
+repositories are processed concurrently. Within a repository, a mutex
+serializes the git operations, because rebases in sibling worktrees
+share one object store and ref namespace. A repository with a remote is
+fetched once up front rather than once per job. Each job produces a
+BranchStatus, reported through ``on_status`` as soon as it is known.
+"""
+
+import asyncio
+import os
+from typing import Any, Callable, Dict, Iterable, List, Literal, Mapping, Optional, Sequence, TypedDict
+
+from .repos import run_git
+from .state import RepoInfo
+
+
+class BranchStatus(TypedDict):
+    """Result of updating one job branch"""
+
+    job: str
+    """Job name"""
+
+    repo: str
+    """Repository path"""
+
+    branch: str
+    """Job branch"""
+
+    base: str
+    """Ref the branch was rebased onto"""
+
+    status: Literal["rebased", "up_to_date", "conflict", "error", "skipped"]
+    """Outcome of the update"""
+
+    detail: str
+    """Error output or reason for skipping"""
+
+    duration: float
+    """Seconds spent on this job, excluding time waiting for the repo lock"""
+
+
+def group_jobs_by_repo(jobs: Iterable[Mapping[str, Any]]) -> Dict[str, List[Mapping[str, Any]]]:
+    """Group jobs by ``repo_root``, keeping job order within each repo"""
+    groups: Dict[str, List[Mapping[str, Any]]] = {}
+    for job in jobs:
+        groups.setdefault(job.get("repo_root") or "", []).append(job)
+    return groups
+
+
+class BranchManager:
+    """Rebase job branches onto their repositories' default branches"""
+
+    def __init__(self, worktree_key: str = "worktree"):
+        """
+        Args:
+            worktree_key: Job field holding the worktree path
+        """
+        self.worktree_key = worktree_key
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.fetches: Dict[str, int] = {}
+
+    def lock_for(self, repo_path: str) -> asyncio.Lock:
+        """The mutex guarding git operations in one repository"""
+        lock = self._locks.get(repo_path)
+        if lock is None:
+            lock = self._locks[repo_path] = asyncio.Lock()
+        return lock
+
+    async def update_repo(
+        self,
+        repo: Optional[RepoInfo],
+        jobs: Sequence[Mapping[str, Any]],
+        on_status: Optional[Callable[[BranchStatus], None]] = None,
+    ) -> List[BranchStatus]:
+        """Fetch a repository once and rebase each of its job branches"""
+        loop = asyncio.get_running_loop()
+        results: List[BranchStatus] = []
+
+        def report(job, base, status, detail="", started=None):
+            result = BranchStatus(
+                job=job["name"],
+                repo=repo["path"] if repo else "",
+                branch=job.get("branch", ""),
+                base=base,
+                status=status,
+                detail=detail.strip(),
+                duration=loop.time() - started if started is not None else 0.0,
+            )
+            results.append(result)
+            if on_status is not None:
+                on_status(result)
+
+        if repo is None:
+            for job in jobs:
+                report(job, "", "skipped", "Repository not detected")
+            return results
+
+        default_branch = repo.get("default_branch") or "main"
+        base = f"origin/{default_branch}" if repo["has_remote"] else default_branch
+
+        async with self.lock_for(repo["path"]):
+            if repo["has_remote"]:
+                self.fetches[repo["path"]] = self.fetches.get(repo["path"], 0) + 1
+                code, _, err = await run_git(repo["path"], "fetch", "--quiet", "origin")
+                if code != 0:
+                    for job in jobs:
+                        report(job, base, "error", f"git fetch failed: {err}")
+                    return results
+
+            for job in jobs:
+                started = loop.time()
+                worktree = job.get(self.worktree_key)
+                if not worktree or not os.path.isdir(worktree):
+                    report(job, base, "skipped", f"Worktree not found: {worktree}", started)
+                    continue
+
+                code, _, _ = await run_git(worktree, "merge-base", "--is-ancestor", base, "HEAD")
+                if code == 0:
+                    report(job, base, "up_to_date", "", started)
+                    continue
+
+                code, out, err = await run_git(worktree, "rebase", base)
+                if code == 0:
+                    report(job, base, "rebased", "", started)
+                    continue
+
+                # Leave the worktree clean for manual conflict resolution
+                await run_git(worktree, "rebase", "--abort")
+                status = "conflict" if "CONFLICT" in out + err else "error"
+                report(job, base, status, err or out, started)
+
+        return results
+
+    async def update_all(
+        self,
+        repos: Iterable[RepoInfo],
+        jobs: Iterable[Mapping[str, Any]],
+        on_status: Optional[Callable[[BranchStatus], None]] = None,
+    ) -> List[BranchStatus]:
+        """Update every job branch, one concurrent task per repository.
+
+        Args:
+            repos: Repositories detected for the sprint
+            jobs: Jobs to update; each names its repository in ``repo_root``
+            on_status: Called with each job's result as it completes
+
+        Returns:
+            All results, grouped by repository in the order repos first
+            appear among the jobs
+        """
+        repos_by_path = {repo["path"]: repo for repo in repos}
+        groups = group_jobs_by_repo(jobs)
+        batches = await asyncio.gather(*(
+            self.update_repo(repos_by_path.get(path), repo_jobs, on_status)
+            for path, repo_jobs in groups.items()
+        ))
+        return [result for batch in batches for result in batch]
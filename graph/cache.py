@@ -0,0 +1,135 @@
+"""Process-wide cache of compiled workflow graphs.
+
+Building a StateGraph and compiling it validates every node and edge and
+wires up the Pregel channels, which is far more work than invoking the
+result for a short sprint. Compiled apps are safe to invoke concurrently
+(runs are separated by ``thread_id``), so each graph variant is compiled
+once per checkpointer configuration and reused until explicitly
+invalidated.
+
+In-memory checkpointing is the exception to sharing: a MemorySaver never
+evicts threads, so one shared across every caller would grow for the
+life of the process and let unrelated callers read each other's
+threads. The graph is cached without a checkpointer and every call gets
+a copy with its own MemorySaver, which is cheap next to compiling.
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import StateGraph
+
+from .checkpoint import SqliteCheckpointSaver
+from .serde import make_serializer
+
+
+CheckpointerConfig = Optional[Hashable]
+"""Checkpointer configuration: None, "memory" or ("sqlite", path)."""
+
+_compiled: Dict[Tuple[str, CheckpointerConfig], Any] = {}
+_lock = threading.Lock()
+
+
+def make_checkpointer(config: CheckpointerConfig) -> Any:
+    """Create the checkpointer described by a configuration key.
+
+    Args:
+        config: None for no checkpointing, "memory" for MemorySaver, or
+            ("sqlite", path) for a durable SqliteCheckpointSaver
+
+    Returns:
+        Checkpointer instance, or None
+
+    Raises:
+        ValueError: If the configuration is not recognised
+    """
+    if config is None:
+        return None
+    if config == "memory":
+        return MemorySaver(serde=make_serializer())
+    if isinstance(config, tuple) and len(config) == 2 and config[0] == "sqlite":
+        return SqliteCheckpointSaver(config[1], serde=make_serializer())
+    raise ValueError(f"Unknown checkpointer configuration: {config!r}")
+
+
+def checkpointer_config(checkpointer: bool = True, checkpoint_db: Optional[str] = None) -> CheckpointerConfig:
+    """Translate compile-function arguments into a cache key.
+
+    Args:
+        checkpointer: If False, compile without checkpointing
+        checkpoint_db: SQLite database path for durable checkpoints;
+            MemorySaver is used when omitted
+
+    Returns:
+        Checkpointer configuration for get_compiled_graph
+    """
+    if not checkpointer:
+        return None
+    if checkpoint_db:
+        return ("sqlite", str(Path(checkpoint_db).resolve()))
+    return "memory"
+
+
+def get_compiled_graph(
+    variant: str,
+    builder: Callable[[], StateGraph],
+    checkpointer: CheckpointerConfig = "memory",
+) -> Any:
+    """Return the compiled app for a graph variant, compiling it on first use.
+
+    Callers asking for the same variant and a durable checkpointer share
+    one compiled app and therefore one checkpointer instance. With the
+    "memory" configuration each call returns a copy of the cached app with
+    a fresh MemorySaver, so checkpoints live as long as the returned app
+    and are never visible to other callers.
+
+    Args:
+        variant: Name of the graph variant (e.g. "workflow", "complete")
+        builder: Function returning the uncompiled StateGraph for the variant
+        checkpointer: Checkpointer configuration (see make_checkpointer)
+
+    Returns:
+        Compiled workflow app ready for invocation
+    """
+    key = (variant, checkpointer)
+    app = _compiled.get(key)
+    if app is None:
+        with _lock:
+            app = _compiled.get(key)
+            if app is None:
+                shared = None if checkpointer == "memory" else make_checkpointer(checkpointer)
+                app = builder().compile(checkpointer=shared)
+                _compiled[key] = app
+
+    if checkpointer == "memory":
+        return app.copy(update={"checkpointer": make_checkpointer("memory")})
+    return app
+
+
+def invalidate_compiled_graphs(variant: Optional[str] = None) -> int:
+    """Drop cached apps so the next request recompiles them.
+
+    Durable checkpointers owned by the dropped apps are flushed and closed.
+
+    Args:
+        variant: Only drop entries for this variant; None drops everything
+
+    Returns:
+        Number of cache entries removed
+    """
+    with _lock:
+        keys = [key for key in _compiled if variant is None or key[0] == variant]
+        apps = [_compiled.pop(key) for key in keys]
+
+    for app in apps:
+        close = getattr(app.checkpointer, "close", None)
+        if close is not None:
+            close()
+    return len(keys)
+
+
+def cached_graph_keys() -> List[Tuple[str, CheckpointerConfig]]:
+    """List the (variant, checkpointer) keys currently cached."""
+    return list(_compiled)
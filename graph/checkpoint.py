@@ -0,0 +1,637 @@
+"""Durable SQLite checkpointer for the sprint workflow.
+
+MemorySaver loses every in-progress sprint when the process exits and
+grows without bound. SqliteCheckpointSaver keeps checkpoints in a local
+SQLite database so a sprint can be resumed by ``thread_id`` after a
+restart.
+
+The database runs in WAL mode and uses group commit: one write
+transaction stays open across supersteps and is committed every
+``commit_every`` checkpoints or ``commit_interval`` seconds, whichever
+comes first, so many supersteps share a single fsync. A timer commits a
+batch ``commit_interval`` seconds after it opened even when no further
+checkpoint arrives. A crash loses at most the uncommitted batch; the
+graph then resumes from the last committed checkpoint and re-runs those
+supersteps.
+
+The async methods run queries and commits in a worker thread, so the
+event loop driving the graph is never blocked on SQLite.
+
+Mapping channels named in ``keyed_channels`` (by default ``jobs`` and the
+per-job ``job_timings`` and ``verification_results``) are
+stored per key. Each entry is written to the ``entries`` table only when
+its encoded value changes. The channel's blob becomes a manifest, which
+is either a full snapshot of the entry versions or a delta against the
+previous manifest (keys set, keys removed), with a full snapshot every
+``snapshot_every`` versions. A superstep that patches ten of 5000 jobs
+then stores ten entries and a delta, not 5000 jobs.
+"""
+
+import asyncio
+import atexit
+import random
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+    writes_sort_key,
+)
+
+from .serde import LangGraphSerializer
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    type TEXT NOT NULL,
+    checkpoint BLOB NOT NULL,
+    metadata_type TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    channel TEXT NOT NULL,
+    version TEXT NOT NULL,
+    type TEXT NOT NULL,
+    value BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT NOT NULL,
+    value BLOB,
+    task_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+CREATE TABLE IF NOT EXISTS entries (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    channel TEXT NOT NULL,
+    key TEXT NOT NULL,
+    version TEXT NOT NULL,
+    type TEXT NOT NULL,
+    value BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, channel, key, version)
+);
+"""
+
+KEYED = "keyed:"
+"""Type prefix of a keyed channel's manifest blob"""
+
+KEYED_CHANNELS = ("jobs", "job_timings", "verification_results")
+"""SprintWorkflowState channels holding one entry per job"""
+
+_ENTRY_BATCH = 400
+
+
+class _KeyedChannel:
+    """What was last stored for one keyed channel of one thread"""
+
+    __slots__ = ("version", "entries", "depth")
+
+    def __init__(self, version: str, entries: Dict[str, Tuple[Any, str]], depth: int):
+        self.version = version
+        self.entries = entries
+        """key -> (stored value, decoded into a private copy; version it was stored at)"""
+        self.depth = depth
+        """Deltas since the last full manifest"""
+
+
+class SqliteCheckpointSaver(BaseCheckpointSaver[str]):
+    """Checkpoint saver backed by a WAL-mode SQLite database.
+
+    Channel values are stored once per channel version, so channels a
+    superstep did not touch are shared between checkpoints rather than
+    copied into each one. Keyed channels go further and store only the
+    entries that changed; their entries are decoded, and migrated, one
+    at a time under the channel name ``<channel>[]``.
+
+    Args:
+        path: Database file (created if missing), or ":memory:"
+        commit_every: Commit after this many checkpoints
+        commit_interval: Commit a batch at most this many seconds after it opened
+        synchronous: SQLite synchronous level used for each commit
+        serde: Optional serializer (defaults to the LangGraph serializer,
+            as LangGraphSerializer so JobTables can be stored)
+        keyed_channels: Channels holding string-keyed mappings to store
+            per key; other values in them are stored whole
+        snapshot_every: Longest chain of manifest deltas before a full
+            manifest is written
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        commit_every: int = 16,
+        commit_interval: float = 1.0,
+        synchronous: str = "FULL",
+        serde: Any = None,
+        keyed_channels: Sequence[str] = KEYED_CHANNELS,
+        snapshot_every: int = 32,
+    ) -> None:
+        super().__init__(serde=serde or LangGraphSerializer())
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.path = path
+        self.commit_every = commit_every
+        self.commit_interval = commit_interval
+        self.commits = 0
+        self.keyed_channels = frozenset(keyed_channels)
+        self.snapshot_every = snapshot_every
+        self._keyed: Dict[Tuple[str, str, str], _KeyedChannel] = {}
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._conn.executescript(SCHEMA)
+
+        self._pending = 0
+        self._in_transaction = False
+        self._last_commit = time.monotonic()
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+        atexit.register(self.close)
+
+    # ------------------------------------------------------------------------
+    # Transactions
+    # ------------------------------------------------------------------------
+
+    def _begin(self) -> None:
+        if not self._in_transaction:
+            self._conn.execute("BEGIN")
+            self._in_transaction = True
+            # Commit the batch after commit_interval even if no further
+            # checkpoint arrives to notice that it is due
+            self._timer = threading.Timer(self.commit_interval, self._flush_due)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_due(self) -> None:
+        with self._lock:
+            if not self._closed:
+                self.flush()
+
+    def _maybe_commit(self, checkpoints: int = 1) -> None:
+        self._pending += checkpoints
+        due = time.monotonic() - self._last_commit >= self.commit_interval
+        if self._pending >= self.commit_every or due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit the open batch of writes, if any."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._in_transaction:
+                self._conn.execute("COMMIT")
+                self._in_transaction = False
+                self.commits += 1
+            self._pending = 0
+            self._last_commit = time.monotonic()
+
+    def close(self) -> None:
+        """Commit outstanding writes and close the database."""
+        with self._lock:
+            if self._closed:
+                return
+            self.flush()
+            self._conn.close()
+            self._closed = True
+        atexit.unregister(self.close)
+
+    # ------------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------------
+
+    def _loads(self, channel: str, data: Tuple[str, bytes]) -> Any:
+        """Decode a channel value, letting a versioned serializer migrate it by channel"""
+        loads_channel = getattr(self.serde, "loads_channel", None)
+        if loads_channel is not None:
+            return loads_channel(channel, data)
+        return self.serde.loads_typed(data)
+
+    def _blob(self, thread_id: str, checkpoint_ns: str, channel: str, version: str) -> Optional[Tuple[str, bytes]]:
+        return self._conn.execute(
+            "SELECT type, value FROM blobs WHERE thread_id = ? AND checkpoint_ns = ? "
+            "AND channel = ? AND version = ?",
+            (thread_id, checkpoint_ns, channel, version),
+        ).fetchone()
+
+    def _load_blobs(self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions) -> Dict[str, Any]:
+        values: Dict[str, Any] = {}
+        for channel, version in versions.items():
+            row = self._blob(thread_id, checkpoint_ns, channel, str(version))
+            if row is None or row[0] == "empty":
+                continue
+            if row[0].startswith(KEYED):
+                values[channel] = self._load_keyed(thread_id, checkpoint_ns, channel, str(version), row)
+            else:
+                values[channel] = self._loads(channel, (row[0], row[1]))
+        return values
+
+    def _load_keyed(
+        self, thread_id: str, checkpoint_ns: str, channel: str, version: str, row: Tuple[str, bytes]
+    ) -> Dict[str, Any]:
+        """Rebuild a keyed channel from its manifest chain and entries"""
+        chain = []
+        while True:
+            manifest = self.serde.loads_typed((row[0][len(KEYED):], row[1]))
+            chain.append((version, manifest))
+            if manifest["base"] is None:
+                break
+            version = manifest["base"]
+            row = self._blob(thread_id, checkpoint_ns, channel, version)
+
+        keys: Dict[str, str] = dict(chain[-1][1]["keys"])
+        for version, delta in reversed(chain[:-1]):
+            for key in delta["removed"]:
+                keys.pop(key, None)
+            for key in delta["set"]:
+                keys[key] = version
+
+        # Most entries share a few versions (the first checkpoint holds every
+        # job), so look rows up by version and keep the ones still current
+        stored: Dict[str, Tuple[str, bytes]] = {}
+        versions = list(set(keys.values()))
+        for start in range(0, len(versions), _ENTRY_BATCH):
+            batch = versions[start:start + _ENTRY_BATCH]
+            rows = self._conn.execute(
+                "SELECT key, version, type, value FROM entries WHERE thread_id = ? AND checkpoint_ns = ? "
+                f"AND channel = ? AND version IN ({', '.join('?' * len(batch))})",
+                (thread_id, checkpoint_ns, channel, *batch),
+            ).fetchall()
+            stored.update((key, (type_, value)) for key, entry_version, type_, value in rows
+                          if keys.get(key) == entry_version)
+
+        entry_channel = f"{channel}[]"
+        value = {key: self._loads(entry_channel, stored[key]) for key in keys}
+
+        # Later puts on this thread can be deltas against this manifest;
+        # decoding again gives the cache its own copy of each entry
+        cache_key = (thread_id, checkpoint_ns, channel)
+        if cache_key not in self._keyed:
+            self._keyed[cache_key] = _KeyedChannel(
+                chain[0][0],
+                {key: (self._loads(entry_channel, stored[key]), keys[key]) for key in keys},
+                len(chain) - 1,
+            )
+        return value
+
+    def _load_writes(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> List[Tuple[str, str, Any]]:
+        rows = self._conn.execute(
+            "SELECT task_id, idx, channel, type, value, task_path FROM writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+        rows.sort(key=lambda row: writes_sort_key(row[5], row[0], row[1]))
+        return [
+            (task_id, channel, self._loads(channel, (type_, value)))
+            for task_id, _, channel, type_, value, _ in rows
+        ]
+
+    def _make_tuple(self, thread_id: str, checkpoint_ns: str, row: Tuple, metadata: Optional[Dict] = None) -> CheckpointTuple:
+        checkpoint_id, parent_checkpoint_id, type_, checkpoint_b, metadata_type, metadata_b = row
+        checkpoint: Checkpoint = self.serde.loads_typed((type_, checkpoint_b))
+        if metadata is None:
+            metadata = self.serde.loads_typed((metadata_type, metadata_b))
+
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint={
+                **checkpoint,
+                "channel_values": self._load_blobs(
+                    thread_id, checkpoint_ns, checkpoint["channel_versions"]
+                ),
+            },
+            metadata=metadata,
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_checkpoint_id,
+                    }
+                }
+                if parent_checkpoint_id
+                else None
+            ),
+            pending_writes=self._load_writes(thread_id, checkpoint_ns, checkpoint_id),
+        )
+
+    def get_tuple(self, config: Dict) -> Optional[CheckpointTuple]:
+        """Fetch the requested checkpoint, or the latest one for the thread."""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        columns = "checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata_type, metadata"
+
+        with self._lock:
+            if checkpoint_id := get_checkpoint_id(config):
+                row = self._conn.execute(
+                    f"SELECT {columns} FROM checkpoints WHERE thread_id = ? "
+                    "AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    (thread_id, checkpoint_ns, checkpoint_id),
+                ).fetchone()
+            else:
+                row = self._conn.execute(
+                    f"SELECT {columns} FROM checkpoints WHERE thread_id = ? "
+                    "AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1",
+                    (thread_id, checkpoint_ns),
+                ).fetchone()
+
+            if row is None:
+                return None
+            return self._make_tuple(thread_id, checkpoint_ns, row)
+
+    def list(
+        self,
+        config: Optional[Dict],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[Dict] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """List checkpoints newest first, optionally filtered by metadata."""
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, "
+            "type, checkpoint, metadata_type, metadata FROM checkpoints"
+        )
+        clauses, params = [], []
+        if config:
+            clauses.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            if (checkpoint_ns := config["configurable"].get("checkpoint_ns")) is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                clauses.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before and (before_id := get_checkpoint_id(before)):
+            clauses.append("checkpoint_id < ?")
+            params.append(before_id)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY checkpoint_id DESC"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+            results = []
+            for thread_id, checkpoint_ns, *row in rows:
+                metadata = self.serde.loads_typed((row[4], row[5]))
+                if filter and not all(metadata.get(k) == v for k, v in filter.items()):
+                    continue
+                if limit is not None and len(results) >= limit:
+                    break
+                results.append(self._make_tuple(thread_id, checkpoint_ns, tuple(row), metadata))
+
+        yield from results
+
+    # ------------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------------
+
+    def put(
+        self,
+        config: Dict,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> Dict:
+        """Store a checkpoint and the channel values that changed in it."""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        stored = checkpoint.copy()
+        values = stored.pop("channel_values")
+
+        type_, checkpoint_b = self.serde.dumps_typed(stored)
+        metadata_type, metadata_b = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+
+        with self._lock:
+            blob_rows, entry_rows = [], []
+            keyed: Dict[Tuple[str, str, str], Optional[_KeyedChannel]] = {}
+            for channel, version in new_versions.items():
+                value = values.get(channel)
+                cache_key = (thread_id, checkpoint_ns, channel)
+                if channel in self.keyed_channels and isinstance(value, dict) and all(
+                    isinstance(key, str) for key in value
+                ):
+                    (type_b, value_b), keyed[cache_key] = self._put_keyed(
+                        cache_key, str(version), value, entry_rows
+                    )
+                else:
+                    keyed[cache_key] = None
+                    type_b, value_b = self.serde.dumps_typed(value) if channel in values else ("empty", None)
+                blob_rows.append((thread_id, checkpoint_ns, channel, str(version), type_b, value_b))
+
+            self._begin()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)", entry_rows
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?, ?)", blob_rows
+            )
+            # Only now are the entries the manifests refer to stored
+            for cache_key, state in keyed.items():
+                if state is None:
+                    self._keyed.pop(cache_key, None)
+                else:
+                    self._keyed[cache_key] = state
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    type_,
+                    checkpoint_b,
+                    metadata_type,
+                    metadata_b,
+                ),
+            )
+            self._maybe_commit()
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def _put_keyed(
+        self,
+        cache_key: Tuple[str, str, str],
+        version: str,
+        value: Dict[str, Any],
+        entry_rows: List[Tuple],
+    ) -> Tuple[Tuple[str, bytes], _KeyedChannel]:
+        """Queue the changed entries of a keyed channel.
+
+        Returns:
+            The channel's manifest blob, and what to remember about the
+            channel once the rows are stored
+        """
+        previous = self._keyed.get(cache_key)
+        old = previous.entries if previous is not None else {}
+
+        # Entries are compared with a decoded copy of what was stored rather
+        # than by identity, so a job mutated in place is still seen as changed
+        entries: Dict[str, Tuple[Any, str]] = {}
+        changed = []
+        for key, item in value.items():
+            cached = old.get(key)
+            if cached is not None and cached[0] == item:
+                entries[key] = cached
+                continue
+            type_, data = self.serde.dumps_typed(item)
+            entries[key] = (self.serde.loads_typed((type_, data)), version)
+            changed.append(key)
+            entry_rows.append((*cache_key, key, version, type_, data))
+
+        # A delta keeps surviving keys in place and appends new ones, as
+        # dict updates do; anything else (e.g. a replaced job list) is a snapshot
+        removed = [key for key in old if key not in entries]
+        delta = (
+            previous is not None
+            and previous.depth + 1 < self.snapshot_every
+            and [key for key in old if key in entries] + [key for key in entries if key not in old]
+            == list(entries)
+        )
+        if delta:
+            manifest = {"base": previous.version, "set": changed, "removed": removed}
+            depth = previous.depth + 1
+        else:
+            manifest = {"base": None, "keys": {key: v for key, (_, v) in entries.items()}}
+            depth = 0
+
+        type_, data = self.serde.dumps_typed(manifest)
+        return (KEYED + type_, data), _KeyedChannel(version, entries, depth)
+
+    def put_writes(
+        self,
+        config: Dict,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Store intermediate writes for a checkpoint."""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+
+        rows = [
+            (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                task_id,
+                WRITES_IDX_MAP.get(channel, idx),
+                channel,
+                *self.serde.dumps_typed(value),
+                task_path,
+            )
+            for idx, (channel, value) in enumerate(writes)
+        ]
+        # Special channels (errors, interrupts) overwrite; regular writes keep the first value
+        special = [row for row in rows if row[4] < 0]
+        regular = [row for row in rows if row[4] >= 0]
+
+        with self._lock:
+            self._begin()
+            self._conn.executemany("INSERT OR REPLACE INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", special)
+            self._conn.executemany("INSERT OR IGNORE INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", regular)
+            self._maybe_commit(checkpoints=0)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes for a thread."""
+        with self._lock:
+            self._begin()
+            for table in ("checkpoints", "blobs", "writes", "entries"):
+                self._conn.execute(f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+            for key in [key for key in self._keyed if key[0] == thread_id]:
+                del self._keyed[key]
+            self.flush()
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        """Monotonic string versions, matching MemorySaver."""
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    # ------------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------------
+
+    async def aget_tuple(self, config: Dict) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[Dict],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[Dict] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: Dict,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> Dict:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: Dict,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        return await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        return await asyncio.to_thread(self.delete_thread, thread_id)
@@ -0,0 +1,268 @@
+"""Column-oriented job storage for very large sprints.
+
+A JobSpec dict costs several hundred bytes before any of its values are
+counted, and a sprint keeps one per job. JobTable stores the same jobs
+as columns: status codes in a bytearray, story points and retry counts
+in ``array('i')``, names and other strings interned in plain lists, file
+and dependency lists as tuples of interned strings, and free-text lists
+(todos, failed tests) as one newline-joined string each. A per-row
+bitmask records which fields a job actually had, and any value a column
+cannot hold (an unknown status, a non-int story point, a key JobSpec
+does not define) is kept as-is in a sparse per-row overflow dict, so
+``to_jobs`` returns dicts equal to the ones the table was built from.
+
+Status aggregation works on whole columns at once: counts come from
+``bytearray.count`` and per-status story points from ``translate`` plus
+``itertools.compress``, with no per-job Python loop.
+
+The executor keeps its jobs in a JobTable for the whole run: its
+``jobs`` state key is a JobTableChannel, which turns lists of JobSpec
+dicts into a table when they are written or loaded from a checkpoint
+and hands the checkpointer JobSpec dicts again, so checkpoints keep the
+plain form. JobRegistry indexes the table by status.
+"""
+
+import sys
+from array import array
+from itertools import compress
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from langgraph.channels.last_value import LastValue
+
+from .state import JOB_STATUSES, STATUS_LISTS, JobSpec, JobStatus, job_key, job_list
+
+STATUS_CODES: Dict[str, int] = {status: code for code, status in enumerate(JOB_STATUSES)}
+"""Byte stored in the status column for each status"""
+
+OTHER_STATUS = 0xFF
+"""Status code for jobs whose status is held in the overflow dict"""
+
+INT_FIELDS = ("story_points", "retry_count")
+STR_FIELDS = ("id", "task_file", "worktree", "repo_root", "branch", "error_message", "test_command")
+LIST_FIELDS = ("todos", "files_to_modify", "dependencies", "failed_tests")
+JOINED_FIELDS = frozenset(("todos", "failed_tests"))
+"""List fields of mostly unique text, stored as one newline-joined string"""
+INTERNED_FIELDS = frozenset(("id", "repo_root", "files_to_modify", "dependencies"))
+"""Fields whose strings repeat across jobs and are worth interning"""
+
+FIELDS = ("name", "status") + INT_FIELDS + STR_FIELDS + LIST_FIELDS
+_BITS = {field: 1 << i for i, field in enumerate(FIELDS)}
+_INT_MIN, _INT_MAX = -(2 ** 31), 2 ** 31 - 1
+
+
+def _status_mask(code: int) -> bytes:
+    """translate() table mapping ``code`` to 1 and every other byte to 0"""
+    table = bytearray(256)
+    table[code] = 1
+    return bytes(table)
+
+
+def _fits_list(field: str, value: Any) -> bool:
+    """Whether a list value can be stored in its column and read back unchanged"""
+    if type(value) is not list or not all(type(item) is str for item in value):
+        return False
+    return field not in JOINED_FIELDS or (value != [""] and not any("\n" in item for item in value))
+
+
+_MASKS = {status: _status_mask(code) for status, code in STATUS_CODES.items()}
+
+
+class JobTable:
+    """Jobs stored column-wise, indexed by name.
+
+    Rows keep insertion order. Names must be unique.
+    """
+
+    def __init__(self, jobs: Iterable[Mapping[str, Any]] = ()):
+        self.names: List[str] = []
+        self.status = bytearray()
+        self.ints: Dict[str, array] = {field: array("i") for field in INT_FIELDS}
+        self.strs: Dict[str, List[Optional[str]]] = {field: [] for field in STR_FIELDS}
+        self.lists: Dict[str, list] = {field: [] for field in LIST_FIELDS}
+        self.present = array("H")
+        self.overflow: Dict[int, Dict[str, Any]] = {}
+        self._rows: Dict[str, int] = {}
+        for job in jobs:
+            self.append(job)
+
+    @classmethod
+    def from_state(cls, state: Mapping[str, Any]) -> "JobTable":
+        """A table over ``state['jobs']``, whether a mapping or a list"""
+        return cls(job_list(state))
+
+    def append(self, job: Mapping[str, Any]) -> None:
+        """Add a job as a new row
+
+        Raises:
+            ValueError: If a job with the same name is already stored
+        """
+        name = job["name"]
+        if name in self._rows:
+            raise ValueError(f"Duplicate job name: {name}")
+        row = len(self.names)
+        name = sys.intern(name)
+        self._rows[name] = row
+        self.names.append(name)
+        self.status.append(STATUS_CODES["pending"])
+        for column in self.ints.values():
+            column.append(0)
+        for column in self.strs.values():
+            column.append(None)
+        for column in self.lists.values():
+            column.append(())
+        self.present.append(_BITS["name"])
+        for field, value in job.items():
+            if field != "name":
+                self._set(row, field, value)
+
+    def _set(self, row: int, field: str, value: Any) -> None:
+        """Store one field, in its column if the value fits, else in overflow"""
+        bit = _BITS.get(field, 0)
+        if field == "status" and type(value) is str and value in STATUS_CODES:
+            self.status[row] = STATUS_CODES[value]
+        elif field in self.ints and type(value) is int and _INT_MIN <= value <= _INT_MAX:
+            self.ints[field][row] = value
+        elif field in self.strs and (value is None or type(value) is str):
+            self.strs[field][row] = sys.intern(value) if value and field in INTERNED_FIELDS else value
+        elif field in self.lists and _fits_list(field, value):
+            if field in JOINED_FIELDS:
+                self.lists[field][row] = "\n".join(value)
+            else:
+                self.lists[field][row] = tuple(map(sys.intern, value) if field in INTERNED_FIELDS else value)
+        else:
+            bit = 0
+            self.overflow.setdefault(row, {})[field] = value
+            if field == "status":
+                self.status[row] = OTHER_STATUS
+            elif field in self.ints:
+                self.ints[field][row] = 0
+        if bit:
+            self.present[row] |= bit
+            extra = self.overflow.get(row)
+            if extra and field in extra:
+                del extra[field]
+                if not extra:
+                    del self.overflow[row]
+        elif field in _BITS:
+            self.present[row] &= ~_BITS[field]
+
+    def _job(self, row: int) -> JobSpec:
+        """Rebuild the JobSpec dict for a row"""
+        present = self.present[row]
+        job: Dict[str, Any] = {"name": self.names[row]}
+        if present & _BITS["status"]:
+            job["status"] = JOB_STATUSES[self.status[row]]
+        for field, column in self.ints.items():
+            if present & _BITS[field]:
+                job[field] = column[row]
+        for field, column in self.strs.items():
+            if present & _BITS[field]:
+                job[field] = column[row]
+        for field, column in self.lists.items():
+            if present & _BITS[field]:
+                value = column[row]
+                job[field] = value.split("\n") if type(value) is str and value else list(value)
+        job.update(self.overflow.get(row, ()))
+        return job
+
+    def get(self, name: str) -> JobSpec:
+        """A fresh JobSpec dict for the named job
+
+        Raises:
+            KeyError: If no such job is stored
+        """
+        return self._job(self._rows[name])
+
+    def update(self, name: str, patch: Mapping[str, Any]) -> None:
+        """Merge a patch into a job, as the ``jobs`` reducer does"""
+        row = self._rows[name]
+        for field, value in patch.items():
+            if field == "name" and value != name:
+                raise ValueError(f"Cannot rename job {name} to {value}")
+            if field != "name":
+                self._set(row, field, value)
+
+    def set_status(self, name: str, status: JobStatus) -> None:
+        """Move a job to a new status"""
+        self._set(self._rows[name], "status", status)
+
+    def status_of(self, name: str) -> str:
+        """A job's status, ``pending`` if it has none"""
+        row = self._rows[name]
+        if self.status[row] == OTHER_STATUS:
+            return self.overflow[row]["status"]
+        return JOB_STATUSES[self.status[row]]
+
+    def mask(self, status: JobStatus) -> bytes:
+        """One byte per row, 1 where the job is in ``status``"""
+        return self.status.translate(_MASKS[status])
+
+    def names_in(self, status: JobStatus) -> List[str]:
+        """Job names in a status, in row order"""
+        return list(compress(self.names, self.mask(status)))
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status"""
+        return {status: self.status.count(code) for status, code in STATUS_CODES.items()}
+
+    def points(self, status: Optional[JobStatus] = None) -> int:
+        """Story points in a status, or across all jobs"""
+        points = self.ints["story_points"]
+        if status is None:
+            return sum(points)
+        return sum(compress(points, self.mask(status)))
+
+    def points_by_status(self) -> Dict[str, int]:
+        """Story points per status"""
+        return {status: self.points(status) for status in JOB_STATUSES}
+
+    def sync_state(self, state) -> None:
+        """Write the per-status name lists into ``state``"""
+        for status, key in STATUS_LISTS.items():
+            state[key] = self.names_in(status)
+
+    def to_jobs(self) -> List[JobSpec]:
+        """The jobs as JobSpec dicts, in row order"""
+        return [self._job(row) for row in range(len(self.names))]
+
+    def to_mapping(self) -> Dict[str, JobSpec]:
+        """The jobs keyed as ``state['jobs']`` stores them"""
+        return {job_key(job): job for job in self.to_jobs()}
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._rows
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[JobSpec]:
+        return (self._job(row) for row in range(len(self.names)))
+
+
+class JobTableChannel(LastValue):
+    """LastValue channel whose value is kept as a JobTable.
+
+    Lists (or id-keyed mappings) of JobSpec dicts written to the channel
+    or restored from a checkpoint become a JobTable; checkpoints store
+    the table as a list of JobSpec dicts.
+    """
+
+    def update(self, values) -> bool:
+        return super().update([_as_table(value) for value in values])
+
+    def from_checkpoint(self, checkpoint):
+        channel = super().from_checkpoint(checkpoint)
+        if isinstance(channel.value, (list, dict)):
+            channel.value = _as_table(channel.value)
+        return channel
+
+    def checkpoint(self):
+        value = super().checkpoint()
+        return value.to_jobs() if isinstance(value, JobTable) else value
+
+
+def _as_table(jobs: Any) -> Any:
+    """A JobTable for a list or mapping of jobs; anything else unchanged"""
+    if isinstance(jobs, (list, dict)):
+        return JobTable.from_state({"jobs": jobs})
+    return jobs
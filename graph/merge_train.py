@@ -0,0 +1,276 @@
+"""Merge train for verified job branches.
+
+Instead of merging and testing branches one at a time, the train stacks
+every branch that merges cleanly onto a candidate commit built from the
+repository's default branch, points ``INTEGRATION_REF`` at it and runs the
+test suite once. If the candidate passes, the whole batch lands together.
+If it fails, the batch is split in half and each half is retried on top
+of whatever already landed, recursing until the offending branch is
+isolated. A batch of N clean branches therefore costs one test run, and a
+single bad branch costs about ``2 * log2(N)`` runs instead of N.
+
+Candidates are built in a temporary detached worktree, so the user's
+worktrees are never touched. Repositories with a remote are fetched once
+and the result is pushed to ``origin/<default>``; local-only repositories
+fast-forward their default branch directly.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+from typing import Any, Callable, Dict, Iterable, List, Literal, Mapping, Optional, Sequence, Tuple, TypedDict
+
+from .branches import group_jobs_by_repo
+from .repos import run_git
+from .state import RepoInfo
+from .verification import DEFAULT_TIMEOUT, outcome_summary, run_test_command
+
+
+INTEGRATION_REF = "refs/merge-train/candidate"
+
+
+class MergeResult(TypedDict):
+    """Result of landing one job branch"""
+
+    job: str
+    """Job name"""
+
+    repo: str
+    """Repository path"""
+
+    branch: str
+    """Job branch"""
+
+    target: str
+    """Branch the job was merged into"""
+
+    status: Literal["merged", "rejected", "conflict", "error", "skipped"]
+    """merged: landed on the target; rejected: isolated as the cause of a
+    test failure; conflict: does not merge onto the train; error: git
+    failed; skipped: repository or branch unknown"""
+
+    batch: int
+    """Index of the batch the job was submitted in"""
+
+    detail: str
+    """Test summary, git output or reason for skipping"""
+
+
+class MergeTrain:
+    """Land verified branches in tested batches, bisecting on failure"""
+
+    def __init__(
+        self,
+        test_command: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_batch: Optional[int] = None,
+        integration_ref: str = INTEGRATION_REF,
+    ):
+        """
+        Args:
+            test_command: Command run on each candidate; defaults to the
+                first ``test_command`` among a repository's jobs, and with
+                neither, candidates are merged untested
+            timeout: Seconds before a candidate's test run is killed
+            max_batch: Most branches stacked into one candidate; None
+                stacks every branch of a repository at once
+            integration_ref: Ref pointing at the candidate under test
+        """
+        self.test_command = test_command
+        self.timeout = timeout
+        self.max_batch = max_batch
+        self.integration_ref = integration_ref
+        self.test_runs: Dict[str, int] = {}
+
+    def _batches(self, jobs: Sequence[Mapping[str, Any]]) -> List[Sequence[Mapping[str, Any]]]:
+        size = self.max_batch or len(jobs) or 1
+        return [jobs[i:i + size] for i in range(0, len(jobs), size)]
+
+    async def _stack(
+        self, train: str, base: str, jobs: Sequence[Mapping[str, Any]]
+    ) -> Tuple[str, List[Mapping[str, Any]], List[Tuple[Mapping[str, Any], str, str]]]:
+        """Build a candidate from ``base`` plus every branch that merges.
+
+        Returns:
+            (candidate commit, jobs stacked, (job, status, detail) for jobs
+            that did not merge)
+        """
+        await run_git(train, "reset", "--quiet", "--hard", base)
+        stacked, failed = [], []
+        for job in jobs:
+            code, out, err = await run_git(
+                train, "merge", "--no-ff", "--no-edit",
+                "-m", f"Merge {job['branch']} ({job['name']})", job["branch"]
+            )
+            if code == 0:
+                stacked.append(job)
+                continue
+            await run_git(train, "merge", "--abort")
+            await run_git(train, "reset", "--quiet", "--hard")
+            status = "conflict" if "CONFLICT" in out + err else "error"
+            failed.append((job, status, (err or out).strip()))
+
+        _, head, _ = await run_git(train, "rev-parse", "HEAD")
+        head = head.strip()
+        await run_git(train, "update-ref", self.integration_ref, head)
+        return head, stacked, failed
+
+    async def _test(self, repo_path: str, train: str, command: Optional[str]) -> Tuple[bool, str]:
+        if not command:
+            return True, ""
+        self.test_runs[repo_path] = self.test_runs.get(repo_path, 0) + 1
+        outcome = await run_test_command(
+            f"merge-train:{os.path.basename(repo_path)}", command, cwd=train, timeout=self.timeout
+        )
+        return outcome["passed"], "" if outcome["passed"] else outcome_summary(outcome)
+
+    async def _land(
+        self,
+        repo_path: str,
+        train: str,
+        base: str,
+        jobs: Sequence[Mapping[str, Any]],
+        command: Optional[str],
+        report: Callable[..., None],
+        landed: List[Mapping[str, Any]],
+    ) -> str:
+        """Land as much of ``jobs`` as passes on top of ``base``.
+
+        Returns:
+            The new tip: ``base`` plus every branch that landed
+        """
+        candidate, stacked, failed = await self._stack(train, base, jobs)
+        for job, status, detail in failed:
+            report(job, status, detail)
+        if not stacked:
+            return base
+
+        passed, detail = await self._test(repo_path, train, command)
+        if passed:
+            landed.extend(stacked)
+            return candidate
+        if len(stacked) == 1:
+            report(stacked[0], "rejected", detail)
+            return base
+
+        # Bisect: land the first half, then the second half on top of it
+        mid = len(stacked) // 2
+        tip = await self._land(repo_path, train, base, stacked[:mid], command, report, landed)
+        return await self._land(repo_path, train, tip, stacked[mid:], command, report, landed)
+
+    async def _publish(self, repo: RepoInfo, default_branch: str, old: str, new: str) -> Tuple[bool, str]:
+        """Move the default branch from ``old`` to ``new``"""
+        path = repo["path"]
+        if repo["has_remote"]:
+            code, out, err = await run_git(path, "push", "--quiet", "origin", f"{new}:refs/heads/{default_branch}")
+        else:
+            _, head, _ = await run_git(path, "symbolic-ref", "--quiet", "--short", "HEAD")
+            if head.strip() == default_branch:
+                # Keep the checked-out working tree in step with the branch
+                code, out, err = await run_git(path, "merge", "--quiet", "--ff-only", new)
+            else:
+                code, out, err = await run_git(path, "update-ref", f"refs/heads/{default_branch}", new, old)
+        return code == 0, (err or out).strip()
+
+    async def land_repo(
+        self,
+        repo: Optional[RepoInfo],
+        jobs: Sequence[Mapping[str, Any]],
+        on_result: Optional[Callable[[MergeResult], None]] = None,
+    ) -> List[MergeResult]:
+        """Run the train for one repository's jobs, in the given order"""
+        results: List[MergeResult] = []
+        batch_of = {job["name"]: i for i, batch in enumerate(self._batches(jobs)) for job in batch}
+        default_branch = (repo or {}).get("default_branch") or "main"
+
+        def report(job, status, detail=""):
+            result = MergeResult(
+                job=job["name"],
+                repo=repo["path"] if repo else "",
+                branch=job.get("branch", ""),
+                target=default_branch if repo else "",
+                status=status,
+                batch=batch_of[job["name"]],
+                detail=detail,
+            )
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+        if repo is None:
+            for job in jobs:
+                report(job, "skipped", "Repository not detected")
+            return results
+
+        path = repo["path"]
+        if repo["has_remote"]:
+            code, _, err = await run_git(path, "fetch", "--quiet", "origin")
+            if code != 0:
+                for job in jobs:
+                    report(job, "error", f"git fetch failed: {err.strip()}")
+                return results
+
+        base_ref = f"origin/{default_branch}" if repo["has_remote"] else default_branch
+        code, base, err = await run_git(path, "rev-parse", "--verify", "--quiet", f"{base_ref}^{{commit}}")
+        if code != 0:
+            for job in jobs:
+                report(job, "error", f"Unknown base {base_ref}: {err.strip()}")
+            return results
+        base = base.strip()
+
+        candidates = []
+        for job in jobs:
+            if job.get("branch"):
+                candidates.append(job)
+            else:
+                report(job, "skipped", "Job has no branch")
+
+        command = self.test_command or next((j["test_command"] for j in jobs if j.get("test_command")), None)
+        scratch = tempfile.mkdtemp(prefix="merge-train-")
+        train = os.path.join(scratch, "train")
+        code, _, err = await run_git(path, "worktree", "add", "--quiet", "--detach", train, base)
+        if code != 0:
+            shutil.rmtree(scratch, ignore_errors=True)
+            for job in candidates:
+                report(job, "error", f"Could not create merge worktree: {err.strip()}")
+            return results
+
+        try:
+            tip, landed = base, []
+            for batch in self._batches(candidates):
+                tip = await self._land(path, train, tip, batch, command, report, landed)
+        finally:
+            await run_git(path, "worktree", "remove", "--force", train)
+            shutil.rmtree(scratch, ignore_errors=True)
+
+        if landed:
+            published, detail = await self._publish(repo, default_branch, base, tip)
+            for job in landed:
+                report(job, "merged" if published else "error", "" if published else detail)
+        return results
+
+    async def run(
+        self,
+        repos: Iterable[RepoInfo],
+        jobs: Iterable[Mapping[str, Any]],
+        on_result: Optional[Callable[[MergeResult], None]] = None,
+    ) -> List[MergeResult]:
+        """Run one train per repository, repositories concurrently.
+
+        Args:
+            repos: Repositories detected for the sprint
+            jobs: Verified jobs to land, in merge order; each names its
+                repository in ``repo_root``
+            on_result: Called with each job's result as it is decided
+
+        Returns:
+            All results, grouped by repository
+        """
+        repos_by_path = {repo["path"]: repo for repo in repos}
+        groups = group_jobs_by_repo(jobs)
+        batches = await asyncio.gather(*(
+            self.land_repo(repos_by_path.get(path), repo_jobs, on_result)
+            for path, repo_jobs in groups.items()
+        ))
+        return [result for batch in batches for result in batch]
@@ -3,6 +3,7 @@
 from typing import Dict, Any
 import json
 
+from ..artifacts import load_artifact
 from ..state import SprintWorkflowState
 
 
@@ -23,8 +24,8 @@ def user_approval_node(state: SprintWorkflowState) -> Dict[str, Any]:
     Returns:
         Dict with user_approved flag
     """
-    synthesized_plan = state.get("synthesized_plan", {})
-    gap_analysis = state.get("gap_analysis", {})
+    synthesized_plan = load_artifact(state, "synthesized_plan", {})
+    gap_analysis = load_artifact(state, "gap_analysis", {})
     
     # Generate summary for user (would be displayed in UI)
     overview = synthesized_plan.get("overview", {})
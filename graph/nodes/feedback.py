@@ -2,6 +2,7 @@
 
 from typing import Dict, Any
 
+from ..artifacts import externalize, load_artifact
 from ..state import SprintWorkflowState
 
 
@@ -24,8 +25,8 @@ def update_planning_from_feedback_node(state: SprintWorkflowState) -> Dict[str,
     Returns:
         Dict with updated synthesized_plan incorporating feedback
     """
-    gap_analysis = state.get("gap_analysis", {})
-    synthesized_plan = state.get("synthesized_plan", {})
+    gap_analysis = load_artifact(state, "gap_analysis", {})
+    synthesized_plan = load_artifact(state, "synthesized_plan", {})
     
     if not gap_analysis or not synthesized_plan:
         return {"status_messages": ["No feedback to apply - skipping"]}
@@ -113,13 +114,13 @@ def update_planning_from_feedback_node(state: SprintWorkflowState) -> Dict[str,
         "points_added": added_points,
     }
     
-    return {
+    return externalize({
         "synthesized_plan": updated_plan,
         "status_messages": [
             f"Feedback applied: {len(new_stories)} stories added, "
             f"{len(new_risks)} risks added, {added_points} story points added"
         ]
-    }
+    })
 
 
 def _estimate_story_points(effort_str: str) -> int:
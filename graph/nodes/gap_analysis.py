@@ -4,6 +4,7 @@ import json
 from typing import Dict, Any
 from anthropic import AsyncAnthropic
 
+from ..artifacts import externalize, load_artifact
 from ..state import SprintWorkflowState
 
 
@@ -25,7 +26,7 @@ async def gap_analysis_node(state: SprintWorkflowState) -> Dict[str, Any]:
     Returns:
         Dict with gap_analysis containing issues found and recommendations
     """
-    synthesized_plan = state.get("synthesized_plan", {})
+    synthesized_plan = load_artifact(state, "synthesized_plan", {})
     sprint_theme = state.get("sprint_theme", "")
     project_name = state.get("project_name", "Unknown Project")
     
@@ -156,8 +157,7 @@ Be thorough but pragmatic. Focus on issues that would impact sprint success."""
     }
     
     # Increment retry count for tracking
-    retry_counts = state.get("retry_counts", {})
-    current_count = retry_counts.get("gap_analysis", 0)
+    current_count = state.get("retry_counts", {}).get("gap_analysis", 0)
     
     # Determine if issues require feedback loop
     critical_blockers = gap_analysis.get("overall_assessment", {}).get("critical_blockers", 0)
@@ -167,8 +167,8 @@ Be thorough but pragmatic. Focus on issues that would impact sprint success."""
     if critical_blockers > 0:
         status_msg += f" ({critical_blockers} critical blockers)"
     
-    return {
+    return externalize({
         "gap_analysis": gap_analysis,
-        "retry_counts": {**retry_counts, "gap_analysis": current_count + 1},
+        "retry_counts": {"gap_analysis": current_count + 1},
         "status_messages": [status_msg]
-    }
+    })
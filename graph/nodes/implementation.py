@@ -2,64 +2,157 @@
 
 from typing import Dict, Any
 import asyncio
-from ..state import SprintWorkflowState
+from ..branches import BranchManager
+from ..merge_train import MergeTrain
+from ..overlap import OverlapIndex
+from ..pool import job_timing, run_job_pool
+from ..scheduler import JobGraph
+from ..verification import verify_in_parallel
+from ..state import SprintWorkflowState, job_key, job_list, status_lists
+
+
+async def implement_job(job: Dict[str, Any]) -> None:
+    """Implement a single job (stub)."""
+    await asyncio.sleep(0)
+
 
 async def parallel_implementation_node(state: SprintWorkflowState) -> Dict[str, Any]:
-    """Execute jobs in parallel (stub)."""
-    jobs = state.get("jobs", [])
+    """Execute ready jobs with at most pool_size running at once.
+
+    A job is ready once every job in its dependencies is verified; ready
+    jobs start in longest-critical-path-first order. Jobs behind a failed
+    dependency or a dependency cycle are marked failed. Only the jobs that
+    changed are returned, as patches, with the status lists derived from
+    the patched jobs.
+    """
+    jobs = job_list(state)
     pool_size = state.get("pool_size", 3)
-    
-    # Stub - mark first N jobs as implementing
+
+    dag = JobGraph(jobs)
+    statuses = {job["name"]: job.get("status", "pending") for job in jobs}
+    by_name = {job["name"]: job for job in jobs}
+    blocked = dag.blocked(statuses)
+    patches = {
+        job_key(by_name[name]): {"status": "failed", "error_message": reason}
+        for name, reason in blocked.items()
+    }
+    pending = [by_name[name] for name in dag.ready(statuses)]
+
     jobs_implementing = []
-    for idx, job in enumerate(jobs[:pool_size]):
-        job["status"] = "implementing"
+
+    def on_start(job):
+        patches[job_key(job)] = {"status": "implementing"}
         jobs_implementing.append(job["id"])
-    
+
+    results = await run_job_pool(pending, implement_job, pool_size, on_start=on_start, key="id")
+    job_timings = {result["job"]: job_timing(result) for result in results}
+
     return {
-        "jobs": jobs,
-        "jobs_implementing": jobs_implementing,
-        "status_messages": [f"Started implementation of {len(jobs_implementing)} jobs in parallel"]
+        "jobs": patches,
+        **status_lists(state, patches),
+        "job_timings": job_timings,
+        "status_messages": [
+            f"Implemented {len(jobs_implementing)} jobs with {pool_size} parallel workers"
+            + (f", {len(blocked)} blocked by dependencies" if blocked else "")
+        ]
     }
 
 async def verification_loop_node(state: SprintWorkflowState) -> Dict[str, Any]:
-    """Verify completed jobs (stub)."""
-    jobs = state.get("jobs", [])
-    
-    # Stub - mark implementing jobs as verified
+    """Verify implemented jobs.
+
+    Jobs with a ``test_command`` run it in their worktree, up to
+    pool_size at a time; jobs without one are marked verified (stub).
+    Only the jobs it checked are returned, as patches, with the status
+    lists derived from the patched jobs.
+    """
+    jobs = job_list(state)
+    implemented = [job for job in jobs if job.get("status") == "implementing"]
+    with_tests = [job for job in implemented if job.get("test_command")]
+
+    outcomes = await verify_in_parallel(
+        with_tests,
+        lambda job: job["test_command"],
+        max_concurrency=state.get("pool_size", 3),
+        cwd_key="worktree_path",
+    )
+    verification_results = {}
+
+    patches = {}
     jobs_verified = []
-    for job in jobs:
-        if job.get("status") == "implementing":
-            job["status"] = "verified"
+    jobs_failed = []
+    for job in implemented:
+        patch = patches[job_key(job)] = {}
+        outcome = outcomes.get(job["name"])
+        if outcome is not None:
+            verification_results[job["name"]] = {
+                key: outcome[key] for key in ("status", "returncode", "duration", "command", "narrowed")
+            }
+            patch["failed_tests"] = outcome["failed_tests"]
+        if outcome is None or outcome["passed"]:
+            patch["status"] = "verified"
             jobs_verified.append(job["id"])
+        else:
+            patch["status"] = "failed"
+            patch["error_message"] = f"Verification {outcome['status']}"
+            jobs_failed.append(job["id"])
     
     return {
-        "jobs": jobs,
-        "jobs_verified": jobs_verified,
-        "status_messages": [f"Verified {len(jobs_verified)} jobs"]
+        "jobs": patches,
+        **status_lists(state, patches),
+        "verification_results": verification_results,
+        "status_messages": [f"Verified {len(jobs_verified)} jobs, {len(jobs_failed)} failed"]
     }
 
-def manage_branches_node(state: SprintWorkflowState) -> Dict[str, Any]:
-    """Manage branch cleanup (stub)."""
-    jobs = state.get("jobs", [])
+async def manage_branches_node(state: SprintWorkflowState) -> Dict[str, Any]:
+    """Rebase verified branches onto their default branch, one task per repo.
+
+    Branches that share no files with the others go first, then each
+    group of overlapping branches together.
+    """
+    jobs = job_list(state)
     verified = [j for j in jobs if j.get("status") == "verified"]
+    verified = OverlapIndex.from_state(state).order_jobs(verified)
+
+    branch_status = await BranchManager(worktree_key="worktree_path").update_all(
+        state.get("repos", []), verified
+    )
+    problems = [s for s in branch_status if s["status"] in ("conflict", "error")]
     
     return {
-        "status_messages": [f"Managing {len(verified)} verified branches"]
+        "branch_status": branch_status,
+        "status_messages": [
+            f"Managed {len(verified)} verified branches ({len(problems)} need attention)"
+        ]
     }
 
-def push_and_merge_node(state: SprintWorkflowState) -> Dict[str, Any]:
-    """Push and merge branches (stub)."""
-    jobs = state.get("jobs", [])
-    verified = [j for j in jobs if j.get("status") == "verified"]
+async def push_and_merge_node(state: SprintWorkflowState) -> Dict[str, Any]:
+    """Land verified branches through a merge train, one test run per batch.
+
+    Branches whose rebase conflicted or errored in manage_branches are
+    left out; failing batches are bisected down to the offending branch.
+    """
+    jobs = job_list(state)
+    unmergeable = {
+        s["job"] for s in state.get("branch_status", []) if s["status"] in ("conflict", "error")
+    }
+    verified = [j for j in jobs if j.get("status") == "verified" and j["name"] not in unmergeable]
+    verified = OverlapIndex.from_state(state).order_jobs(verified)
+
+    train = MergeTrain()
+    merge_status = await train.run(state.get("repos", []), verified)
+    merged = sum(1 for m in merge_status if m["status"] == "merged")
     
     return {
         "phase": "complete",
-        "status_messages": [f"Merged {len(verified)} branches"]
+        "merge_status": merge_status,
+        "status_messages": [
+            f"Merged {merged}/{len(verified)} branches with {sum(train.test_runs.values())} test runs"
+        ]
     }
 
 def generate_final_report_node(state: SprintWorkflowState) -> Dict[str, Any]:
     """Generate final sprint report."""
-    jobs = state.get("jobs", [])
+    jobs = job_list(state)
     sprint_theme = state.get("sprint_theme", "")
     
     verified = sum(1 for j in jobs if j.get("status") == "verified")
@@ -70,7 +163,8 @@ def generate_final_report_node(state: SprintWorkflowState) -> Dict[str, Any]:
         "total_jobs": len(jobs),
         "verified": verified,
         "failed": failed,
-        "success_rate": verified / len(jobs) if jobs else 0
+        "success_rate": verified / len(jobs) if jobs else 0,
+        "file_overlap": OverlapIndex.from_state(state).stats()
     }
     
     return {
@@ -3,11 +3,13 @@
 import json
 from typing import Dict, Any
 from anthropic import AsyncAnthropic
-from ..state import SprintWorkflowState
+from ..artifacts import externalize, load_artifact
+from ..overlap import OverlapIndex
+from ..state import SprintWorkflowState, job_list
 
 async def generate_sprint_prd_node(state: SprintWorkflowState) -> Dict[str, Any]:
     """Generate Sprint PRD from approved synthesized plan."""
-    synthesized_plan = state.get("synthesized_plan", {})
+    synthesized_plan = load_artifact(state, "synthesized_plan", {})
     sprint_theme = state.get("sprint_theme", "")
     
     # For speed, create PRD from synthesized plan without AI call
@@ -20,15 +22,19 @@ async def generate_sprint_prd_node(state: SprintWorkflowState) -> Dict[str, Any]
         "execution_plan": synthesized_plan.get("execution_plan", {}),
     }
     
-    return {
+    return externalize({
         "sprint_prd": prd,
         "phase": "job_creation",
         "status_messages": [f"Sprint PRD generated with {len(prd.get('user_stories', []))} stories"]
-    }
+    })
 
 async def create_jobs_node(state: SprintWorkflowState) -> Dict[str, Any]:
-    """Create job specifications from PRD."""
-    sprint_prd = state.get("sprint_prd", {})
+    """Create job specifications from PRD.
+
+    The file-overlap index is built here, once, and stored in state for
+    the branch and merge nodes to order by.
+    """
+    sprint_prd = load_artifact(state, "sprint_prd", {})
     user_stories = sprint_prd.get("user_stories", [])
     
     # Simple job creation - one job per story for now
@@ -42,17 +48,19 @@ async def create_jobs_node(state: SprintWorkflowState) -> Dict[str, Any]:
             "status": "pending",
             "branch": f"feat/{story.get('id', f'story-{idx+1}').lower()}",
             "worktree_path": None,
+            "files_to_modify": list(story.get("files_to_modify", [])),
         }
         jobs.append(job)
     
     return {
         "jobs": jobs,
+        "file_overlap": OverlapIndex(jobs).to_dict(),
         "status_messages": [f"Created {len(jobs)} jobs"]
     }
 
 def validate_jobs_node(state: SprintWorkflowState) -> Dict[str, Any]:
     """Validate job specifications (stub)."""
-    jobs = state.get("jobs", [])
+    jobs = job_list(state)
     
     # Simple validation - check for duplicates
     job_names = [j.get("name") for j in jobs]
@@ -70,7 +78,7 @@ def validate_jobs_node(state: SprintWorkflowState) -> Dict[str, Any]:
 
 def setup_git_worktrees_node(state: SprintWorkflowState) -> Dict[str, Any]:
     """Setup git worktrees for jobs (stub)."""
-    jobs = state.get("jobs", [])
+    jobs = job_list(state)
     
     # Stub - just mark worktrees as "created"
     worktrees = []
@@ -2,6 +2,7 @@
 
 from typing import Dict, Any
 
+from ..artifacts import externalize, get_artifact_store, load_artifact
 from ..state import SprintWorkflowState
 
 
@@ -21,9 +22,9 @@ def synthesize_planning_node(state: SprintWorkflowState) -> Dict[str, Any]:
     Returns:
         Dict with synthesized_plan containing unified planning document
     """
-    pm_output = state.get("pm_output", {})
-    ux_output = state.get("ux_output", {})
-    engineering_output = state.get("engineering_output", {})
+    pm_output = load_artifact(state, "pm_output", {})
+    ux_output = load_artifact(state, "ux_output", {})
+    engineering_output = load_artifact(state, "engineering_output", {})
     
     # Extract key elements from each planning output
     user_stories = pm_output.get("user_stories", [])
@@ -86,7 +87,7 @@ def synthesize_planning_node(state: SprintWorkflowState) -> Dict[str, Any]:
         }
     }
     
-    return {
+    update = {
         "synthesized_plan": synthesized_plan,
         "phase": "gap_analysis",  # Move to next phase
         "status_messages": [
@@ -94,6 +95,11 @@ def synthesize_planning_node(state: SprintWorkflowState) -> Dict[str, Any]:
             f"{len(ui_components)} components, {len(risks)} risks identified"
         ]
     }
+    if get_artifact_store() is not None:
+        # Swap the planning inputs for references too, so checkpoints
+        # after this one stop carrying them inline
+        update.update(pm_output=pm_output, ux_output=ux_output, engineering_output=engineering_output)
+    return externalize(update)
 
 
 def _integrate_stories_with_ux(user_stories, ui_components, user_flows):
@@ -0,0 +1,145 @@
+"""File-overlap index for ordering merges and rebases.
+
+Jobs list the files they expect to change in ``files_to_modify``. Two
+jobs touching the same file are likely to conflict, and whichever lands
+second has to be rebased over the first. OverlapIndex is built once when
+jobs are created. It holds an inverted index from file to jobs and a
+sparse pairwise matrix counting the files each pair of jobs shares.
+
+merge_order puts jobs that overlap with nothing first, since they land
+without churn. Each group of transitively overlapping jobs follows as a
+contiguous run, so one group's rebases happen together instead of
+interleaving with unrelated merges.
+"""
+
+import os
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from .state import job_list
+
+
+def _file_key(job: Mapping[str, Any], path: str) -> str:
+    """Normalize a path and scope it to the job's repository"""
+    path = os.path.normpath(path)
+    repo = job.get("repo_root")
+    return os.path.join(repo, path) if repo else path
+
+
+class OverlapIndex:
+    """Which jobs touch which files, and how much each pair overlaps"""
+
+    def __init__(self, jobs: Iterable[Mapping[str, Any]] = (), key: str = "name"):
+        """
+        Args:
+            jobs: Job dicts with ``files_to_modify`` and, optionally,
+                ``repo_root`` (the same path in two repositories is not an
+                overlap)
+            key: Job field used to identify jobs
+        """
+        self.files: Dict[str, List[str]] = {}
+        self.matrix: Dict[str, Dict[str, int]] = {}
+        self.jobs: List[str] = []
+        for job in jobs:
+            self.add(job, key)
+
+    def add(self, job: Mapping[str, Any], key: str = "name") -> None:
+        """Index one job's files"""
+        name = job[key]
+        self.jobs.append(name)
+        self.matrix.setdefault(name, {})
+        for path in dict.fromkeys(_file_key(job, p) for p in job.get("files_to_modify") or ()):
+            owners = self.files.setdefault(path, [])
+            for other in owners:
+                if other != name:
+                    self.matrix[name][other] = self.matrix[name].get(other, 0) + 1
+                    self.matrix[other][name] = self.matrix[other].get(name, 0) + 1
+            if name not in owners:
+                owners.append(name)
+
+    def overlaps(self, name: str) -> Dict[str, int]:
+        """Jobs sharing files with ``name``, with the number shared"""
+        return self.matrix.get(name, {})
+
+    def groups(self, names: Optional[Sequence[str]] = None) -> List[List[str]]:
+        """Partition jobs into groups connected by shared files.
+
+        Only overlaps between the given jobs count. Each group keeps the
+        given order, and groups are ordered by their first member.
+        """
+        names = list(self.jobs if names is None else names)
+        position = {name: i for i, name in enumerate(names)}
+        seen = set()
+        groups = []
+        for name in names:
+            if name in seen:
+                continue
+            seen.add(name)
+            group, stack = [], [name]
+            while stack:
+                current = stack.pop()
+                group.append(current)
+                for other in self.matrix.get(current, {}):
+                    if other in position and other not in seen:
+                        seen.add(other)
+                        stack.append(other)
+            groups.append(sorted(group, key=position.__getitem__))
+        return groups
+
+    def merge_order(self, names: Sequence[str]) -> List[str]:
+        """Order jobs for merging: non-overlapping jobs, then each group"""
+        groups = self.groups(names)
+        isolated = [group[0] for group in groups if len(group) == 1]
+        overlapping = [name for group in groups if len(group) > 1 for name in group]
+        return isolated + overlapping
+
+    def order_jobs(self, jobs: Sequence[Mapping[str, Any]], key: str = "name") -> List[Mapping[str, Any]]:
+        """merge_order applied to job dicts"""
+        by_name = {job[key]: job for job in jobs}
+        return [by_name[name] for name in self.merge_order(list(by_name))]
+
+    def stats(self, top: int = 5) -> Dict[str, Any]:
+        """Summary of conflict risk across the sprint.
+
+        Returns:
+            Counts of jobs, files, files shared by several jobs, overlapping
+            job pairs and jobs, the number and largest size of overlap
+            groups, and the ``top`` most contended files with their jobs
+        """
+        shared = {path: owners for path, owners in self.files.items() if len(owners) > 1}
+        groups = [group for group in self.groups() if len(group) > 1]
+        hot = sorted(shared.items(), key=lambda item: (-len(item[1]), item[0]))[:top]
+        return {
+            "jobs": len(self.jobs),
+            "files": len(self.files),
+            "shared_files": len(shared),
+            "overlapping_pairs": sum(len(others) for others in self.matrix.values()) // 2,
+            "overlapping_jobs": sum(1 for others in self.matrix.values() if others),
+            "groups": len(groups),
+            "largest_group": max((len(group) for group in groups), default=0),
+            "hot_files": {path: list(owners) for path, owners in hot},
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-data form, suitable for checkpointed state"""
+        return {
+            "jobs": list(self.jobs),
+            "files": {path: list(owners) for path, owners in self.files.items()},
+            "matrix": {name: dict(others) for name, others in self.matrix.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "OverlapIndex":
+        """Rebuild an index saved with to_dict"""
+        index = cls()
+        index.jobs = list(data.get("jobs", ()))
+        index.files = {path: list(owners) for path, owners in data.get("files", {}).items()}
+        index.matrix = {name: dict(others) for name, others in data.get("matrix", {}).items()}
+        return index
+
+    @classmethod
+    def from_state(cls, state: Mapping[str, Any], key: str = "name") -> "OverlapIndex":
+        """The index saved in ``state['file_overlap']``, or one built from the jobs"""
+        data = state.get("file_overlap")
+        if data:
+            return cls.from_dict(data)
+        return cls(job_list(state), key)
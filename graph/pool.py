@@ -0,0 +1,101 @@
+"""Bounded worker pool for running sprint jobs.
+
+Jobs are fed through a queue to ``pool_size`` workers. As soon as one
+job finishes, its worker takes the next, so a slow job never holds up a
+whole batch. Each result records how long the job waited in the queue
+and how long it ran.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, TypedDict
+
+
+class PoolResult(TypedDict):
+    """Outcome of one job run by the pool"""
+
+    job: str
+    """Job name"""
+
+    result: Any
+    """Worker return value, or None if the worker raised"""
+
+    error: Optional[str]
+    """Exception message if the worker raised"""
+
+    queue_wait: float
+    """Seconds between the pool starting and the job starting"""
+
+    run_time: float
+    """Seconds the worker spent on the job"""
+
+
+def job_timing(result: PoolResult) -> Dict[str, float]:
+    """Timing fields of a pool result, as stored in sprint state"""
+    return {
+        "queue_wait": round(result["queue_wait"], 6),
+        "run_time": round(result["run_time"], 6),
+    }
+
+
+async def run_job_pool(
+    jobs: Iterable[Dict[str, Any]],
+    worker: Callable[[Dict[str, Any]], Awaitable[Any]],
+    pool_size: int,
+    on_start: Optional[Callable[[Dict[str, Any]], None]] = None,
+    key: str = "name",
+) -> List[PoolResult]:
+    """Run ``worker`` on every job with at most ``pool_size`` in flight.
+
+    Jobs start in the given order. A worker exception is recorded on that
+    job's result and does not stop the pool; cancelling the caller
+    cancels every running worker.
+
+    Args:
+        jobs: Job dicts to run
+        worker: Coroutine function called once per job
+        pool_size: Maximum number of concurrent workers
+        on_start: Called with each job just before its worker starts
+        key: Job field used as the result's ``job`` name
+
+    Returns:
+        One PoolResult per job, in completion order
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for job in jobs:
+        queue.put_nowait(job)
+    if queue.empty():
+        return []
+
+    loop = asyncio.get_running_loop()
+    enqueued_at = loop.time()
+    results: List[PoolResult] = []
+
+    async def drain():
+        while True:
+            try:
+                job = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            started = loop.time()
+            if on_start is not None:
+                on_start(job)
+            try:
+                value, error = await worker(job), None
+            except Exception as e:
+                value, error = None, str(e)
+            results.append(PoolResult(
+                job=job[key],
+                result=value,
+                error=error,
+                queue_wait=started - enqueued_at,
+                run_time=loop.time() - started,
+            ))
+
+    workers = [asyncio.create_task(drain()) for _ in range(min(max(pool_size, 1), queue.qsize()))]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+    return results
@@ -0,0 +1,129 @@
+"""Indexed view over a sprint's jobs.
+
+Sprint state stores jobs plus one list of names per status. Looking a
+job up by name or moving it between status lists with ``in``/``remove``
+is O(jobs), which makes a verification pass over a large sprint
+quadratic. JobRegistry keeps the jobs in a JobTable, indexed by name,
+and keeps the names in each status in the order they entered it, so
+lookups and status transitions are O(1) and counts and story points
+come from the table's columns. It is built from state at the start of a
+node and written back with ``sync_state`` at the end.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from .jobtable import JobTable
+from .state import JOB_STATUSES, STATUS_LISTS, JobSpec, JobStatus, job_list
+
+
+class JobRegistry:
+    """Jobs stored in a JobTable and indexed by status.
+
+    ``get`` and ``jobs`` return fresh JobSpec dicts; change a job with
+    ``update`` or ``transition``. Within a status, names keep the order
+    in which jobs entered it.
+    """
+
+    def __init__(self, jobs: Optional[Iterable[JobSpec]] = None, table: Optional[JobTable] = None):
+        self.table = JobTable() if table is None else table
+        self._by_status: Dict[str, Dict[str, None]] = {status: {} for status in JOB_STATUSES}
+        for status in JOB_STATUSES:
+            self._by_status[status] = dict.fromkeys(self.table.names_in(status))
+        for job in jobs or ():
+            self.add(job)
+
+    @classmethod
+    def from_state(cls, state) -> "JobRegistry":
+        """Build a registry over ``state['jobs']``.
+
+        A JobTable in state is used as-is; a list or mapping of jobs is
+        replaced in state by a JobTable, so changes made through the
+        registry are changes to the state. Jobs that appear in a status
+        list keep that list's order, so e.g. ``jobs_verified`` stays in
+        completion order across nodes.
+        """
+        table = state.get("jobs")
+        if not isinstance(table, JobTable):
+            table = JobTable(job_list(state))
+            state["jobs"] = table
+        registry = cls(table=table)
+        for status, key in STATUS_LISTS.items():
+            names = registry._by_status[status]
+            ordered = dict.fromkeys(name for name in state.get(key) or () if name in names)
+            ordered.update(names)
+            registry._by_status[status] = ordered
+        return registry
+
+    def add(self, job: JobSpec) -> None:
+        """Register a job under its current status
+
+        Raises:
+            ValueError: If a job with the same name is already registered
+        """
+        self.table.append(job)
+        self._by_status[self.table.status_of(job["name"])][job["name"]] = None
+
+    def get(self, name: str) -> JobSpec:
+        """Return a copy of the job with this name
+
+        Raises:
+            KeyError: If no such job is registered
+        """
+        return self.table.get(name)
+
+    def transition(self, name: str, status: JobStatus) -> JobSpec:
+        """Move a job to a new status and return a copy of it"""
+        old = self.table.status_of(name)
+        if old != status:
+            del self._by_status[old][name]
+            self._by_status[status][name] = None
+            self.table.set_status(name, status)
+        return self.table.get(name)
+
+    def update(self, name: str, patch: Mapping[str, Any]) -> JobSpec:
+        """Merge a patch into a job, moving it if the status changes, and return a copy of it"""
+        if "status" in patch:
+            self.transition(name, patch["status"])
+        self.table.update(name, {field: value for field, value in patch.items() if field != "status"})
+        return self.table.get(name)
+
+    def names(self, status: JobStatus) -> List[str]:
+        """Job names in a status, in the order they entered it"""
+        return list(self._by_status[status])
+
+    def jobs(self, status: Optional[JobStatus] = None) -> List[JobSpec]:
+        """Copies of the jobs in a status, or of all jobs in registration order"""
+        if status is None:
+            return self.table.to_jobs()
+        return [self.table.get(name) for name in self._by_status[status]]
+
+    def count(self, status: JobStatus) -> int:
+        """Number of jobs in a status"""
+        return len(self._by_status[status])
+
+    def points(self, status: Optional[JobStatus] = None) -> int:
+        """Story points in a status, or across all jobs"""
+        return self.table.points(status)
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status"""
+        return self.table.counts()
+
+    def points_by_status(self) -> Dict[str, int]:
+        """Story points per status"""
+        return self.table.points_by_status()
+
+    def sync_state(self, state) -> None:
+        """Write the table and the per-status name lists back into ``state``"""
+        state["jobs"] = self.table
+        for status, key in STATUS_LISTS.items():
+            state[key] = self.names(status)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.table
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __iter__(self) -> Iterator[JobSpec]:
+        return iter(self.table)
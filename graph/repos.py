@@ -0,0 +1,156 @@
+"""Concurrent git repository detection for sprint worktrees.
+
+Each job runs in its own worktree, and many worktrees usually belong to
+the same repository. RepoDetector asks every worktree for its git common
+dir (shared by all worktrees of a repository) using
+``asyncio.create_subprocess_exec``, with a bounded number of git
+processes in flight. It then queries each repository once for its
+remote, local branches and default branch. Results are cached on the
+detector, so one detector per run never asks git the same question
+twice. A worktree or repository git cannot be run in (git missing, the
+directory removed mid-run, a failing command) is logged and skipped, so
+one bad entry never aborts sprint initialization.
+"""
+
+import asyncio
+import logging
+import os
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .state import RepoInfo
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+async def run_git(cwd: str, *args: str) -> Tuple[int, str, str]:
+    """Run a git command without blocking the event loop.
+
+    Returns:
+        (returncode, stdout, stderr)
+    """
+    proc = await asyncio.create_subprocess_exec(
+        "git", *args,
+        cwd=cwd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    return proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
+class RepoDetector:
+    """Detect and cache repository information for worktrees"""
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._common_dirs: Dict[str, Optional[str]] = {}
+        self._repos: Dict[str, RepoInfo] = {}
+        self.git_calls = 0
+
+    async def _git(self, cwd: str, *args: str) -> Tuple[int, str]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            self.git_calls += 1
+            code, stdout, _ = await run_git(cwd, *args)
+        return code, stdout
+
+    async def _common_dir(self, worktree: str) -> Optional[str]:
+        """Return the git common dir for a worktree, or None outside git"""
+        key = os.path.abspath(worktree)
+        if key in self._common_dirs:
+            return self._common_dirs[key]
+
+        try:
+            code, out = await self._git(key, "rev-parse", "--path-format=absolute", "--git-common-dir")
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning("Error detecting repo for %s: %s", worktree, e)
+            code, out = 1, ""
+        common_dir = out.strip() if code == 0 and out.strip() else None
+        self._common_dirs[key] = common_dir
+        return common_dir
+
+    async def _describe(self, common_dir: str) -> RepoInfo:
+        """Query one repository for its remote and branches"""
+        common = Path(common_dir)
+        path = str(common.parent) if common.name == ".git" else str(common)
+
+        (_, remotes), (_, heads), (origin_code, origin_head), (_, head) = await asyncio.gather(
+            self._git(path, "remote"),
+            self._git(path, "for-each-ref", "--format=%(refname:short)", "refs/heads"),
+            self._git(path, "symbolic-ref", "--short", "refs/remotes/origin/HEAD"),
+            self._git(path, "symbolic-ref", "--short", "HEAD"),
+        )
+
+        branches = [line for line in heads.splitlines() if line]
+        if origin_code == 0 and origin_head.strip():
+            default_branch = origin_head.strip().split("/", 1)[-1]
+        elif "main" in branches:
+            default_branch = "main"
+        elif "master" in branches:
+            default_branch = "master"
+        else:
+            default_branch = head.strip() or "main"
+
+        return RepoInfo(
+            path=path,
+            has_remote="origin" in remotes.split(),
+            branches=branches,
+            default_branch=default_branch,
+        )
+
+    async def _repo_for(self, common_dir: str) -> Optional[RepoInfo]:
+        repo = self._repos.get(common_dir)
+        if repo is None:
+            try:
+                repo = await self._describe(common_dir)
+            except (OSError, subprocess.CalledProcessError) as e:
+                logger.warning("Error describing repo at %s: %s", common_dir, e)
+                return None
+            self._repos[common_dir] = repo
+        return repo
+
+    async def detect(self, worktrees: Sequence[str]) -> List[RepoInfo]:
+        """Detect the repositories the given worktrees belong to.
+
+        Missing paths, directories outside git and entries git fails on
+        are skipped.
+
+        Args:
+            worktrees: Worktree paths, in any order, possibly repeated
+
+        Returns:
+            One RepoInfo per distinct repository, in first-seen order
+        """
+        existing = list(dict.fromkeys(w for w in worktrees if os.path.isdir(w)))
+        common_dirs = await asyncio.gather(*(self._common_dir(w) for w in existing))
+
+        unique = list(dict.fromkeys(d for d in common_dirs if d is not None))
+        repos = await asyncio.gather(*(self._repo_for(d) for d in unique))
+        return [repo for repo in repos if repo is not None]
+
+    async def repo_paths(self, worktrees: Sequence[str]) -> Dict[str, str]:
+        """Map each worktree to its repository path.
+
+        Worktrees that are missing or outside git are left out. Uses the
+        same cache as detect.
+        """
+        await self.detect(worktrees)
+        paths = {}
+        for worktree in worktrees:
+            common_dir = self._common_dirs.get(os.path.abspath(worktree))
+            if common_dir in self._repos:
+                paths[worktree] = self._repos[common_dir]["path"]
+        return paths
+
+    def clear(self) -> None:
+        """Forget all cached results"""
+        self._common_dirs.clear()
+        self._repos.clear()
@@ -7,7 +7,8 @@ which path the workflow takes at conditional branches.
 from typing import Literal
 import logging
 
-from .state import SprintWorkflowState
+from .artifacts import load_artifact
+from .state import SprintWorkflowState, job_list
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -32,7 +33,7 @@ def should_apply_gap_feedback(
         - "approved": No critical issues, proceed to PRD generation
         - "max_retries": Max retries reached, proceed despite issues
     """
-    gap_analysis = state.get("gap_analysis")
+    gap_analysis = load_artifact(state, "gap_analysis")
     
     # First time through - no analysis yet
     if not gap_analysis:
@@ -124,21 +125,23 @@ def should_apply_job_feedback(
 
 def should_continue_verification(
     state: SprintWorkflowState
-) -> Literal["retry", "continue"]:
+) -> Literal["retry", "implement", "continue"]:
     """Decide whether to continue verification loop or proceed.
     
     Decision logic:
     1. If any job is "implementing" or "verifying" → retry (still in progress)
-    2. All jobs in terminal states (verified/failed/cancelled) → continue
+    2. If jobs are still "pending" (waiting on dependencies) → implement
+    3. All jobs in terminal states (verified/failed/cancelled) → continue
     
     Args:
         state: Current workflow state
         
     Returns:
         - "retry": Jobs still in progress, continue verification loop
+        - "implement": Pending jobs remain, start those now unblocked
         - "continue": All jobs complete, proceed to branch management
     """
-    jobs = state.get("jobs", [])
+    jobs = job_list(state)
     
     if not jobs:
         logger.warning("No jobs found - continuing to branch management")
@@ -146,6 +149,7 @@ def should_continue_verification(
     
     # Count jobs by status
     status_counts = {
+        "pending": 0,
         "implementing": 0,
         "verifying": 0,
         "verified": 0,
@@ -168,6 +172,12 @@ def should_continue_verification(
             f"{status_counts['verifying']} verifying) - retrying"
         )
         return "retry"
+
+    if status_counts["pending"] > 0:
+        logger.info(
+            f"Verification loop: {status_counts['pending']} job(s) pending on dependencies - implementing"
+        )
+        return "implement"
     
     logger.info(
         f"Verification complete: {completed} job(s) finished "
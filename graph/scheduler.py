@@ -0,0 +1,129 @@
+"""Dependency-aware job scheduling.
+
+Jobs may name other jobs in ``dependencies``. JobGraph turns those into
+a DAG and answers two questions for the implementation phase:
+
+* which pending jobs are ready, i.e. every dependency is verified, in
+  the order they should start; and
+* which pending jobs can never start, because a dependency failed (directly
+  or further upstream), names a job that is not in the sprint, or because
+  they sit on a dependency cycle.
+
+Ready jobs are ordered by longest remaining critical path: a job's
+priority is its own story points plus the largest priority among the jobs
+that depend on it. Starting the head of the longest chain first keeps the
+tail of the sprint short, while jobs on independent branches keep running
+when something else fails.
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterable, List, Mapping, Set
+
+
+class JobGraph:
+    """DAG of jobs built from their ``dependencies`` lists"""
+
+    def __init__(self, jobs: Iterable[Mapping[str, Any]], key: str = "name"):
+        """
+        Args:
+            jobs: Job dicts with ``dependencies`` and ``story_points``
+            key: Job field that other jobs' dependencies refer to
+        """
+        jobs = list(jobs)
+        self.order: Dict[str, int] = {job[key]: i for i, job in enumerate(jobs)}
+        self.points: Dict[str, int] = {job[key]: job.get("story_points", 0) or 0 for job in jobs}
+
+        self.dependencies: Dict[str, List[str]] = {}
+        self.dependents: Dict[str, List[str]] = {name: [] for name in self.order}
+        self.unknown: Dict[str, List[str]] = {}
+        for job in jobs:
+            name = job[key]
+            deps = list(dict.fromkeys(job.get("dependencies") or ()))
+            known = [dep for dep in deps if dep in self.order and dep != name]
+            missing = [dep for dep in deps if dep not in self.order]
+            self.dependencies[name] = known
+            if missing:
+                self.unknown[name] = missing
+            for dep in known:
+                self.dependents[dep].append(name)
+
+        self.topological: List[str] = self._topological_order()
+        self.cyclic: Set[str] = set(self.order) - set(self.topological)
+        self.priority: Dict[str, int] = self._critical_path_priorities()
+
+    def _topological_order(self) -> List[str]:
+        """Kahn's algorithm; jobs on or behind a cycle are left out"""
+        indegree = {name: len(deps) for name, deps in self.dependencies.items()}
+        queue = deque(name for name in self.order if indegree[name] == 0)
+        order = []
+        while queue:
+            name = queue.popleft()
+            order.append(name)
+            for child in self.dependents[name]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    queue.append(child)
+        return order
+
+    def _critical_path_priorities(self) -> Dict[str, int]:
+        priority = {name: self.points[name] for name in self.order}
+        for name in reversed(self.topological):
+            downstream = [priority[child] for child in self.dependents[name]]
+            if downstream:
+                priority[name] = self.points[name] + max(downstream)
+        return priority
+
+    def ready(self, statuses: Mapping[str, str]) -> List[str]:
+        """Pending jobs whose dependencies are all verified.
+
+        Args:
+            statuses: Current status of every job, by name
+
+        Returns:
+            Job names, highest critical-path priority first; ties keep
+            the original job order
+        """
+        ready = [
+            name for name in self.order
+            if statuses.get(name, "pending") == "pending"
+            and name not in self.cyclic
+            and name not in self.unknown
+            and all(statuses.get(dep) == "verified" for dep in self.dependencies[name])
+        ]
+        return sorted(ready, key=lambda name: (-self.priority[name], self.order[name]))
+
+    def blocked(self, statuses: Mapping[str, str]) -> Dict[str, str]:
+        """Pending jobs that can never start, with the reason.
+
+        A job is blocked if it is on a dependency cycle, depends on a job
+        that is not in the sprint, or if any job it depends on, directly
+        or transitively, has failed or is blocked.
+        """
+        reasons: Dict[str, str] = {}
+        for name in self.order:
+            if statuses.get(name, "pending") != "pending":
+                continue
+            if name in self.cyclic:
+                reasons[name] = "Dependency cycle"
+            elif name in self.unknown:
+                reasons[name] = f"Unknown dependency: {', '.join(self.unknown[name])}"
+
+        for name in self.topological:
+            if statuses.get(name, "pending") != "pending":
+                continue
+            for dep in self.dependencies[name]:
+                if statuses.get(dep) == "failed" or dep in reasons:
+                    reasons[name] = f"Blocked by failed dependency: {dep}"
+                    break
+        return reasons
+
+    def critical_path(self) -> List[str]:
+        """The chain of jobs with the most story points, first job first"""
+        roots = [name for name in self.topological if not self.dependencies[name]]
+        if not roots:
+            return []
+        path = [max(roots, key=lambda name: (self.priority[name], -self.order[name]))]
+        while self.dependents[path[-1]]:
+            children = self.dependents[path[-1]]
+            path.append(max(children, key=lambda name: (self.priority[name], -self.order[name])))
+        return path
@@ -0,0 +1,228 @@
+"""Versioned checkpoint serializer.
+
+LangGraph's default serializer writes every checkpoint value with no
+record of the state schema it was written under, so a checkpoint taken
+before a schema change is indistinguishable from one taken after.
+CheckpointSerializer tags every value with the schema version and codec
+it was written with. The tag goes in the type string checkpointers
+already store beside the bytes, ``sw<version>:<codec>``, so the encoded
+body is never copied to prepend a header. Codecs:
+
+- ``msgpack`` (default): ormsgpack, with the same options LangGraph
+  uses, but without its extension hooks for plain state values
+- ``json``: orjson, for tools that want to read checkpoints as JSON.
+  NaN and infinity become null, as in any strict JSON.
+
+Large values are decoded with the cyclic GC paused: decoding only
+builds new acyclic containers, and on big states collections triggered
+by those allocations cost more than the decode itself.
+
+A JobTable is written as its list of JobSpec dicts, the form the
+executor's ``jobs`` channel reads back into a table.
+
+Values a codec cannot encode (messages, Send objects, datetimes, bytes
+or non-string keys in JSON) are written by the fallback serializer,
+LangGraph's JsonPlusSerializer by default, and tagged
+``sw<version>:fallback:<its type>``, so they keep their version too.
+
+On load, values written at an older version are passed through the
+registered migrations one version at a time. Untagged values, i.e.
+checkpoints written before this serializer was used, are version 0 and
+are decoded by the fallback.
+
+Checkpointers built by ``graph.cache`` use this serializer with the
+codec named by ``SPRINT_CHECKPOINT_CODEC`` (``msgpack`` unless set;
+``langgraph`` restores LangGraph's serializer, which is also taught to
+write JobTables as dicts).
+"""
+
+import gc
+import os
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+import orjson
+import ormsgpack
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from .jobtable import JobTable
+
+
+SCHEMA_VERSION = 1
+"""Version of SprintWorkflowState written by this code; bump it and
+register a migration from the previous version when the schema changes"""
+
+CODEC_ENV = "SPRINT_CHECKPOINT_CODEC"
+
+TAG_PREFIX = "sw"
+"""Start of the type tag on values written by CheckpointSerializer"""
+
+CODECS = ("msgpack", "json")
+FALLBACK = "fallback:"
+
+GC_PAUSE_BYTES = 64 * 1024
+"""Encoded size above which the cyclic GC is paused while a value is decoded"""
+
+Migration = Callable[[Optional[str], Any], Any]
+"""Upgrade one value by one version; called with the channel name, when
+the checkpointer knows it, and the decoded value"""
+
+MIGRATIONS: Dict[int, Migration] = {}
+"""Migrations used by default, keyed by the version they upgrade from"""
+
+_MSGPACK_OPTIONS = (
+    ormsgpack.OPT_NON_STR_KEYS
+    | ormsgpack.OPT_PASSTHROUGH_DATACLASS
+    | ormsgpack.OPT_PASSTHROUGH_DATETIME
+    | ormsgpack.OPT_PASSTHROUGH_ENUM
+    | ormsgpack.OPT_PASSTHROUGH_UUID
+)
+_JSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+)
+
+
+def migration(from_version: int, registry: Optional[Dict[int, Migration]] = None):
+    """Decorator registering a migration from ``from_version`` to the next version"""
+    def register(func: Migration) -> Migration:
+        target = MIGRATIONS if registry is None else registry
+        if from_version in target:
+            raise ValueError(f"Migration from version {from_version} already registered")
+        target[from_version] = func
+        return func
+    return register
+
+
+def _plain(obj: Any) -> Any:
+    """Encoder hook: the plain form of a JobTable; other types are rejected"""
+    if isinstance(obj, JobTable):
+        return obj.to_jobs()
+    raise TypeError(f"Not a plain state value: {type(obj).__name__}")
+
+
+class CheckpointSerializer(SerializerProtocol):
+    """Checkpoint serializer with a schema version header and migrations"""
+
+    def __init__(
+        self,
+        codec: str = "msgpack",
+        *,
+        version: int = SCHEMA_VERSION,
+        migrations: Optional[Mapping[int, Migration]] = None,
+        fallback: Optional[SerializerProtocol] = None,
+    ):
+        """
+        Args:
+            codec: "msgpack" or "json"
+            version: Schema version written into new values
+            migrations: Upgrades keyed by the version they start from;
+                defaults to the module's MIGRATIONS
+            fallback: Serializer for values the codec cannot encode and
+                for headerless values
+
+        Raises:
+            ValueError: If the codec is unknown
+        """
+        if codec not in CODECS:
+            raise ValueError(f"Unknown checkpoint codec: {codec!r}")
+        self.codec = codec
+        self.version = version
+        self.migrations = MIGRATIONS if migrations is None else migrations
+        self.fallback = fallback or JsonPlusSerializer()
+        self.fallbacks = 0
+        self._tag = f"{TAG_PREFIX}{version}:"
+
+    def _encode(self, obj: Any) -> bytes:
+        if self.codec == "json":
+            return orjson.dumps(obj, default=_plain, option=_JSON_OPTIONS)
+        return ormsgpack.packb(obj, default=_plain, option=_MSGPACK_OPTIONS)
+
+    def _decode(self, codec: str, payload: bytes) -> Any:
+        # Decoding builds one fresh, acyclic container per dict and list;
+        # on large states the cyclic GC would otherwise run many times
+        # over objects it can never free
+        pause = len(payload) >= GC_PAUSE_BYTES and gc.isenabled()
+        if pause:
+            gc.disable()
+        try:
+            if codec == "json":
+                return orjson.loads(payload)
+            return ormsgpack.unpackb(payload, option=ormsgpack.OPT_NON_STR_KEYS)
+        finally:
+            if pause:
+                gc.enable()
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        try:
+            return self._tag + self.codec, self._encode(obj)
+        except (TypeError, orjson.JSONEncodeError, ormsgpack.MsgpackEncodeError):
+            pass
+        self.fallbacks += 1
+        type_, data = self.fallback.dumps_typed(obj)
+        return self._tag + FALLBACK + type_, data
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        return self.loads_channel(None, data)
+
+    def loads_channel(self, channel: Optional[str], data: Tuple[str, bytes]) -> Any:
+        """loads_typed for a value known to belong to ``channel``
+
+        Raises:
+            ValueError: If the value was written by a newer schema version
+        """
+        type_, payload = data
+        prefix, sep, codec = type_.partition(":")
+        if not sep or not prefix.startswith(TAG_PREFIX) or not prefix[len(TAG_PREFIX):].isdigit():
+            return self.migrate(self.fallback.loads_typed(data), 0, channel)
+
+        version = int(prefix[len(TAG_PREFIX):])
+        if codec in CODECS:
+            value = self._decode(codec, payload)
+        elif codec.startswith(FALLBACK):
+            value = self.fallback.loads_typed((codec[len(FALLBACK):], payload))
+        else:
+            raise ValueError(f"Unknown checkpoint codec: {codec!r}")
+        return self.migrate(value, version, channel)
+
+    def migrate(self, value: Any, version: int, channel: Optional[str] = None) -> Any:
+        """Bring a value written at ``version`` up to this serializer's version"""
+        if version > self.version:
+            raise ValueError(
+                f"Checkpoint written by schema version {version}, newer than {self.version}"
+            )
+        for step in range(version, self.version):
+            upgrade = self.migrations.get(step)
+            if upgrade is not None:
+                value = upgrade(channel, value)
+        return value
+
+
+class LangGraphSerializer(JsonPlusSerializer):
+    """LangGraph's serializer, writing a JobTable value as its list of JobSpec dicts.
+
+    Checkpointers serialize each channel value and pending write on its
+    own, so only top-level tables are converted.
+    """
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        if isinstance(obj, JobTable):
+            obj = obj.to_jobs()
+        return super().dumps_typed(obj)
+
+
+def make_serializer(codec: Optional[str] = None) -> SerializerProtocol:
+    """Serializer for a codec name, read from SPRINT_CHECKPOINT_CODEC by default.
+
+    Args:
+        codec: "msgpack", "json", or "langgraph" for LangGraph's own
+            serializer
+
+    Raises:
+        ValueError: If the codec is unknown
+    """
+    codec = codec or os.environ.get(CODEC_ENV) or "msgpack"
+    if codec == "langgraph":
+        return LangGraphSerializer()
+    return CheckpointSerializer(codec)
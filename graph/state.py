@@ -2,9 +2,104 @@
 
 This module defines all TypedDict schemas that represent the state
 flowing through the LangGraph state machine.
+
+Log-like fields (``status_messages``, ``errors``, ``checkpoints``) and
+``retry_counts`` carry reducers, so nodes return only what they add: new
+list entries are appended and counter updates are merged into the
+existing dict.
+
+``jobs`` is a mapping from job id to JobSpec with a per-job patch
+reducer: nodes return ``{job_id: {"status": ...}}`` for the jobs they
+changed and nothing for the rest. A list of jobs replaces the whole
+mapping, which is how jobs are first created.
+
+The per-status lists (``jobs_implementing``, ``jobs_verified``, ...) are
+derived from ``jobs``: a node that patches jobs also returns
+``status_lists(state, patches)``, so the lists always cover every job in
+that status rather than only the ones the last pass touched.
 """
 
-from typing import TypedDict, List, Optional, Literal, Dict, Any
+import operator
+from typing import Annotated, TypedDict, List, Optional, Literal, Dict, Any
+
+
+def merge_dicts(left: Optional[Dict[str, Any]], right: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Reducer that merges a node's keys into the existing dict"""
+    if not left:
+        return dict(right or {})
+    if not right:
+        return left
+    return {**left, **right}
+
+
+def job_key(job: Dict[str, Any]) -> str:
+    """The key a job is stored under in the jobs mapping"""
+    return job.get("id") or job["name"]
+
+
+def patch_jobs(left: Any, right: Any) -> Dict[str, Any]:
+    """Reducer for ``jobs``: apply per-job patches to the id-keyed mapping.
+
+    Args:
+        left: Current jobs, as a mapping (or a list, which is keyed first)
+        right: A list of jobs, which replaces the mapping, or a mapping of
+            job id to patch. A patch is merged into the existing job (or
+            creates it); a patch of None removes the job.
+
+    Returns:
+        A new mapping; jobs without a patch are shared, not copied
+    """
+    if isinstance(right, list):
+        return {job_key(job): job for job in right}
+    jobs = {job_key(job): job for job in left} if isinstance(left, list) else dict(left or {})
+    for key, patch in (right or {}).items():
+        if patch is None:
+            jobs.pop(key, None)
+        elif key in jobs:
+            jobs[key] = {**jobs[key], **patch}
+        else:
+            jobs[key] = dict(patch)
+    return jobs
+
+
+def job_list(state: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """The state's jobs in creation order, whether stored as a mapping or a list"""
+    jobs = state.get("jobs") or []
+    return list(jobs.values()) if isinstance(jobs, dict) else list(jobs)
+
+
+STATUS_LISTS: Dict[str, str] = {
+    "implementing": "jobs_implementing",
+    "verifying": "jobs_verifying",
+    "verified": "jobs_verified",
+    "failed": "jobs_failed",
+}
+"""State keys holding the jobs in each tracked status"""
+
+
+def status_lists(state: Dict[str, Any], patches: Optional[Dict[str, Any]] = None) -> Dict[str, List[str]]:
+    """The per-status job lists once ``patches`` are applied to the state's jobs.
+
+    Jobs already in a list keep their position, so e.g. ``jobs_verified``
+    stays in completion order across passes; jobs that entered a status
+    follow in creation order.
+
+    Args:
+        state: Current state with ``jobs`` and the previous lists
+        patches: Job patches the node is about to return
+
+    Returns:
+        Every STATUS_LISTS key mapped to job keys (see job_key)
+    """
+    jobs = patch_jobs(state.get("jobs"), patches or {})
+    lists = {}
+    for status, key in STATUS_LISTS.items():
+        current = [name for name, job in jobs.items() if job.get("status") == status]
+        members = set(current)
+        kept = list(dict.fromkeys(name for name in state.get(key) or () if name in members))
+        seen = set(kept)
+        lists[key] = kept + [name for name in current if name not in seen]
+    return lists
 
 
 class JobSpec(TypedDict, total=False):
@@ -45,6 +140,10 @@ class JobSpec(TypedDict, total=False):
     retry_count: int
     """Number of verification retry attempts"""
 
+    failed_tests: List[str]
+    """Test IDs that failed on the last verification attempt; the next
+    attempt runs these first"""
+
     error_message: Optional[str]
     """Error message if job failed"""
 
@@ -55,6 +154,13 @@ class JobSpec(TypedDict, total=False):
     dependencies: List[str]
     """Other jobs this depends on"""
 
+    # Verification
+    test_command: Optional[str]
+    """Command run in the worktree to verify the job"""
+
+    test_timeout: Optional[float]
+    """Seconds before the test command is killed"""
+
 
 class RepoInfo(TypedDict):
     """Information about a git repository.
@@ -168,6 +274,9 @@ class SprintWorkflowState(TypedDict, total=False):
     synthesis_output: Optional[Dict[str, Any]]
     """Synthesized planning from PM + UX + Engineering"""
 
+    synthesized_plan: Optional[Dict[str, Any]]
+    """Unified plan from the synthesis node, revised by feedback iterations"""
+
     # ========================================================================
     # GAP ANALYSIS & VALIDATION
     # ========================================================================
@@ -175,13 +284,17 @@ class SprintWorkflowState(TypedDict, total=False):
     gap_analysis: Optional[Dict[str, Any]]
     """Gap analysis results: issues found, recommendations"""
 
-    retry_counts: Dict[str, int]
-    """Retry counters for feedback loops (gap_analysis, job_validation, etc.)"""
+    retry_counts: Annotated[Dict[str, int], merge_dicts]
+    """Retry counters for feedback loops (gap_analysis, job_validation, etc.);
+    nodes return only the counters they change"""
 
     # ========================================================================
     # SPRINT ARTIFACTS
     # ========================================================================
 
+    sprint_prd: Optional[Dict[str, Any]]
+    """Sprint PRD built from the approved plan"""
+
     sprint_prd_path: Optional[str]
     """Path to generated Sprint PRD document"""
 
@@ -192,8 +305,9 @@ class SprintWorkflowState(TypedDict, total=False):
     # JOB SPECIFICATIONS
     # ========================================================================
 
-    jobs: List[JobSpec]
-    """List of all jobs in the sprint"""
+    jobs: Annotated[Dict[str, JobSpec], patch_jobs]
+    """All jobs in the sprint by id; nodes return patches for the jobs they
+    change (see patch_jobs)"""
 
     jobs_implementing: List[str]
     """Job names currently being implemented"""
@@ -207,6 +321,14 @@ class SprintWorkflowState(TypedDict, total=False):
     jobs_failed: List[str]
     """Job names that failed verification"""
 
+    job_timings: Annotated[Dict[str, Dict[str, float]], merge_dicts]
+    """Per-job worker pool timings: queue_wait and run_time in seconds;
+    nodes return only the jobs they ran"""
+
+    verification_results: Annotated[Dict[str, Dict[str, Any]], merge_dicts]
+    """Latest verification outcome per job: status, returncode, duration,
+    command; nodes return only the jobs they verified"""
+
     # ========================================================================
     # REPOSITORY & GIT
     # ========================================================================
@@ -223,12 +345,15 @@ class SprintWorkflowState(TypedDict, total=False):
     merge_status: List[Dict[str, Any]]
     """Status of PR creation and merging"""
 
+    file_overlap: Dict[str, Any]
+    """File-to-jobs index and pairwise overlap matrix (OverlapIndex.to_dict)"""
+
     # ========================================================================
     # ERROR HANDLING & TRACKING
     # ========================================================================
 
-    errors: List[ErrorRecord]
-    """List of all errors encountered during sprint"""
+    errors: Annotated[List[ErrorRecord], operator.add]
+    """List of all errors encountered during sprint; nodes return new errors"""
 
     # ========================================================================
     # METADATA
@@ -240,11 +365,11 @@ class SprintWorkflowState(TypedDict, total=False):
     completed_at: Optional[str]
     """ISO timestamp when sprint completed"""
 
-    checkpoints: List[str]
-    """List of checkpoint names for resumability"""
+    checkpoints: Annotated[List[str], operator.add]
+    """List of checkpoint names for resumability; nodes return new names"""
 
-    status_messages: List[str]
-    """Log messages for user visibility"""
+    status_messages: Annotated[List[str], operator.add]
+    """Log messages for user visibility; nodes return new messages"""
 
 
 # Type aliases for convenience
@@ -265,3 +390,6 @@ WorkflowPhase = Literal[
 ]
 
 JobStatus = Literal["pending", "implementing", "verifying", "verified", "failed"]
+
+JOB_STATUSES: tuple = ("pending", "implementing", "verifying", "verified", "failed")
+"""Every JobStatus, in the order jobs move through them"""
@@ -0,0 +1,154 @@
+"""Parallel, cached loader for sprint task files.
+
+Every ``tasks/*.md`` file describes one job. Parsing is a single pass
+over the file that extracts story points and todos. Files are read and
+parsed in a thread pool, and each result is cached under the file's
+path, keyed on (mtime, size), so a re-run or resume only reparses task
+files that changed since the last load.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, TypedDict
+
+
+DEFAULT_STORY_POINTS = 5
+
+
+class ParsedTask(TypedDict):
+    """Fields extracted from one task file"""
+
+    name: str
+    """Job name (the file stem)"""
+
+    task_file: str
+    """Path to the task file"""
+
+    todos: List[str]
+    """Unchecked todo items (``- [ ]`` lines)"""
+
+    story_points: int
+    """Story points, or DEFAULT_STORY_POINTS when none are given"""
+
+    dependencies: List[str]
+    """Names of jobs that must be verified before this one starts"""
+
+    test_command: Optional[str]
+    """Command that verifies the job, run in its worktree"""
+
+    files_to_modify: List[str]
+    """Paths the job expects to change, relative to the repository root"""
+
+
+_cache: Dict[str, Tuple[int, int, ParsedTask]] = {}
+_cache_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def parse_task_content(name: str, task_file: str, content: str) -> ParsedTask:
+    """Extract story points and todos from task file content in one pass.
+
+    A line containing ``## Story Points`` or ``Story Points:`` sets the
+    story points from the digits after its last colon; the last such
+    line with digits wins. ``Dependencies:`` or ``Depends on:`` lines
+    list job names separated by commas, and a ``Test Command:`` line
+    gives the verification command.
+    """
+    story_points = DEFAULT_STORY_POINTS
+    todos = []
+    dependencies = []
+    test_command = None
+    files_to_modify = []
+    in_files_section = False
+
+    for line in content.split('\n'):
+        stripped = line.strip()
+        if stripped.startswith('#'):
+            in_files_section = stripped.lstrip('#').strip().lower() == 'files to modify'
+        if stripped.startswith('- [ ]'):
+            todos.append(stripped[5:])
+        elif in_files_section and stripped.startswith(('- ', '* ')):
+            path = stripped[2:].strip().strip('`')
+            if path:
+                files_to_modify.append(path)
+        elif '## Story Points' in line or 'Story Points:' in line:
+            digits = ''.join(filter(str.isdigit, line.split(':')[-1]))
+            if digits:
+                story_points = int(digits)
+        elif stripped.startswith(('Dependencies:', 'Depends on:', '**Dependencies**:')):
+            for dep in stripped.split(':', 1)[1].split(','):
+                dep = dep.strip().strip('`*')
+                if dep and dep.lower() not in ('none', '-', 'n/a'):
+                    dependencies.append(dep)
+        elif stripped.lower().startswith(('test command:', '**test command**:')):
+            test_command = stripped.split(':', 1)[1].strip().strip('`') or None
+        elif stripped.lower().startswith(('files to modify:', '**files to modify**:')):
+            for path in stripped.split(':', 1)[1].split(','):
+                path = path.strip().strip('`')
+                if path:
+                    files_to_modify.append(path)
+
+    return ParsedTask(
+        name=name,
+        task_file=task_file,
+        todos=todos,
+        story_points=story_points,
+        dependencies=dependencies,
+        test_command=test_command,
+        files_to_modify=list(dict.fromkeys(files_to_modify))
+    )
+
+
+def _load_one(task_file: Path) -> ParsedTask:
+    key = str(task_file)
+    stat = os.stat(key)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[:2] == stamp:
+            _stats["hits"] += 1
+            return cached[2]
+
+    parsed = parse_task_content(task_file.stem, key, task_file.read_text())
+
+    with _cache_lock:
+        _cache[key] = (stamp[0], stamp[1], parsed)
+        _stats["misses"] += 1
+    return parsed
+
+
+def load_task_files(tasks_dir: str, max_workers: Optional[int] = None) -> List[ParsedTask]:
+    """Parse every ``*.md`` file in a directory.
+
+    Args:
+        tasks_dir: Directory containing task files
+        max_workers: Thread pool size; defaults to ThreadPoolExecutor's
+
+    Returns:
+        Parsed tasks in directory listing order. The results are shared
+        with the cache and must not be mutated; copy ``todos`` before
+        changing it.
+    """
+    task_files = list(Path(tasks_dir).glob("*.md"))
+    if not task_files:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task-loader") as pool:
+        return list(pool.map(_load_one, task_files))
+
+
+def task_cache_info() -> Dict[str, int]:
+    """Cache hits, misses and current size"""
+    with _cache_lock:
+        return {**_stats, "size": len(_cache)}
+
+
+def clear_task_cache() -> None:
+    """Forget all cached task files"""
+    with _cache_lock:
+        _cache.clear()
+        _stats["hits"] = 0
+        _stats["misses"] = 0
@@ -0,0 +1,452 @@
+"""Parallel job verification with subprocess test runners.
+
+Each job's test command runs in the job's worktree through
+``asyncio.create_subprocess_exec`` (no shell), with a bounded number of
+commands running at once and a per-job timeout. Output is read
+concurrently from stdout and stderr into bounded buffers that keep the
+tail of each stream, so a chatty test suite cannot exhaust memory.
+Every run produces a structured VerificationOutcome.
+
+Retries are incremental: when a job failed before and its test runner is
+one we can target (pytest, go test), the next attempt first runs only the
+previously failing tests and widens to the full suite only once those
+pass.
+"""
+
+import asyncio
+import os
+import re
+import shlex
+import signal
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Sequence, Tuple, TypedDict, Union
+
+from .pool import run_job_pool
+
+
+DEFAULT_TIMEOUT = 600.0
+DEFAULT_MAX_OUTPUT = 64 * 1024
+
+OUTPUT_GRACE = 1.0
+"""Seconds to keep reading a timed-out command's output after killing it"""
+
+
+class VerificationOutcome(TypedDict):
+    """Result of verifying one job"""
+
+    job: str
+    """Job name"""
+
+    status: Literal["passed", "failed", "timeout", "error"]
+    """passed: exit code 0; failed: non-zero exit; timeout: killed after
+    the job's timeout; error: the command could not be started"""
+
+    passed: bool
+    """True only for status "passed\""""
+
+    command: List[str]
+    """Command that was run"""
+
+    returncode: Optional[int]
+    """Exit code, or None if the command did not exit on its own"""
+
+    duration: float
+    """Wall-clock seconds"""
+
+    stdout: str
+    """Tail of standard output"""
+
+    stderr: str
+    """Tail of standard error, or the start-up error message"""
+
+    truncated: bool
+    """True if output beyond the buffer size was dropped"""
+
+    failed_tests: List[str]
+    """Test IDs reported as failing, for runners we can parse"""
+
+    narrowed: bool
+    """True if only previously failing tests were run"""
+
+
+def error_outcome(job: str, message: str, duration: float = 0.0) -> VerificationOutcome:
+    """Outcome for a verification that could not run at all"""
+    return VerificationOutcome(
+        job=job, status="error", passed=False, command=[], returncode=None,
+        duration=duration, stdout="", stderr=message, truncated=False,
+        failed_tests=[], narrowed=False,
+    )
+
+
+class BoundedBuffer:
+    """Byte buffer that keeps only the last ``limit`` bytes written"""
+
+    def __init__(self, limit: int = DEFAULT_MAX_OUTPUT):
+        self.limit = limit
+        self._data = bytearray()
+        self.total = 0
+
+    def write(self, chunk: bytes) -> None:
+        self.total += len(chunk)
+        self._data += chunk
+        if len(self._data) > self.limit:
+            del self._data[:len(self._data) - self.limit]
+
+    @property
+    def truncated(self) -> bool:
+        return self.total > len(self._data)
+
+    def text(self) -> str:
+        return self._data.decode(errors="replace")
+
+
+async def _pump(stream: Optional[asyncio.StreamReader], buffer: BoundedBuffer) -> None:
+    if stream is None:
+        return
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            return
+        buffer.write(chunk)
+
+
+async def _open_pipe() -> Tuple[asyncio.StreamReader, asyncio.ReadTransport, int]:
+    """A pipe whose read end is attached to the loop.
+
+    Returns:
+        The reader, its transport, and the write end's fd for the child
+    """
+    read_fd, write_fd = os.pipe()
+    reader = asyncio.StreamReader()
+    try:
+        pipe = os.fdopen(read_fd, "rb", buffering=0)
+    except BaseException:
+        os.close(read_fd)
+        os.close(write_fd)
+        raise
+    try:
+        transport, _ = await asyncio.get_running_loop().connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), pipe
+        )
+    except BaseException:
+        pipe.close()
+        os.close(write_fd)
+        raise
+    return reader, transport, write_fd
+
+
+async def _reap(
+    proc: asyncio.subprocess.Process,
+    pumps: asyncio.Future,
+    transports: Sequence[asyncio.ReadTransport],
+    grace: float,
+) -> None:
+    """Wait for a killed command, reading what is left of its output.
+
+    A process that left the command's process group can hold the pipes
+    open for as long as it runs. After ``grace`` seconds the readers are
+    cancelled and our ends of the pipes closed; the process itself owns
+    no pipes, so waiting for it ends when it exits.
+    """
+    if grace > 0:
+        await asyncio.wait({pumps}, timeout=grace)
+    if not pumps.done():
+        pumps.cancel()
+        for transport in transports:
+            transport.close()
+        await asyncio.gather(pumps, return_exceptions=True)
+    await proc.wait()
+
+
+def _kill(proc: asyncio.subprocess.Process) -> None:
+    """Kill a test command and anything it spawned"""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError, AttributeError):
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+
+
+async def run_test_command(
+    job: str,
+    command: Union[str, Sequence[str]],
+    cwd: str,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_output: int = DEFAULT_MAX_OUTPUT,
+    env: Optional[Dict[str, str]] = None,
+) -> VerificationOutcome:
+    """Run one test command and describe how it went.
+
+    Args:
+        job: Job name for the outcome
+        command: argv list, or a string split with shlex
+        cwd: Directory to run in (the job's worktree)
+        timeout: Seconds before the command is killed
+        max_output: Bytes of each stream to keep
+        env: Extra environment variables
+
+    Returns:
+        VerificationOutcome; this function does not raise for command
+        failures, timeouts or start-up errors
+    """
+    argv = shlex.split(command) if isinstance(command, str) else list(command)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    stdout, stderr = BoundedBuffer(max_output), BoundedBuffer(max_output)
+
+    def outcome(status, returncode=None, error=None) -> VerificationOutcome:
+        return VerificationOutcome(
+            job=job,
+            status=status,
+            passed=status == "passed",
+            command=argv,
+            returncode=returncode,
+            duration=loop.time() - started,
+            stdout=stdout.text(),
+            stderr=error if error is not None else stderr.text(),
+            truncated=stdout.truncated or stderr.truncated,
+            failed_tests=parse_failed_tests(argv, stdout.text() + "\n" + stderr.text()),
+            narrowed=False,
+        )
+
+    # The output pipes are ours rather than the Process's, so a killed
+    # command's stray children cannot keep us waiting on them
+    pipes = []
+    try:
+        for _ in range(2):
+            pipes.append(await _open_pipe())
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            cwd=cwd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=pipes[0][2],
+            stderr=pipes[1][2],
+            env={**os.environ, **env} if env else None,
+            start_new_session=True,
+        )
+    except BaseException as e:
+        for _, transport, _ in pipes:
+            transport.close()
+        if isinstance(e, (OSError, ValueError)):
+            return outcome("error", error=str(e))
+        raise
+    finally:
+        for _, _, write_fd in pipes:
+            os.close(write_fd)
+
+    transports = [transport for _, transport, _ in pipes]
+    pumps = asyncio.gather(_pump(pipes[0][0], stdout), _pump(pipes[1][0], stderr))
+    try:
+        await asyncio.wait_for(asyncio.shield(pumps), timeout)
+        returncode = await proc.wait()
+    except asyncio.TimeoutError:
+        _kill(proc)
+        await _reap(proc, pumps, transports, OUTPUT_GRACE)
+        return outcome("timeout")
+    except asyncio.CancelledError:
+        _kill(proc)
+        await _reap(proc, pumps, transports, 0)
+        raise
+    finally:
+        for transport in transports:
+            transport.close()
+
+    return outcome("passed" if returncode == 0 else "failed", returncode)
+
+
+_PYTEST_FAILURE = re.compile(r"^(?:FAILED|ERROR) (\S+::\S+?)(?: - .*)?$", re.MULTILINE)
+_GO_FAILURE = re.compile(r"^\s*--- FAIL: (\w+)", re.MULTILINE)
+
+# pytest options that take a value, as the next argument or attached
+# ("-k expr", "-kexpr", "--tb=short")
+_PYTEST_VALUE_OPTIONS = frozenset({
+    "-p", "-k", "-m", "-c", "-o", "-W", "-r", "-n", "--tb", "--maxfail", "--rootdir",
+    "--basetemp", "--confcutdir", "--deselect", "--ignore", "--ignore-glob",
+    "--import-mode", "--durations", "--cov", "--cov-report", "--cov-config",
+    "--cov-fail-under", "--junitxml", "--junit-xml", "--junit-prefix", "--log-level",
+    "--log-cli-level", "--log-file", "--log-format", "--capture", "--color",
+    "--override-ini", "--pythonwarnings", "--dist", "--timeout", "--html",
+})
+
+# pytest options that take no value
+_PYTEST_FLAGS = frozenset({
+    "--lf", "--last-failed", "--ff", "--failed-first", "--nf", "--new-first", "--sw",
+    "--stepwise", "--exitfirst", "--quiet", "--verbose", "--showlocals", "--strict",
+    "--strict-markers", "--strict-config", "--no-header", "--no-summary",
+    "--disable-warnings", "--disable-pytest-warnings", "--runxfail", "--cache-clear",
+    "--setup-show", "--full-trace", "--fulltrace", "--pdb", "--trace", "--no-cov",
+    "--no-cov-on-fail", "--cov-append", "--doctest-modules",
+})
+_PYTEST_SHORT_FLAGS = frozenset("qvxsl")
+
+
+def _pytest_options(args: Sequence[str]) -> Optional[List[str]]:
+    """The options in a pytest argument list, without its test paths.
+
+    Returns:
+        The option arguments and their values, or None if any option is
+        not one we know, since we cannot tell whether it takes a value
+    """
+    kept: List[str] = []
+    expects_value = False
+    for arg in args:
+        if expects_value:
+            kept.append(arg)
+            expects_value = False
+        elif arg.startswith("--"):
+            name = arg.split("=", 1)[0]
+            if name not in _PYTEST_VALUE_OPTIONS and arg not in _PYTEST_FLAGS:
+                return None
+            kept.append(arg)
+            expects_value = name in _PYTEST_VALUE_OPTIONS and "=" not in arg
+        elif arg.startswith("-") and len(arg) > 1:
+            if arg[:2] in _PYTEST_VALUE_OPTIONS:
+                expects_value = len(arg) == 2
+            elif not set(arg[1:]) <= _PYTEST_SHORT_FLAGS:
+                return None
+            kept.append(arg)
+    return kept
+
+
+def detect_test_runner(argv: Sequence[str]) -> Optional[str]:
+    """Identify a test runner we can target by test ID ("pytest", "go")"""
+    if any(os.path.basename(arg) in ("pytest", "py.test") for arg in argv):
+        return "pytest"
+    if len(argv) >= 2 and os.path.basename(argv[0]) == "go" and argv[1] == "test":
+        return "go"
+    return None
+
+
+def parse_failed_tests(argv: Sequence[str], output: str) -> List[str]:
+    """Extract failing test IDs from a runner's output"""
+    runner = detect_test_runner(argv)
+    if runner == "pytest":
+        ids = _PYTEST_FAILURE.findall(output)
+    elif runner == "go":
+        ids = _GO_FAILURE.findall(output)
+    else:
+        return []
+    return list(dict.fromkeys(ids))
+
+
+def narrow_command(argv: Sequence[str], failed_tests: Sequence[str]) -> Optional[List[str]]:
+    """Rewrite a test command to run only the given tests.
+
+    Returns:
+        The narrowed argv, or None if the runner cannot be targeted or
+        the command has options we cannot safely keep
+    """
+    runner = detect_test_runner(argv)
+    if not failed_tests or runner is None:
+        return None
+    if runner == "pytest":
+        # Replace the suite's path arguments with the failing node ids
+        start = next(i for i, arg in enumerate(argv) if os.path.basename(arg) in ("pytest", "py.test")) + 1
+        options = _pytest_options(argv[start:])
+        if options is None:
+            return None
+        return [*argv[:start], *options, *failed_tests]
+
+    pattern = "^(" + "|".join(re.escape(test) for test in failed_tests) + ")$"
+    argv = list(argv)
+    if "-run" in argv[:-1]:
+        argv[argv.index("-run") + 1] = pattern
+        return argv
+    return [*argv[:2], "-run", pattern, *argv[2:]]
+
+
+async def run_incremental(
+    job: str,
+    command: Union[str, Sequence[str]],
+    cwd: str,
+    failed_tests: Sequence[str] = (),
+    **kwargs: Any,
+) -> VerificationOutcome:
+    """Run previously failing tests first, then the full suite.
+
+    With no previous failures, or a runner that cannot be targeted, this
+    is just run_test_command. Otherwise the narrowed run's outcome is
+    returned if it does not pass; if it passes the full suite runs and its
+    outcome is returned, with ``duration`` covering both runs.
+
+    Args:
+        job: Job name for the outcome
+        command: Full test command
+        cwd: Directory to run in
+        failed_tests: Test IDs that failed on the previous attempt
+        **kwargs: Passed to run_test_command
+    """
+    argv = shlex.split(command) if isinstance(command, str) else list(command)
+    narrowed = narrow_command(argv, failed_tests)
+    if narrowed is None:
+        return await run_test_command(job, argv, cwd, **kwargs)
+
+    first = await run_test_command(job, narrowed, cwd, **kwargs)
+    first["narrowed"] = True
+    if not first["passed"]:
+        if first["status"] == "failed" and not first["failed_tests"]:
+            # Output did not name the failures; keep targeting the old set
+            first["failed_tests"] = list(failed_tests)
+        return first
+
+    full = await run_test_command(job, argv, cwd, **kwargs)
+    full["duration"] += first["duration"]
+    return full
+
+
+async def verify_in_parallel(
+    jobs: Iterable[Dict[str, Any]],
+    command_for: Callable[[Dict[str, Any]], Optional[Union[str, Sequence[str]]]],
+    max_concurrency: int,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_output: int = DEFAULT_MAX_OUTPUT,
+    cwd_key: str = "worktree",
+) -> Dict[str, VerificationOutcome]:
+    """Verify many jobs with at most ``max_concurrency`` commands running.
+
+    Args:
+        jobs: Job dicts; each runs in ``job[cwd_key]``
+        command_for: Returns a job's test command
+        max_concurrency: Maximum commands running at once
+        timeout: Per-job timeout in seconds; a job's own ``test_timeout``
+            field takes precedence
+        max_output: Bytes of each output stream to keep per job
+        cwd_key: Job field holding the working directory
+
+    Returns:
+        Outcomes by job name
+    """
+    async def verify(job):
+        command = command_for(job)
+        if not command:
+            raise ValueError(f"No test command configured for {job['name']}")
+        return await run_test_command(
+            job["name"],
+            command,
+            cwd=job.get(cwd_key) or ".",
+            timeout=job.get("test_timeout") or timeout,
+            max_output=max_output,
+        )
+
+    results = await run_job_pool(jobs, verify, max_concurrency)
+    outcomes = {}
+    for result in results:
+        if result["error"] is not None:
+            outcomes[result["job"]] = error_outcome(result["job"], result["error"], result["run_time"])
+        else:
+            outcomes[result["job"]] = result["result"]
+    return outcomes
+
+
+def outcome_summary(outcome: VerificationOutcome, lines: int = 20) -> str:
+    """Short human-readable description of a failed verification"""
+    if outcome["status"] == "error":
+        return f"Could not run tests: {outcome['stderr']}"
+    if outcome["status"] == "timeout":
+        head = f"Timed out after {outcome['duration']:.1f}s: {shlex.join(outcome['command'])}"
+    else:
+        head = f"Exit code {outcome['returncode']}: {shlex.join(outcome['command'])}"
+
+    tail = (outcome["stdout"] + outcome["stderr"]).strip().splitlines()[-lines:]
+    return "\n".join([head, *tail]) if tail else head
@@ -0,0 +1,328 @@
+"""Pluggable verifier backends.
+
+A verifier backend turns a job into a VerificationOutcome. Every backend
+exposes the same ``async verify(job)`` method, so the executor's
+verification phase, its worker pool and its retry logic behave the same
+whichever backend is plugged in:
+
+* SubprocessVerifier runs the job's test command in its worktree.
+* SimulatedVerifier draws latency and pass/fail from a seeded model, for
+  load-testing scheduling and retries at thousands of jobs without
+  running real suites. The draw for a given job and attempt depends only
+  on the seed, never on the order jobs happen to complete in, so a run
+  is reproducible at any pool size.
+* RecordingVerifier wraps another backend and writes its outcomes to a
+  trace file.
+* ReplayVerifier plays back outcomes recorded by RecordingVerifier from
+  an earlier run.
+"""
+
+import asyncio
+import json
+import math
+import random
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional
+
+from .verification import (
+    DEFAULT_MAX_OUTPUT,
+    DEFAULT_TIMEOUT,
+    VerificationOutcome,
+    error_outcome,
+    run_incremental,
+)
+
+
+class VerifierBackend(ABC):
+    """Base class for verifier backends"""
+
+    name = "base"
+
+    @abstractmethod
+    async def verify(self, job: Mapping[str, Any]) -> VerificationOutcome:
+        """Verify one job. Must not raise for ordinary test failures."""
+
+
+class SubprocessVerifier(VerifierBackend):
+    """Run each job's test command in its worktree"""
+
+    name = "subprocess"
+
+    def __init__(
+        self,
+        default_command: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        incremental: bool = True,
+        max_output: int = DEFAULT_MAX_OUTPUT,
+        cwd_key: str = "worktree",
+        fallback: Optional[VerifierBackend] = None,
+    ):
+        """
+        Args:
+            default_command: Command for jobs without a ``test_command``
+            timeout: Seconds before a command is killed; a job's own
+                ``test_timeout`` takes precedence
+            incremental: Run a retry's previously failing tests first
+            max_output: Bytes of each output stream to keep
+            cwd_key: Job field holding the working directory
+            fallback: Backend for jobs with no command at all; without
+                one they get an error outcome
+        """
+        self.default_command = default_command
+        self.timeout = timeout
+        self.incremental = incremental
+        self.max_output = max_output
+        self.cwd_key = cwd_key
+        self.fallback = fallback
+
+    async def verify(self, job: Mapping[str, Any]) -> VerificationOutcome:
+        command = job.get("test_command") or self.default_command
+        if not command:
+            if self.fallback is not None:
+                return await self.fallback.verify(job)
+            return error_outcome(job["name"], "No test command configured")
+
+        return await run_incremental(
+            job["name"],
+            command,
+            cwd=job.get(self.cwd_key) or ".",
+            failed_tests=(job.get("failed_tests") or ()) if self.incremental else (),
+            timeout=job.get("test_timeout") or self.timeout,
+            max_output=self.max_output,
+        )
+
+
+class LatencyModel:
+    """Distribution of simulated verification times, in seconds.
+
+    Kinds and their parameters:
+
+    * ``constant``: value
+    * ``uniform``: low, high
+    * ``exponential``: mean
+    * ``lognormal``: median, sigma (of the underlying normal)
+    """
+
+    KINDS = {"constant": 1, "uniform": 2, "exponential": 1, "lognormal": 2}
+
+    def __init__(self, kind: str = "constant", *params: float):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution: {kind}")
+        if len(params) != self.KINDS[kind]:
+            raise ValueError(f"{kind} latency takes {self.KINDS[kind]} parameter(s), got {len(params)}")
+        self.kind = kind
+        self.params = tuple(float(p) for p in params)
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        """Parse ``kind:p1,p2``, e.g. ``lognormal:0.5,0.8`` or ``0.1``"""
+        kind, _, params = spec.partition(":")
+        if not params:
+            try:
+                return cls("constant", float(kind))
+            except ValueError:
+                pass
+        return cls(kind.strip(), *(float(p) for p in params.split(",") if p.strip()))
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "constant":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(*self.params)
+        if self.kind == "exponential":
+            return rng.expovariate(1.0 / self.params[0]) if self.params[0] > 0 else 0.0
+        median, sigma = self.params
+        return rng.lognormvariate(math.log(median), sigma) if median > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return f"LatencyModel({self.kind!r}, {', '.join(map(repr, self.params))})"
+
+
+class SimulatedVerifier(VerifierBackend):
+    """Deterministic, seeded stand-in for running test suites"""
+
+    name = "simulate"
+
+    def __init__(
+        self,
+        seed: int = 0,
+        failure_rate: float = 0.2,
+        latency: Optional[LatencyModel] = None,
+        timeout_rate: float = 0.0,
+        pass_after: Optional[int] = None,
+        time_scale: float = 1.0,
+        failure_rates: Optional[Mapping[str, float]] = None,
+    ):
+        """
+        Args:
+            seed: Seed for every draw
+            failure_rate: Probability an attempt fails
+            latency: Distribution of attempt durations; 0.1s by default
+            timeout_rate: Probability an attempt times out instead
+            pass_after: Attempts with at least this ``retry_count`` always
+                pass; None (the default) never forces a pass, so a
+                simulated job can exhaust its retries like a real one
+            time_scale: Multiplier for the time actually slept; 0 reports
+                the sampled durations without sleeping
+            failure_rates: Per-job failure rates, by job name
+        """
+        self.seed = seed
+        self.failure_rate = failure_rate
+        self.latency = latency or LatencyModel("constant", 0.1)
+        self.timeout_rate = timeout_rate
+        self.pass_after = pass_after
+        self.time_scale = time_scale
+        self.failure_rates = dict(failure_rates or {})
+
+    def draw(self, job: Mapping[str, Any]) -> VerificationOutcome:
+        """The outcome for a job's current attempt, without sleeping"""
+        attempt = job.get("retry_count", 0) or 0
+        rng = random.Random(f"{self.seed}:{job['name']}:{attempt}")
+        duration = self.latency.sample(rng)
+        roll = rng.random()
+
+        failure_rate = self.failure_rates.get(job["name"], self.failure_rate)
+        forced = self.pass_after is not None and attempt >= self.pass_after
+        if forced or roll >= failure_rate + self.timeout_rate:
+            status, returncode = "passed", 0
+        elif roll < self.timeout_rate:
+            status, returncode = "timeout", None
+        else:
+            status, returncode = "failed", 1
+
+        return VerificationOutcome(
+            job=job["name"], status=status, passed=status == "passed", command=[],
+            returncode=returncode, duration=duration, stdout="", stderr="",
+            truncated=False, failed_tests=[], narrowed=False,
+        )
+
+    async def verify(self, job: Mapping[str, Any]) -> VerificationOutcome:
+        outcome = self.draw(job)
+        if self.time_scale > 0:
+            await asyncio.sleep(outcome["duration"] * self.time_scale)
+        return outcome
+
+
+class RecordingVerifier(VerifierBackend):
+    """Wrap a backend and record every outcome as a replayable trace"""
+
+    name = "record"
+
+    def __init__(self, backend: VerifierBackend, path: Optional[str] = None):
+        """
+        Args:
+            backend: Backend whose outcomes are recorded
+            path: If given, the trace file is truncated now and each
+                outcome is appended to it as it arrives, so a run that
+                dies part-way still leaves a replayable trace
+        """
+        self.backend = backend
+        self.path = path
+        self.trace: List[VerificationOutcome] = []
+        if path is not None:
+            open(path, "w").close()
+
+    async def verify(self, job: Mapping[str, Any]) -> VerificationOutcome:
+        outcome = await self.backend.verify(job)
+        self.trace.append(outcome)
+        if self.path is not None:
+            await asyncio.to_thread(self._append, outcome)
+        return outcome
+
+    def _append(self, outcome: VerificationOutcome) -> None:
+        with open(self.path, "a") as f:
+            f.write(json.dumps(outcome) + "\n")
+
+    def save(self, path: str) -> None:
+        """Write the trace as JSON lines, one outcome per line"""
+        with open(path, "w") as f:
+            for outcome in self.trace:
+                f.write(json.dumps(outcome) + "\n")
+
+
+class ReplayVerifier(VerifierBackend):
+    """Play back recorded outcomes, in order, per job"""
+
+    name = "replay"
+
+    def __init__(
+        self,
+        trace: Iterable[Mapping[str, Any]],
+        time_scale: float = 0.0,
+        repeat_last: bool = True,
+    ):
+        """
+        Args:
+            trace: Recorded outcomes; each job's entries are replayed in
+                the order they appear
+            time_scale: Multiplier for sleeping each recorded duration
+            repeat_last: Once a job's entries run out, keep returning its
+                last one; otherwise return an error outcome
+        """
+        self.time_scale = time_scale
+        self.repeat_last = repeat_last
+        self._pending: Dict[str, Deque[VerificationOutcome]] = {}
+        self._last: Dict[str, VerificationOutcome] = {}
+        for entry in trace:
+            self._pending.setdefault(entry["job"], deque()).append(self._complete(entry))
+
+    @staticmethod
+    def _complete(entry: Mapping[str, Any]) -> VerificationOutcome:
+        """Fill fields a hand-written trace may leave out"""
+        status = entry.get("status") or ("passed" if entry.get("passed") else "failed")
+        return VerificationOutcome(
+            job=entry["job"],
+            status=status,
+            passed=status == "passed",
+            command=list(entry.get("command", [])),
+            returncode=entry.get("returncode", 0 if status == "passed" else 1),
+            duration=float(entry.get("duration", 0.0)),
+            stdout=entry.get("stdout", ""),
+            stderr=entry.get("stderr", ""),
+            truncated=bool(entry.get("truncated", False)),
+            failed_tests=list(entry.get("failed_tests", [])),
+            narrowed=bool(entry.get("narrowed", False)),
+        )
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs: Any) -> "ReplayVerifier":
+        """Load a JSON-lines trace written by RecordingVerifier.save"""
+        with open(path) as f:
+            return cls((json.loads(line) for line in f if line.strip()), **kwargs)
+
+    def remaining(self) -> int:
+        """Recorded outcomes not yet replayed"""
+        return sum(len(queue) for queue in self._pending.values())
+
+    async def verify(self, job: Mapping[str, Any]) -> VerificationOutcome:
+        name = job["name"]
+        queue = self._pending.get(name)
+        if queue:
+            outcome = self._last[name] = queue.popleft()
+        elif self.repeat_last and name in self._last:
+            outcome = self._last[name]
+        else:
+            return error_outcome(name, "No recorded outcome to replay")
+
+        if self.time_scale > 0:
+            await asyncio.sleep(outcome["duration"] * self.time_scale)
+        return VerificationOutcome(**outcome)
+
+
+def make_verifier(kind: str = "subprocess", **options: Any) -> VerifierBackend:
+    """Create a backend by name: subprocess, simulate, replay or record.
+
+    ``replay`` takes a ``path`` option naming the trace file to play back.
+    ``record`` takes the ``backend`` to wrap and a ``path`` to write the
+    trace to. Any other options go to the backend's constructor.
+    """
+    if kind == "subprocess":
+        return SubprocessVerifier(**options)
+    if kind == "simulate":
+        return SimulatedVerifier(**options)
+    if kind == "replay":
+        return ReplayVerifier.from_file(options.pop("path"), **options)
+    if kind == "record":
+        return RecordingVerifier(**options)
+    raise ValueError(f"Unknown verifier backend: {kind}")
@@ -4,11 +4,12 @@ This module defines the complete state machine structure with all nodes,
 edges, and conditional routing for the sprint workflow.
 """
 
-from typing import Dict, Any, Literal
+from typing import Dict, Any, Literal, Optional
 from langgraph.graph import StateGraph, END, START
-from langgraph.checkpoint.memory import MemorySaver
 
-from .state import SprintWorkflowState
+from .artifacts import load_artifact
+from .cache import checkpointer_config, get_compiled_graph
+from .state import SprintWorkflowState, job_list
 from .nodes import synthesize_planning_node, gap_analysis_node
 
 
@@ -40,7 +41,7 @@ def should_apply_gap_feedback(state: SprintWorkflowState) -> Literal["apply_feed
         - "approved": No issues found, proceed to PRD generation
         - "max_retries": Max retries reached, proceed anyway
     """
-    gap_analysis = state.get("gap_analysis")
+    gap_analysis = load_artifact(state, "gap_analysis")
 
     # If no gap analysis run yet, proceed
     if not gap_analysis:
@@ -90,7 +91,7 @@ def should_continue_verification(state: SprintWorkflowState) -> Literal["retry",
         - "retry": Jobs still implementing/verifying, loop back
         - "continue": All jobs verified or failed, proceed to branch management
     """
-    jobs = state.get("jobs", [])
+    jobs = job_list(state)
 
     # Check if any jobs are still implementing or verifying
     for job in jobs:
@@ -243,22 +244,24 @@ def build_workflow() -> StateGraph:
     return workflow
 
 
-def compile_workflow(checkpointer: bool = True) -> Any:
+def compile_workflow(checkpointer: bool = True, checkpoint_db: Optional[str] = None) -> Any:
     """Compile the workflow graph with optional checkpointing.
 
+    The compiled graph is cached process-wide (see graph.cache). With
+    checkpoint_db repeated calls return the same app and share its
+    checkpointer; with MemorySaver each call gets its own checkpointer.
+
     Args:
-        checkpointer: If True, use MemorySaver for checkpoint support
+        checkpointer: If True, enable checkpoint support
+        checkpoint_db: SQLite database for durable, resumable checkpoints;
+            MemorySaver is used when omitted
 
     Returns:
         Compiled workflow app ready for invocation
     """
-    workflow = build_workflow()
-
-    if checkpointer:
-        memory = MemorySaver()
-        return workflow.compile(checkpointer=memory)
-    else:
-        return workflow.compile()
+    return get_compiled_graph(
+        "workflow", build_workflow, checkpointer_config(checkpointer, checkpoint_db)
+    )
 
 
 def get_workflow_visualization() -> str:
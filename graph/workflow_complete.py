@@ -1,9 +1,9 @@
 """Complete LangGraph workflow with all nodes integrated."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from langgraph.graph import StateGraph, END, START
-from langgraph.checkpoint.memory import MemorySaver
 
+from .cache import checkpointer_config, get_compiled_graph
 from .state import SprintWorkflowState
 from .nodes import (
     synthesize_planning_node,
@@ -88,6 +88,7 @@ def build_complete_workflow() -> StateGraph:
         should_continue_verification,
         {
             "retry": "verification_loop",
+            "implement": "parallel_implementation",
             "continue": "manage_branches",
         }
     )
@@ -100,12 +101,11 @@ def build_complete_workflow() -> StateGraph:
     return workflow
 
 
-def compile_complete_workflow(checkpointer: bool = True):
-    """Compile the complete workflow."""
-    workflow = build_complete_workflow()
-    
-    if checkpointer:
-        memory = MemorySaver()
-        return workflow.compile(checkpointer=memory)
-    else:
-        return workflow.compile()
+def compile_complete_workflow(checkpointer: bool = True, checkpoint_db: Optional[str] = None):
+    """Compile the complete workflow (cached process-wide, see graph.cache).
+
+    Pass checkpoint_db to keep checkpoints in SQLite so runs survive a restart.
+    """
+    return get_compiled_graph(
+        "complete", build_complete_workflow, checkpointer_config(checkpointer, checkpoint_db)
+    )
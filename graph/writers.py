@@ -0,0 +1,226 @@
+"""Atomic and debounced writers for sprint output files.
+
+Files such as ``sprint_status.md`` are read by other tools while a sprint
+is running, so they are never rewritten in place: content goes to a
+temporary file in the same directory which is then renamed over the
+target, and readers see either the old or the new file, never a torn
+one. The temporary file is synced before the rename, so a crash cannot
+leave an empty target behind, and it takes the target's permissions
+(or the umask defaults for a new file) rather than mkstemp's 0600.
+
+DebouncedWriter sits on top of that for files that are regenerated from
+state many times per sprint. Callers only mark the state dirty; at most
+one render and write happens per ``min_interval`` seconds, and both run
+in a worker thread so the event loop is never blocked on disk I/O.
+
+BackgroundWriter is for one-off files such as error and final reports:
+``submit`` hands the content to a small thread pool and returns at once,
+so a burst of reports does not stall the node producing them, and
+``drain`` waits for everything submitted so far.
+"""
+
+import asyncio
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional, Set
+
+
+def _current_umask() -> int:
+    # os.umask can only be read by setting it; done once, at import
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+_UMASK = _current_umask()
+
+
+def atomic_write_text(path: str, content: str, encoding: str = "utf-8") -> None:
+    """Replace a file's content atomically.
+
+    Args:
+        path: Destination file
+        content: Full new file content
+        encoding: Text encoding
+    """
+    target = Path(path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=str(target.parent or Path(".")), prefix=f".{target.name}.", suffix=".tmp"
+    )
+    try:
+        try:
+            mode = target.stat().st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            os.fchmod(f.fileno(), mode)
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class DebouncedWriter:
+    """Coalesce repeated rewrites of one file into periodic atomic writes.
+
+    ``mark_dirty`` is cheap and may be called after every job update. The
+    first call writes almost immediately; calls arriving within
+    ``min_interval`` of the last write are folded into a single write of
+    the latest state once the interval has elapsed. ``flush`` forces the
+    pending write out, e.g. at the end of a sprint.
+
+    Must be used from a running event loop.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        render: Callable[[Any], str],
+        min_interval: float = 1.0,
+        snapshot: Optional[Callable[[Any], Any]] = None,
+    ):
+        """
+        Args:
+            path: File to write
+            render: Builds the file content from a state snapshot; runs in
+                a worker thread
+            min_interval: Minimum seconds between two writes
+            snapshot: Copies the live state on the event loop before it is
+                handed to the worker thread; identity when omitted
+        """
+        self.path = path
+        self._render = render
+        self._snapshot = snapshot or (lambda state: state)
+        self.min_interval = min_interval
+        self._state: Any = None
+        self._dirty = False
+        self._last_write = float("-inf")
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight: Optional[asyncio.Future] = None
+        self.writes = 0
+
+    @property
+    def dirty(self) -> bool:
+        """True if the latest state has not been written yet"""
+        return self._dirty
+
+    def mark_dirty(self, state: Any) -> None:
+        """Record that the file should reflect ``state``"""
+        self._state = state
+        self._dirty = True
+        if self._timer is None and self._inflight is None:
+            self._schedule()
+
+    def _schedule(self) -> None:
+        loop = asyncio.get_running_loop()
+        delay = self._last_write + self.min_interval - loop.time()
+        if delay <= 0:
+            self._start_write()
+        else:
+            self._timer = loop.call_later(delay, self._start_write)
+
+    def _start_write(self) -> None:
+        self._timer = None
+        if not self._dirty:
+            return
+
+        loop = asyncio.get_running_loop()
+        snapshot = self._snapshot(self._state)
+        self._dirty = False
+        self._last_write = loop.time()
+        self.writes += 1
+        self._inflight = loop.run_in_executor(None, self._write, snapshot)
+        self._inflight.add_done_callback(self._on_written)
+
+    def _write(self, snapshot: Any) -> None:
+        atomic_write_text(self.path, self._render(snapshot))
+
+    def _on_written(self, future: asyncio.Future) -> None:
+        self._inflight = None
+        if not future.cancelled() and future.exception() is not None:
+            # Keep the state dirty so the next attempt retries the write
+            self._dirty = True
+        if self._dirty and self._timer is None:
+            self._schedule()
+
+    async def flush(self) -> None:
+        """Write any pending state now and wait for it to reach disk.
+
+        Raises:
+            OSError: If the final write fails
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._inflight is not None:
+            inflight = self._inflight
+            try:
+                await asyncio.shield(inflight)
+            except OSError:
+                pass
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        if self._dirty:
+            snapshot = self._snapshot(self._state)
+            self._dirty = False
+            self._last_write = asyncio.get_running_loop().time()
+            self.writes += 1
+            await asyncio.get_running_loop().run_in_executor(None, self._write, snapshot)
+
+
+class BackgroundWriter:
+    """Write files atomically in a thread pool without awaiting each one.
+
+    Must be used from a running event loop.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Args:
+            max_workers: Files written concurrently
+        """
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="report-writer")
+        self._pending: Set[asyncio.Future] = set()
+        self.writes = 0
+
+    @property
+    def pending(self) -> int:
+        """Writes submitted but not finished"""
+        return len(self._pending)
+
+    def submit(self, path: str, content: str) -> asyncio.Future:
+        """Start writing ``content`` to ``path``; await the result to wait for it"""
+        future = asyncio.get_running_loop().run_in_executor(self._pool, atomic_write_text, path, content)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        self.writes += 1
+        return future
+
+    async def drain(self) -> None:
+        """Wait for every submitted write.
+
+        Raises:
+            OSError: If any of the writes failed; the others still finish
+        """
+        while self._pending:
+            batch = list(self._pending)
+            self._pending.difference_update(batch)
+            results = await asyncio.gather(*batch, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+    def close(self) -> None:
+        """Stop the thread pool after the writes already submitted"""
+        self._pool.shutdown(wait=True)
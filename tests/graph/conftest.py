@@ -3,8 +3,10 @@
 Provides fixtures specific to testing LangGraph workflow nodes.
 """
 
+import subprocess
+
 import pytest
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from unittest.mock import Mock, AsyncMock
 
 
@@ -196,3 +198,57 @@ def mock_verification_result():
         }
 
     return _create_result
+
+
+# ============================================================================
+# GIT REPOSITORY FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def git_identity(monkeypatch):
+    """Author and committer identity for commits made by tests."""
+    for key, value in {
+        "GIT_AUTHOR_NAME": "test", "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "test", "GIT_COMMITTER_EMAIL": "test@example.com",
+    }.items():
+        monkeypatch.setenv(key, value)
+
+
+@pytest.fixture
+def git(git_identity):
+    """Run a git command in a test repository and return its stdout."""
+    def _git(cwd, *args) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+        ).stdout
+
+    return _git
+
+
+@pytest.fixture
+def commit_file(git):
+    """Write a file in a test repository and commit it."""
+    def _commit_file(repo, name: str, content: str, message: str) -> None:
+        (repo / name).write_text(content)
+        git(repo, "add", name)
+        git(repo, "commit", "-q", "-m", message)
+
+    return _commit_file
+
+
+@pytest.fixture
+def init_repo(git, commit_file):
+    """Create a repository with one commit on ``branch``.
+
+    The commit adds ``files`` (name to content), or is empty without them.
+    """
+    def _init_repo(path, branch: str = "main", files: Optional[Dict[str, str]] = None):
+        git(path.parent, "init", "-q", "-b", branch, str(path))
+        if files:
+            for name, content in files.items():
+                commit_file(path, name, content, "init")
+        else:
+            git(path, "commit", "-q", "--allow-empty", "-m", "init")
+        return path
+
+    return _init_repo
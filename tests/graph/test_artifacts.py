@@ -0,0 +1,187 @@
+"""Tests for the content-addressed artifact store."""
+
+import os
+import time
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+
+from graph import artifacts
+from graph.artifacts import (
+    ArtifactStore,
+    externalize,
+    is_artifact_ref,
+    load_artifact,
+    set_artifact_store,
+)
+from graph.nodes.implementation import generate_final_report_node
+from graph.nodes.synthesis import synthesize_planning_node
+from graph.state import SprintWorkflowState
+from graph.routing import should_apply_gap_feedback
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """An artifact store that every node in the test uses."""
+    monkeypatch.delenv(artifacts.ARTIFACT_DIR_ENV, raising=False)
+    store = ArtifactStore(str(tmp_path / "artifacts"), min_bytes=0)
+    set_artifact_store(store)
+    yield store
+    set_artifact_store(None)
+
+
+def payload(n=20):
+    return {"stories": [{"id": f"US-{i}", "points": i % 5} for i in range(n)], "title": "Plan"}
+
+
+class TestArtifactStore:
+    """Tests for ArtifactStore."""
+
+    def test_equal_payloads_share_one_file(self, tmp_path):
+        """Test equal payloads map to one reference and one write."""
+        store = ArtifactStore(str(tmp_path), min_bytes=0)
+        reordered = {"title": "Plan", "stories": payload()["stories"]}
+
+        first = store.put(payload())
+        second = store.put(reordered)
+
+        assert is_artifact_ref(first)
+        assert first == second
+        assert store.writes == 1
+        assert first["$artifact"] in store
+        assert store.get(first) == payload()
+
+    def test_loads_fresh_copies_from_disk(self, tmp_path):
+        """Test another store over the same directory reads the payload back."""
+        ref = ArtifactStore(str(tmp_path), min_bytes=0).put(payload())
+        reader = ArtifactStore(str(tmp_path))
+
+        loaded = reader.get(ref)
+        loaded["stories"].clear()
+
+        assert reader.get(ref) == payload()
+        with pytest.raises(KeyError):
+            reader.get({"$artifact": "0" * 64})
+
+    def test_small_and_unserializable_payloads_stay_inline(self, tmp_path):
+        """Test payloads under min_bytes or not JSON-able are not stored."""
+        store = ArtifactStore(str(tmp_path), min_bytes=1024)
+        unserializable = {"when": object()}
+
+        assert store.put({"a": 1}) == {"a": 1}
+        assert store.put(unserializable) is unserializable
+        assert is_artifact_ref(store.put(payload(100)))
+        assert store.writes == 1
+
+    def test_prune_keeps_referenced_payloads(self, tmp_path):
+        """Test prune removes only payloads outside the keep set."""
+        store = ArtifactStore(str(tmp_path), min_bytes=0)
+        keep = store.put(payload(1))
+        drop = store.put(payload(2))
+
+        assert store.prune([keep["$artifact"]]) == 1
+        assert keep["$artifact"] in store
+        assert drop["$artifact"] not in store
+
+    def test_text_cache_is_bounded(self, tmp_path):
+        """Test cached texts stay under cache_bytes, least recently used out first."""
+        store = ArtifactStore(str(tmp_path), min_bytes=0, cache_bytes=2000)
+        refs = [store.put(payload(n)) for n in (30, 31, 32)]
+
+        assert sum(ref["size"] for ref in refs) > 2000
+        assert store._cached <= 2000
+        assert refs[0]["$artifact"] not in store._texts
+        assert store.get(refs[0]) == payload(30)
+        assert list(store._texts)[-1] == refs[0]["$artifact"]
+        assert ArtifactStore(str(tmp_path), cache_bytes=0).get(refs[1]) == payload(31)
+
+    def test_prune_spares_recently_used_payloads(self, tmp_path):
+        """Test min_age keeps payloads written or reused recently."""
+        store = ArtifactStore(str(tmp_path), min_bytes=0)
+        old = store.put(payload(1))
+        os.utime(store.path(old["$artifact"]), (time.time() - 60,) * 2)
+        recent = store.put(payload(2))
+
+        assert store.prune([], min_age=30) == 1
+        assert old["$artifact"] not in store
+        assert recent["$artifact"] in store
+        assert store.put(payload(1)) == old
+        assert store.get(old) == payload(1)
+
+
+class TestStateReferences:
+    """Tests for storing state fields by reference."""
+
+    def test_without_store_values_stay_inline(self, monkeypatch):
+        """Test externalize is a no-op and refs fail loudly without a store."""
+        monkeypatch.delenv(artifacts.ARTIFACT_DIR_ENV, raising=False)
+        set_artifact_store(None)
+        update = {"synthesized_plan": payload()}
+
+        assert externalize(update) is update
+        assert load_artifact({"gap_analysis": None}, "gap_analysis", {}) is None
+        assert load_artifact({}, "gap_analysis", {}) == {}
+        with pytest.raises(LookupError):
+            load_artifact({"sprint_prd": {"$artifact": "abc", "size": 3}}, "sprint_prd")
+
+    def test_nodes_store_and_resolve_references(
+        self, store, mock_pm_planning_output, mock_ux_planning_output, mock_engineering_output
+    ):
+        """Test synthesis returns references and readers resolve them."""
+        state = {
+            "pm_output": mock_pm_planning_output,
+            "ux_output": mock_ux_planning_output,
+            "engineering_output": mock_engineering_output,
+        }
+
+        result = synthesize_planning_node(state)
+
+        for key in ("synthesized_plan", "pm_output", "ux_output", "engineering_output"):
+            assert is_artifact_ref(result[key])
+        assert load_artifact(result, "pm_output") == mock_pm_planning_output
+        assert load_artifact(result, "synthesized_plan")["_meta"]["inputs_processed"]["pm"] is True
+        assert synthesize_planning_node(result)["synthesized_plan"] == result["synthesized_plan"]
+
+        gap = externalize({"gap_analysis": {
+            "issues_found": [{"severity": "critical"}],
+            "overall_assessment": {"critical_blockers": 1},
+        }})
+        assert should_apply_gap_feedback({**gap, "retry_counts": {}}) == "apply_feedback"
+
+
+class TestPruneArtifacts:
+    """Tests for pruning the store against live checkpoints."""
+
+    def test_prune_keeps_referenced_and_recently_used_payloads(self, store):
+        """Test only old payloads no given checkpoint refers to are deleted."""
+        def plan(state):
+            return externalize({"synthesized_plan": payload(state["sprint_theme"])})
+
+        graph = StateGraph(SprintWorkflowState)
+        graph.add_node("plan", plan)
+        graph.add_node("report", generate_final_report_node)
+        graph.add_edge(START, "plan")
+        graph.add_edge("plan", "report")
+        graph.add_edge("report", END)
+        first_saver, other_saver = MemorySaver(), MemorySaver()
+        config = {"configurable": {"thread_id": "t"}}
+
+        old = time.time() - 2 * artifacts.PRUNE_MIN_AGE
+        orphan = store.put(payload(7))
+        os.utime(store.path(orphan["$artifact"]), (old, old))
+
+        first = graph.compile(checkpointer=first_saver).invoke({"sprint_theme": 5}, config)
+        other = graph.compile(checkpointer=other_saver).invoke({"sprint_theme": 6}, config)
+        # Finishing a sprint does not prune
+        assert orphan["$artifact"] in store
+
+        for ref in (first["synthesized_plan"], other["synthesized_plan"]):
+            os.utime(store.path(ref["$artifact"]), (old, old))
+
+        load_artifact(other, "synthesized_plan")
+
+        assert artifacts.prune_artifacts([first_saver]) == 1
+        assert first["synthesized_plan"]["$artifact"] in store
+        assert other["synthesized_plan"]["$artifact"] in store
+        assert orphan["$artifact"] not in store
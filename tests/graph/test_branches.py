@@ -0,0 +1,82 @@
+"""Tests for concurrent, per-repository branch management."""
+
+import pytest
+
+from graph.branches import BranchManager, group_jobs_by_repo
+from graph.repos import RepoDetector
+
+
+@pytest.fixture
+def sprint_repos(tmp_path, git, commit_file, init_repo):
+    """A clone with two job worktrees, and an upstream that moved on."""
+    upstream = init_repo(tmp_path / "upstream", files={"shared.txt": "base\n"})
+
+    clone = tmp_path / "clone"
+    git(tmp_path, "clone", "-q", str(upstream), str(clone))
+    jobs = []
+    for name, filename in (("alpha", "alpha.txt"), ("clash", "shared.txt")):
+        worktree = tmp_path / f"wt-{name}"
+        git(clone, "worktree", "add", "-q", str(worktree), "-b", f"feat-{name}")
+        commit_file(worktree, filename, f"{name}\n", f"{name} work")
+        jobs.append({"name": name, "branch": f"feat-{name}", "worktree": str(worktree)})
+
+    commit_file(upstream, "shared.txt", "upstream change\n", "upstream")
+    return tmp_path, jobs
+
+
+class TestBranchManager:
+    """Tests for BranchManager."""
+
+    def test_groups_jobs_by_repo_root(self):
+        """Test jobs are grouped by repo_root in order."""
+        jobs = [{"name": "a", "repo_root": "/r1"}, {"name": "b", "repo_root": "/r2"},
+                {"name": "c", "repo_root": "/r1"}, {"name": "d"}]
+
+        groups = group_jobs_by_repo(jobs)
+
+        assert {path: [j["name"] for j in group] for path, group in groups.items()} == {
+            "/r1": ["a", "c"], "/r2": ["b"], "": ["d"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_rebases_with_one_fetch_per_repo(self, sprint_repos, git):
+        """Test branches are rebased after a single fetch and conflicts are aborted."""
+        root, jobs = sprint_repos
+        detector = RepoDetector()
+        repos = await detector.detect([job["worktree"] for job in jobs])
+        paths = await detector.repo_paths([job["worktree"] for job in jobs])
+        for job in jobs:
+            job["repo_root"] = paths[job["worktree"]]
+
+        seen = []
+        manager = BranchManager()
+        results = await manager.update_all(repos, jobs, on_status=seen.append)
+        by_job = {result["job"]: result for result in results}
+
+        assert manager.fetches == {str(root / "clone"): 1}
+        assert by_job["alpha"]["status"] == "rebased"
+        assert by_job["alpha"]["base"] == "origin/main"
+        assert (root / "wt-alpha" / "shared.txt").read_text() == "upstream change\n"
+        assert by_job["clash"]["status"] == "conflict"
+        assert git(root / "wt-clash", "status", "--porcelain") == ""
+        assert seen == results
+
+        again = await manager.update_all(repos, jobs[:1])
+        assert again[0]["status"] == "up_to_date"
+
+    @pytest.mark.asyncio
+    async def test_local_repo_and_missing_worktrees(self, tmp_path):
+        """Test local-only repos rebase onto the local branch and missing worktrees are skipped."""
+        repo = {"path": str(tmp_path), "has_remote": False, "branches": [], "default_branch": "trunk"}
+        jobs = [
+            {"name": "gone", "branch": "feat-gone", "worktree": str(tmp_path / "missing"),
+             "repo_root": str(tmp_path)},
+            {"name": "orphan", "branch": "feat-orphan", "worktree": "", "repo_root": "/unknown"},
+        ]
+
+        results = await BranchManager().update_all([repo], jobs)
+        by_job = {result["job"]: result for result in results}
+
+        assert by_job["gone"]["status"] == "skipped"
+        assert by_job["gone"]["base"] == "trunk"
+        assert by_job["orphan"]["detail"] == "Repository not detected"
@@ -0,0 +1,87 @@
+"""Tests for the process-wide compiled graph cache."""
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+
+from graph.cache import (
+    cached_graph_keys,
+    get_compiled_graph,
+    invalidate_compiled_graphs,
+    make_checkpointer,
+)
+from graph.workflow import build_workflow, compile_workflow
+from graph.workflow_complete import compile_complete_workflow
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start and finish every test with an empty cache."""
+    invalidate_compiled_graphs()
+    yield
+    invalidate_compiled_graphs()
+
+
+class TestCompiledGraphCache:
+    """Tests for get_compiled_graph and invalidation."""
+
+    def test_builds_once_per_key(self):
+        """Test the builder only runs on the first request for a key."""
+        calls = []
+
+        def builder():
+            calls.append(1)
+            return build_workflow()
+
+        first = get_compiled_graph("counted", builder, None)
+        second = get_compiled_graph("counted", builder, None)
+
+        assert first is second
+        assert len(calls) == 1
+
+    def test_memory_checkpointer_is_per_call(self):
+        """Test in-memory apps share the compiled graph but not checkpoints."""
+        first = compile_workflow()
+        second = compile_workflow()
+        config = {"configurable": {"thread_id": "t"}}
+        first.update_state(config, {"project_name": "demo"})
+
+        assert first.nodes["pm_planning"] is second.nodes["pm_planning"]
+        assert first.checkpointer is not second.checkpointer
+        assert first.get_state(config).values["project_name"] == "demo"
+        assert second.get_state(config).values == {}
+
+    def test_checkpointer_configuration_is_part_of_key(self):
+        """Test apps with and without checkpointing are cached separately."""
+        with_memory = get_compiled_graph("workflow", build_workflow, "memory")
+        without = get_compiled_graph("workflow", build_workflow, None)
+
+        assert with_memory is not without
+        assert isinstance(with_memory.checkpointer, MemorySaver)
+        assert without.checkpointer is None
+        assert set(cached_graph_keys()) == {("workflow", "memory"), ("workflow", None)}
+
+    def test_invalidate_by_variant(self):
+        """Test invalidation can target one variant."""
+        get_compiled_graph("a", build_workflow)
+        get_compiled_graph("b", build_workflow)
+
+        assert invalidate_compiled_graphs("a") == 1
+        assert cached_graph_keys() == [("b", "memory")]
+
+    def test_invalidate_forces_recompile(self):
+        """Test a fresh app is compiled after invalidation."""
+        first = compile_workflow(checkpointer=True)
+        invalidate_compiled_graphs()
+
+        assert compile_workflow(checkpointer=True) is not first
+
+    def test_compile_functions_are_cached(self):
+        """Test compile_workflow and compile_complete_workflow reuse apps."""
+        assert compile_workflow(checkpointer=False) is compile_workflow(checkpointer=False)
+        assert compile_complete_workflow(checkpointer=False) is compile_complete_workflow(checkpointer=False)
+        assert compile_workflow(checkpointer=False) is not compile_complete_workflow(checkpointer=False)
+
+    def test_unknown_checkpointer_configuration(self):
+        """Test unknown checkpointer configurations are rejected."""
+        with pytest.raises(ValueError):
+            make_checkpointer("redis")
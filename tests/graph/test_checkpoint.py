@@ -0,0 +1,248 @@
+"""Tests for the durable SQLite checkpointer."""
+
+import operator
+import sqlite3
+import threading
+import time
+from typing import Annotated, List, TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+
+from graph.cache import invalidate_compiled_graphs
+from graph.checkpoint import SqliteCheckpointSaver
+from graph.state import SprintWorkflowState
+from graph.workflow import compile_workflow
+
+
+class CounterState(TypedDict):
+    """Minimal state for resumability tests."""
+
+    steps: Annotated[List[str], operator.add]
+
+
+def build_flaky_graph(calls: List[str], fail_once: List[bool]) -> StateGraph:
+    """Three-node graph whose middle node fails on its first attempt."""
+
+    def first(state):
+        calls.append("first")
+        return {"steps": ["first"]}
+
+    def second(state):
+        calls.append("second")
+        if fail_once:
+            fail_once.pop()
+            raise RuntimeError("process died")
+        return {"steps": ["second"]}
+
+    def third(state):
+        calls.append("third")
+        return {"steps": ["third"]}
+
+    graph = StateGraph(CounterState)
+    graph.add_node("first", first)
+    graph.add_node("second", second)
+    graph.add_node("third", third)
+    graph.add_edge(START, "first")
+    graph.add_edge("first", "second")
+    graph.add_edge("second", "third")
+    graph.add_edge("third", END)
+    return graph
+
+
+def build_jobs_graph(steps: int) -> StateGraph:
+    """Loop that patches two jobs per step, adding one and removing one every third step."""
+
+    def step(state):
+        count = state["retry_counts"].get("step", 0) + 1
+        keys = list(state["jobs"])
+        patches = {keys[count % len(keys)]: {"status": f"step-{count}"},
+                   keys[(count + 1) % len(keys)]: {"retry_count": count}}
+        if count % 3 == 0:
+            patches[f"new-{count}"] = {"name": f"new-{count}", "status": "pending"}
+            patches[keys[0]] = None
+        return {"jobs": patches, "retry_counts": {"step": count}}
+
+    graph = StateGraph(SprintWorkflowState)
+    graph.add_node("step", step)
+    graph.add_edge(START, "step")
+    graph.add_conditional_edges("step", lambda s: "step" if s["retry_counts"]["step"] < steps else END)
+    return graph
+
+
+class TestSqliteCheckpointSaver:
+    """Tests for SqliteCheckpointSaver."""
+
+    def test_uses_wal_mode(self, tmp_path):
+        """Test the database is opened in WAL mode."""
+        saver = SqliteCheckpointSaver(str(tmp_path / "cp.db"))
+        mode = saver._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        saver.close()
+
+        assert mode == "wal"
+
+    def test_round_trip_and_history(self, tmp_path):
+        """Test state and history are readable from the database."""
+        saver = SqliteCheckpointSaver(str(tmp_path / "cp.db"))
+        app = build_flaky_graph([], []).compile(checkpointer=saver)
+        config = {"configurable": {"thread_id": "t1"}}
+
+        result = app.invoke({"steps": []}, config)
+        history = list(app.get_state_history(config))
+
+        assert result["steps"] == ["first", "second", "third"]
+        assert app.get_state(config).values["steps"] == ["first", "second", "third"]
+        assert len(history) == 5
+        assert history[-1].values == {"steps": []}
+        saver.close()
+
+    def test_group_commit_batches_supersteps(self, tmp_path):
+        """Test several checkpoints are committed in one transaction."""
+        saver = SqliteCheckpointSaver(str(tmp_path / "cp.db"), commit_every=100, commit_interval=60)
+        app = build_flaky_graph([], []).compile(checkpointer=saver)
+
+        app.invoke({"steps": []}, {"configurable": {"thread_id": "t1"}})
+        assert saver.commits == 0
+
+        saver.flush()
+        assert saver.commits == 1
+        saver.close()
+
+    def test_timer_commits_idle_batch(self, tmp_path):
+        """Test a batch is committed after commit_interval with no further puts."""
+        db = str(tmp_path / "cp.db")
+        saver = SqliteCheckpointSaver(db, commit_every=100, commit_interval=0.1)
+        app = build_flaky_graph([], []).compile(checkpointer=saver)
+
+        app.invoke({"steps": []}, {"configurable": {"thread_id": "t1"}})
+        time.sleep(0.5)
+
+        assert saver.commits == 1
+        rows = sqlite3.connect(db).execute("SELECT COUNT(*) FROM checkpoints").fetchone()[0]
+        assert rows == 5
+        saver.close()
+
+    @pytest.mark.asyncio
+    async def test_async_api_runs_off_the_event_loop(self, tmp_path):
+        """Test async reads and writes run SQLite in a worker thread."""
+        saver = SqliteCheckpointSaver(str(tmp_path / "cp.db"))
+        threads = set()
+        put = saver.put
+
+        def recording_put(*args):
+            threads.add(threading.current_thread())
+            return put(*args)
+
+        saver.put = recording_put
+        app = build_flaky_graph([], []).compile(checkpointer=saver)
+        config = {"configurable": {"thread_id": "t1"}}
+
+        await app.ainvoke({"steps": []}, config)
+        history = [item async for item in saver.alist(config)]
+
+        assert threads and threading.main_thread() not in threads
+        assert len(history) == 5
+        assert (await saver.aget_tuple(config)).checkpoint["channel_values"]["steps"][-1] == "third"
+        saver.close()
+
+    def test_resume_after_restart(self, tmp_path):
+        """Test a failed run resumes from its last checkpoint in a new process."""
+        db = str(tmp_path / "cp.db")
+        config = {"configurable": {"thread_id": "sprint-demo"}}
+        calls, fail_once = [], [True]
+
+        saver = SqliteCheckpointSaver(db)
+        app = build_flaky_graph(calls, fail_once).compile(checkpointer=saver)
+        with pytest.raises(RuntimeError):
+            app.invoke({"steps": []}, config)
+        saver.close()
+
+        # Simulated restart: fresh saver and app on the same file
+        saver = SqliteCheckpointSaver(db)
+        app = build_flaky_graph(calls, fail_once).compile(checkpointer=saver)
+        assert app.get_state(config).next == ("second",)
+
+        result = app.invoke(None, config)
+        saver.close()
+
+        assert result["steps"] == ["first", "second", "third"]
+        assert calls == ["first", "second", "second", "third"]
+
+    def test_delete_thread(self, tmp_path):
+        """Test deleting a thread removes its checkpoints."""
+        saver = SqliteCheckpointSaver(str(tmp_path / "cp.db"))
+        app = build_flaky_graph([], []).compile(checkpointer=saver)
+        config = {"configurable": {"thread_id": "t1"}}
+        app.invoke({"steps": []}, config)
+
+        saver.delete_thread("t1")
+
+        assert saver.get_tuple(config) is None
+        saver.close()
+
+
+    def test_keyed_channel_stores_changed_entries(self, tmp_path):
+        """Test jobs are stored per entry and rebuilt exactly, in order, after a restart."""
+        db = str(tmp_path / "cp.db")
+        config = {"configurable": {"thread_id": "jobs"}, "recursion_limit": 100}
+        jobs = [{"id": f"job-{i}", "name": f"job-{i}", "status": "pending"} for i in range(200)]
+
+        saver = SqliteCheckpointSaver(db, snapshot_every=8)
+        result = build_jobs_graph(20).compile(checkpointer=saver).invoke({"jobs": jobs, "retry_counts": {}}, config)
+        history = [item.checkpoint["channel_values"].get("jobs") for item in saver.list(config)]
+        entries = saver._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        saver.close()
+
+        # 200 initial entries plus at most three changed ones per step
+        assert entries <= 200 + 3 * 20
+        saver = SqliteCheckpointSaver(db, snapshot_every=8)
+        app = build_jobs_graph(25).compile(checkpointer=saver)
+        assert [item.checkpoint["channel_values"].get("jobs") for item in saver.list(config)] == history
+        assert list(app.get_state(config).values["jobs"].items()) == list(result["jobs"].items())
+
+        resumed = app.invoke({"retry_counts": {"step": 20}}, config)
+        saver.close()
+        expected = build_jobs_graph(25).compile().invoke({"jobs": jobs, "retry_counts": {}})
+        assert list(resumed["jobs"].items()) == list(expected["jobs"].items())
+
+    def test_keyed_channel_notices_in_place_changes(self, tmp_path):
+        """Test an entry mutated in place is stored again, not assumed unchanged."""
+        saver = SqliteCheckpointSaver(str(tmp_path / "cp.db"))
+        jobs = {"a": {"name": "a", "status": "pending"}}
+
+        def step(state):
+            state["jobs"]["a"]["status"] = "verified"
+            return {"jobs": dict(state["jobs"])}
+
+        graph = StateGraph(SprintWorkflowState)
+        graph.add_node("step", step)
+        graph.add_edge(START, "step")
+        graph.add_edge("step", END)
+        config = {"configurable": {"thread_id": "t"}}
+        graph.compile(checkpointer=saver).invoke({"jobs": jobs}, config)
+
+        assert saver.get_tuple(config).checkpoint["channel_values"]["jobs"]["a"]["status"] == "verified"
+        saver.close()
+
+class TestCompileWithCheckpointDb:
+    """Tests for compile functions with a SQLite checkpoint database."""
+
+    @pytest.mark.asyncio
+    async def test_compile_workflow_with_checkpoint_db(self, tmp_path, sample_sprint_state):
+        """Test workflow state written through SQLite survives recompiling."""
+        db = str(tmp_path / "sprint.db")
+        config = {"configurable": {"thread_id": "sqlite-workflow"}}
+        try:
+            app = compile_workflow(checkpoint_db=db)
+            assert isinstance(app.checkpointer, SqliteCheckpointSaver)
+            assert compile_workflow(checkpoint_db=db) is app
+
+            await app.aupdate_state(config, sample_sprint_state)
+            invalidate_compiled_graphs()
+
+            reopened = compile_workflow(checkpoint_db=db)
+            assert reopened is not app
+            snapshot = await reopened.aget_state(config)
+            assert snapshot.values["project_name"] == sample_sprint_state["project_name"]
+        finally:
+            invalidate_compiled_graphs()
@@ -0,0 +1,134 @@
+"""Tests for the column-oriented job table."""
+
+from typing import Annotated, Any, List, TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+
+from graph.checkpoint import SqliteCheckpointSaver
+from graph.jobtable import JobTable, JobTableChannel
+from graph.registry import JobRegistry
+
+
+class TableState(TypedDict, total=False):
+    """State whose jobs live in a JobTableChannel."""
+
+    jobs: Annotated[List[Any], JobTableChannel(list)]
+    seen: str
+
+
+def make_job(name, status="pending", points=3, **fields):
+    """Build a job dict with the usual fields."""
+    return {
+        "name": name,
+        "status": status,
+        "story_points": points,
+        "retry_count": 0,
+        "worktree": f"/work/feat-{name}",
+        "repo_root": "/repo",
+        "todos": ["Implement", "Test"],
+        "dependencies": [],
+        **fields,
+    }
+
+
+class TestJobTable:
+    """Tests for JobTable."""
+
+    def test_round_trips_jobs(self):
+        """Test to_jobs returns dicts equal to the input, including odd values."""
+        jobs = [
+            make_job("a", error_message=None, test_timeout=30.0),
+            {"name": "b"},
+            make_job("c", status="blocked", points=2.5, extra={"k": [1]}),
+            make_job("d", files_to_modify=["src/x.py"], failed_tests=["t::one"], id="job-d"),
+            make_job("e", todos=["two\nlines"], failed_tests=[""]),
+            make_job("f", todos=[]),
+        ]
+
+        table = JobTable(jobs)
+
+        assert table.to_jobs() == jobs
+        assert table.get("c") == jobs[2]
+        assert list(table.to_mapping()) == ["a", "b", "c", "job-d", "e", "f"]
+        assert JobTable.from_state({"jobs": table.to_mapping()}).to_jobs() == jobs
+
+    def test_updates_move_values_between_columns_and_overflow(self):
+        """Test patches that change a field's type still round-trip."""
+        table = JobTable([make_job("a")])
+
+        table.update("a", {"status": "parked", "story_points": "large"})
+        assert table.get("a")["status"] == "parked"
+        assert table.status_of("a") == "parked"
+        assert table.points() == 0
+
+        table.update("a", {"status": "verified", "story_points": 5})
+        assert table.get("a") == make_job("a", status="verified", points=5)
+        assert table.overflow == {}
+
+    def test_aggregates_match_registry(self):
+        """Test counts, points and name lists agree with JobRegistry."""
+        statuses = ["pending", "implementing", "verifying", "verified", "failed"]
+        jobs = [make_job(f"job-{i}", statuses[i % 5], points=i % 8) for i in range(100)]
+        table = JobTable(jobs)
+        registry = JobRegistry([dict(job) for job in jobs])
+
+        assert table.counts() == registry.counts()
+        assert table.points_by_status() == registry.points_by_status()
+        assert table.points() == registry.points()
+        for status in statuses:
+            assert table.names_in(status) == registry.names(status)
+
+    def test_set_status_and_sync_state(self):
+        """Test status changes show up in the synced status lists."""
+        table = JobTable([make_job("a"), make_job("b"), {"name": "c"}])
+        table.set_status("b", "verified")
+        state = {}
+
+        table.sync_state(state)
+
+        assert state["jobs_verified"] == ["b"]
+        assert state["jobs_failed"] == []
+        assert table.counts()["pending"] == 2
+        assert "status" not in table.get("c")
+
+    def test_names_are_interned_and_unique(self):
+        """Test repeated strings share one object and duplicates are rejected."""
+        table = JobTable([make_job("a"), make_job("b", dependencies=["".join(["a"])])])
+
+        assert table.lists["dependencies"][1][0] is table.names[0]
+        assert table.strs["repo_root"][0] is table.strs["repo_root"][1]
+        with pytest.raises(ValueError):
+            table.append(make_job("a"))
+        with pytest.raises(KeyError):
+            table.get("missing")
+
+
+class TestJobTableChannel:
+    """Tests for JobTableChannel."""
+
+    def test_nodes_see_a_table_and_checkpoints_hold_dicts(self, tmp_path):
+        """Test job lists become a table in state and plain dicts on disk."""
+        def verify(state):
+            registry = JobRegistry.from_state(state)
+            registry.transition("a", "verified")
+            return {"jobs": registry.table, "seen": type(state["jobs"]).__name__}
+
+        graph = StateGraph(TableState)
+        graph.add_node("verify", verify)
+        graph.add_edge(START, "verify")
+        graph.add_edge("verify", END)
+        saver = SqliteCheckpointSaver(str(tmp_path / "cp.db"))
+        app = graph.compile(checkpointer=saver)
+        config = {"configurable": {"thread_id": "t"}}
+
+        result = app.invoke({"jobs": [make_job("a"), make_job("b")]}, config)
+        stored = saver.get_tuple(config).checkpoint["channel_values"]["jobs"]
+        loaded = app.get_state(config).values["jobs"]
+        saver.close()
+
+        assert result["seen"] == "JobTable"
+        assert isinstance(result["jobs"], JobTable)
+        assert stored == [make_job("a", "verified"), make_job("b")]
+        assert isinstance(loaded, JobTable)
+        assert loaded.to_jobs() == stored
@@ -0,0 +1,125 @@
+"""Tests for the batching, bisecting merge train."""
+
+import pytest
+
+from graph.merge_train import INTEGRATION_REF, MergeTrain
+from graph.state import RepoInfo
+
+
+# Fails if any branch in the candidate added bad.txt
+TEST_COMMAND = "sh -c 'test ! -e bad.txt'"
+
+
+@pytest.fixture
+def make_branches(git, commit_file):
+    """Create one branch per (job name, file) off main, returning jobs."""
+    def _make_branches(repo, files):
+        jobs = []
+        for name, filename in files:
+            git(repo, "checkout", "-q", "-b", f"feat-{name}", "main")
+            commit_file(repo, filename, f"{name}\n", f"{name} work")
+            jobs.append({"name": name, "branch": f"feat-{name}", "repo_root": str(repo)})
+        git(repo, "checkout", "-q", "main")
+        return jobs
+
+    return _make_branches
+
+
+@pytest.fixture
+def local_repo(tmp_path, init_repo):
+    """A local-only repository with main checked out."""
+    repo = init_repo(tmp_path / "repo", files={"README.md": "base\n"})
+    info = RepoInfo(path=str(repo), has_remote=False, branches=["main"], default_branch="main")
+    return repo, info
+
+
+class TestMergeTrain:
+    """Tests for MergeTrain."""
+
+    @pytest.mark.asyncio
+    async def test_clean_batch_costs_one_test_run(self, local_repo, make_branches, git):
+        """Test N clean branches land together after a single test run."""
+        repo, info = local_repo
+        jobs = make_branches(repo, [(n, f"{n}.txt") for n in ("a", "b", "c", "d")])
+
+        train = MergeTrain(test_command=TEST_COMMAND)
+        results = await train.run([info], jobs)
+
+        assert [r["status"] for r in results] == ["merged"] * 4
+        assert train.test_runs == {str(repo): 1}
+        assert all((repo / f"{n}.txt").exists() for n in ("a", "b", "c", "d"))
+        assert git(repo, "rev-parse", "main") == git(repo, "rev-parse", INTEGRATION_REF)
+
+    @pytest.mark.asyncio
+    async def test_bisects_to_the_failing_branch(self, local_repo, make_branches):
+        """Test a failing batch is bisected and only the offender is rejected."""
+        repo, info = local_repo
+        jobs = make_branches(repo, [("a", "a.txt"), ("b", "b.txt"), ("c", "c.txt"), ("bad", "bad.txt")])
+
+        seen = []
+        train = MergeTrain(test_command=TEST_COMMAND)
+        results = await train.run([info], jobs, on_result=seen.append)
+        by_job = {r["job"]: r for r in results}
+
+        assert by_job["bad"]["status"] == "rejected"
+        assert "Exit code 1" in by_job["bad"]["detail"]
+        assert [by_job[n]["status"] for n in ("a", "b", "c")] == ["merged"] * 3
+        assert train.test_runs[str(repo)] == 5
+        assert not (repo / "bad.txt").exists()
+        assert (repo / "c.txt").exists()
+        assert len(seen) == 4
+
+    @pytest.mark.asyncio
+    async def test_conflicting_branch_is_left_out_of_the_batch(self, local_repo, make_branches, git):
+        """Test a branch that does not stack cleanly is reported and skipped."""
+        repo, info = local_repo
+        jobs = make_branches(repo, [("first", "README.md"), ("second", "README.md"), ("other", "o.txt")])
+
+        train = MergeTrain(test_command=TEST_COMMAND)
+        results = await train.run([info], jobs)
+        by_job = {r["job"]: r for r in results}
+
+        assert by_job["second"]["status"] == "conflict"
+        assert by_job["first"]["status"] == by_job["other"]["status"] == "merged"
+        assert train.test_runs == {str(repo): 1}
+        assert (repo / "README.md").read_text() == "first\n"
+        assert not git(repo, "status", "--porcelain")
+
+    @pytest.mark.asyncio
+    async def test_max_batch_splits_the_train(self, local_repo, make_branches):
+        """Test max_batch limits how many branches share a test run."""
+        repo, info = local_repo
+        jobs = make_branches(repo, [(n, f"{n}.txt") for n in ("a", "b", "c")])
+
+        train = MergeTrain(test_command=TEST_COMMAND, max_batch=2)
+        results = await train.run([info], jobs)
+
+        assert [r["batch"] for r in results] == [0, 0, 1]
+        assert train.test_runs == {str(repo): 2}
+
+    @pytest.mark.asyncio
+    async def test_pushes_to_remote(self, tmp_path, git, commit_file, make_branches):
+        """Test repositories with a remote land on origin's default branch."""
+        upstream = tmp_path / "upstream.git"
+        git(tmp_path, "init", "-q", "--bare", "-b", "main", str(upstream))
+        clone = tmp_path / "clone"
+        git(tmp_path, "clone", "-q", str(upstream), str(clone))
+        git(clone, "checkout", "-q", "-b", "main")
+        commit_file(clone, "README.md", "base\n", "init")
+        git(clone, "push", "-q", "origin", "main")
+        jobs = make_branches(clone, [("a", "a.txt"), ("b", "b.txt")])
+        info = RepoInfo(path=str(clone), has_remote=True, branches=["main"], default_branch="main")
+
+        train = MergeTrain(test_command=TEST_COMMAND)
+        results = await train.run([info], jobs)
+
+        assert [r["status"] for r in results] == ["merged", "merged"]
+        landed = git(upstream, "ls-tree", "--name-only", "main").split()
+        assert {"a.txt", "b.txt", "README.md"} == set(landed)
+
+    @pytest.mark.asyncio
+    async def test_unknown_repo_is_skipped(self):
+        """Test jobs without a detected repository are skipped."""
+        results = await MergeTrain().run([], [{"name": "x", "branch": "feat-x"}])
+
+        assert results[0]["status"] == "skipped"
@@ -0,0 +1,88 @@
+"""Tests for the file-overlap index."""
+
+import pytest
+
+from graph.nodes.prd import create_jobs_node
+from graph.overlap import OverlapIndex
+
+
+def job(name, *files, repo=""):
+    return {"name": name, "files_to_modify": list(files), "repo_root": repo}
+
+
+JOBS = [
+    job("auth", "src/auth.py", "src/db.py"),
+    job("docs", "README.md"),
+    job("db", "./src/db.py", "src/models.py"),
+    job("models", "src/models.py"),
+    job("ui", "web/app.js"),
+]
+
+
+class TestOverlapIndex:
+    """Tests for OverlapIndex."""
+
+    def test_inverted_index_and_matrix(self):
+        """Test files map to jobs and the matrix counts shared files."""
+        index = OverlapIndex(JOBS)
+
+        assert index.files["src/db.py"] == ["auth", "db"]
+        assert index.overlaps("db") == {"auth": 1, "models": 1}
+        assert index.overlaps("docs") == {}
+
+    def test_same_path_in_different_repos_does_not_overlap(self):
+        """Test file paths are scoped to the job's repository."""
+        index = OverlapIndex([job("a", "x.py", repo="/r1"), job("b", "x.py", repo="/r2")])
+
+        assert index.overlaps("a") == {}
+
+    def test_merge_order_puts_isolated_jobs_first(self):
+        """Test non-overlapping jobs come first and groups stay contiguous."""
+        index = OverlapIndex(JOBS)
+
+        assert index.groups() == [["auth", "db", "models"], ["docs"], ["ui"]]
+        assert index.merge_order(["models", "ui", "auth", "docs", "db"]) == [
+            "ui", "docs", "models", "auth", "db",
+        ]
+
+    def test_groups_only_count_given_jobs(self):
+        """Test overlaps through a job outside the subset are ignored."""
+        index = OverlapIndex(JOBS)
+
+        assert index.groups(["auth", "models"]) == [["auth"], ["models"]]
+
+    def test_stats(self):
+        """Test overlap statistics summarize the sprint's conflict risk."""
+        stats = OverlapIndex(JOBS).stats()
+
+        assert stats["jobs"] == 5
+        assert stats["shared_files"] == 2
+        assert stats["overlapping_pairs"] == 2
+        assert stats["overlapping_jobs"] == 3
+        assert stats["groups"] == 1
+        assert stats["largest_group"] == 3
+        assert set(stats["hot_files"]) == {"src/db.py", "src/models.py"}
+
+    def test_round_trips_through_state(self):
+        """Test the index survives to_dict and from_state."""
+        index = OverlapIndex(JOBS)
+
+        restored = OverlapIndex.from_state({"file_overlap": index.to_dict()})
+
+        assert restored.to_dict() == index.to_dict()
+        assert OverlapIndex.from_state({"jobs": JOBS}).to_dict() == index.to_dict()
+
+    @pytest.mark.asyncio
+    async def test_create_jobs_stores_index(self):
+        """Test the index is built once when jobs are created."""
+        stories = [
+            {"id": "US-1", "files_to_modify": ["src/db.py"]},
+            {"id": "US-2", "files_to_modify": ["src/db.py", "web/app.js"]},
+            {"id": "US-3"},
+        ]
+
+        result = await create_jobs_node({"sprint_prd": {"user_stories": stories}})
+
+        index = OverlapIndex.from_state(result)
+        assert index.files["src/db.py"] == ["US-1", "US-2"]
+        assert index.merge_order(["US-1", "US-2", "US-3"]) == ["US-3", "US-1", "US-2"]
@@ -0,0 +1,88 @@
+"""Tests for the bounded job worker pool."""
+
+import asyncio
+
+import pytest
+
+from graph.nodes.implementation import parallel_implementation_node
+from graph.pool import run_job_pool
+
+
+class TestRunJobPool:
+    """Tests for run_job_pool."""
+
+    @pytest.mark.asyncio
+    async def test_freed_slot_starts_next_job(self):
+        """Test a slow job does not hold up the jobs queued behind it."""
+        durations = {"slow": 0.2, "a": 0.01, "b": 0.01, "c": 0.01}
+        jobs = [{"name": name} for name in durations]
+        started = []
+
+        async def worker(job):
+            await asyncio.sleep(durations[job["name"]])
+            return job["name"].upper()
+
+        results = await run_job_pool(jobs, worker, 2, on_start=lambda job: started.append(job["name"]))
+        by_name = {r["job"]: r for r in results}
+
+        assert started == ["slow", "a", "b", "c"]
+        assert [r["job"] for r in results] == ["a", "b", "c", "slow"]
+        assert by_name["c"]["queue_wait"] < 0.1
+        assert by_name["slow"]["run_time"] >= 0.2
+        assert by_name["a"]["result"] == "A"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """Test no more than pool_size workers run at once."""
+        running, peak = 0, 0
+
+        async def worker(job):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await run_job_pool([{"name": str(i)} for i in range(20)], worker, 3)
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_worker_errors_are_recorded(self):
+        """Test one failing job does not stop the others."""
+        async def worker(job):
+            if job["name"] == "bad":
+                raise RuntimeError("boom")
+            return "ok"
+
+        results = await run_job_pool([{"name": "bad"}, {"name": "good"}], worker, 1)
+        by_name = {r["job"]: r for r in results}
+
+        assert by_name["bad"]["error"] == "boom"
+        assert by_name["good"]["result"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_empty_job_list(self):
+        """Test an empty pool returns immediately."""
+        async def worker(job):
+            raise AssertionError("not called")
+
+        assert await run_job_pool([], worker, 3) == []
+
+
+class TestParallelImplementationNode:
+    """Tests for parallel_implementation_node."""
+
+    @pytest.mark.asyncio
+    async def test_all_pending_jobs_are_implemented(self):
+        """Test every pending job runs, not just the first pool_size."""
+        jobs = [{"id": f"job-{i}", "name": f"US-{i}", "status": "pending"} for i in range(7)]
+        jobs.append({"id": "job-done", "name": "US-done", "status": "verified"})
+
+        earlier = {"job-done": {"queue_wait": 0.0, "run_time": 1.0}}
+        result = await parallel_implementation_node({"jobs": jobs, "pool_size": 3, "job_timings": earlier})
+
+        assert sorted(result["jobs_implementing"]) == sorted(f"job-{i}" for i in range(7))
+        # Only the jobs that ran; the state's merge_dicts reducer keeps the rest
+        assert set(result["job_timings"]) == set(result["jobs_implementing"])
+        assert jobs[-1]["status"] == "verified"
@@ -0,0 +1,99 @@
+"""Tests for the indexed job registry."""
+
+import pytest
+
+from graph.registry import JobRegistry
+
+
+def make_job(name, status="pending", points=3):
+    """Build a minimal job dict."""
+    return {"name": name, "status": status, "story_points": points, "retry_count": 0}
+
+
+class TestJobRegistry:
+    """Tests for JobRegistry."""
+
+    def test_indexes_by_name_and_status(self):
+        """Test jobs are found by name and grouped by status."""
+        jobs = [make_job("a"), make_job("b", "verified", 5), make_job("c")]
+        registry = JobRegistry(jobs)
+
+        assert registry.get("b") == jobs[1]
+        assert registry.get("b") is not jobs[1]
+        assert registry.names("pending") == ["a", "c"]
+        assert registry.count("verified") == 1
+        assert registry.points("pending") == 6
+        assert registry.points() == 11
+        assert "a" in registry and "z" not in registry
+        assert len(registry) == 3
+
+    def test_transition_updates_job_indices_and_points(self):
+        """Test a transition moves the job and its story points."""
+        jobs = [make_job("a", points=2), make_job("b", points=8)]
+        registry = JobRegistry(jobs)
+
+        registry.transition("b", "implementing")
+        registry.transition("b", "verified")
+        registry.transition("a", "failed")
+
+        assert registry.get("b")["status"] == "verified"
+        assert jobs[1]["status"] == "pending"
+        assert registry.counts() == {
+            "pending": 0, "implementing": 0, "verifying": 0, "verified": 1, "failed": 1,
+        }
+        assert registry.points_by_status()["verified"] == 8
+        assert registry.points("failed") == 2
+        assert registry.points() == 10
+
+    def test_update_patches_job_and_moves_status(self):
+        """Test update merges fields and moves the job if its status changes."""
+        registry = JobRegistry([make_job("a", points=2), make_job("b")])
+
+        job = registry.update("a", {"status": "failed", "error_message": "boom"})
+        registry.update("b", {"retry_count": 2})
+
+        assert job == {**make_job("a", "failed", 2), "error_message": "boom"}
+        assert registry.names("failed") == ["a"]
+        assert registry.points("failed") == 2
+        assert registry.get("b")["retry_count"] == 2
+        assert registry.names("pending") == ["b"]
+
+    def test_duplicate_names_rejected(self):
+        """Test two jobs cannot share a name."""
+        with pytest.raises(ValueError):
+            JobRegistry([make_job("a"), make_job("a")])
+
+    def test_unknown_job_raises_key_error(self):
+        """Test lookups of unknown jobs fail loudly."""
+        with pytest.raises(KeyError):
+            JobRegistry().get("missing")
+
+    def test_state_round_trip_keeps_list_order(self):
+        """Test status lists are rebuilt in their original order."""
+        state = {
+            "jobs": [make_job("a", "verified"), make_job("b", "verified"), make_job("c", "failed")],
+            "jobs_verified": ["b", "a"],
+            "jobs_failed": ["c"],
+        }
+        registry = JobRegistry.from_state(state)
+        registry.transition("c", "verifying")
+        registry.sync_state(state)
+
+        assert state["jobs_verified"] == ["b", "a"]
+        assert state["jobs_failed"] == []
+        assert state["jobs_verifying"] == ["c"]
+        assert state["jobs_implementing"] == []
+        assert state["jobs"] is registry.table
+        assert state["jobs"].get("c")["status"] == "verifying"
+
+    def test_from_state_ignores_stale_list_entries(self):
+        """Test list entries that disagree with job status are dropped."""
+        state = {
+            "jobs": [make_job("a", "implementing")],
+            "jobs_verifying": ["a", "ghost"],
+        }
+
+        registry = JobRegistry.from_state(state)
+
+        assert registry.names("implementing") == ["a"]
+        assert registry.names("verifying") == []
@@ -0,0 +1,84 @@
+"""Tests for concurrent repository detection."""
+
+import pytest
+
+import graph.repos
+from graph.repos import RepoDetector
+
+
+@pytest.fixture
+def repos(tmp_path, git, init_repo):
+    """A local repo with two worktrees and a clone with an origin remote."""
+    local = init_repo(tmp_path / "local", branch="trunk")
+    git(local, "worktree", "add", "-q", str(tmp_path / "wt-a"), "-b", "feat-a")
+    git(local, "worktree", "add", "-q", str(tmp_path / "wt-b"), "-b", "feat-b")
+
+    upstream = init_repo(tmp_path / "upstream")
+    git(tmp_path, "clone", "-q", str(upstream), str(tmp_path / "clone"))
+
+    return tmp_path
+
+
+class TestRepoDetector:
+    """Tests for RepoDetector."""
+
+    @pytest.mark.asyncio
+    async def test_worktrees_of_one_repo_are_grouped(self, repos):
+        """Test worktrees sharing a common dir produce one repo."""
+        detector = RepoDetector(max_concurrency=2)
+
+        found = await detector.detect([
+            str(repos / "wt-a"), str(repos / "wt-b"), str(repos / "local"), str(repos / "clone"),
+        ])
+
+        assert [repo["path"] for repo in found] == [str(repos / "local"), str(repos / "clone")]
+        local, clone = found
+        assert local["has_remote"] is False
+        assert sorted(local["branches"]) == ["feat-a", "feat-b", "trunk"]
+        assert local["default_branch"] == "trunk"
+        assert clone["has_remote"] is True
+        assert clone["default_branch"] == "main"
+
+    @pytest.mark.asyncio
+    async def test_results_are_cached(self, repos):
+        """Test a second detection does not run git again."""
+        detector = RepoDetector()
+        worktrees = [str(repos / "wt-a"), str(repos / "wt-b")]
+
+        first = await detector.detect(worktrees)
+        calls = detector.git_calls
+        second = await detector.detect(worktrees)
+
+        # One rev-parse per worktree plus four queries for the single repo
+        assert calls == 6
+        assert detector.git_calls == calls
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_missing_and_non_git_paths_are_skipped(self, tmp_path):
+        """Test paths that are not git worktrees are ignored."""
+        (tmp_path / "plain").mkdir()
+        detector = RepoDetector()
+
+        found = await detector.detect([str(tmp_path / "missing"), str(tmp_path / "plain")])
+
+        assert found == []
+
+    @pytest.mark.asyncio
+    async def test_git_failures_skip_the_entry(self, repos, monkeypatch):
+        """Test a worktree git cannot run in is skipped, not fatal."""
+        real_run_git = graph.repos.run_git
+
+        async def flaky_run_git(cwd, *args):
+            if cwd.endswith("wt-b"):
+                raise FileNotFoundError("git")
+            return await real_run_git(cwd, *args)
+
+        monkeypatch.setattr(graph.repos, "run_git", flaky_run_git)
+        detector = RepoDetector()
+        worktrees = [str(repos / "wt-b"), str(repos / "clone")]
+
+        found = await detector.detect(worktrees)
+
+        assert [repo["path"] for repo in found] == [str(repos / "clone")]
+        assert await detector.repo_paths(worktrees) == {str(repos / "clone"): str(repos / "clone")}
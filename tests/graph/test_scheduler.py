@@ -0,0 +1,90 @@
+"""Tests for the dependency-aware job scheduler."""
+
+import pytest
+
+from graph.nodes.implementation import parallel_implementation_node
+from graph.routing import should_continue_verification
+from graph.scheduler import JobGraph
+from graph.state import patch_jobs
+
+
+def job(name, points=1, deps=()):
+    """Build a minimal job dict."""
+    return {"name": name, "id": name, "story_points": points, "dependencies": list(deps), "status": "pending"}
+
+
+class TestJobGraph:
+    """Tests for JobGraph."""
+
+    def test_ready_waits_for_verified_dependencies(self):
+        """Test a job is ready only once all its dependencies are verified."""
+        graph = JobGraph([job("a"), job("b"), job("c", deps=["a", "b"])])
+
+        assert set(graph.ready({"a": "pending", "b": "pending", "c": "pending"})) == {"a", "b"}
+        assert graph.ready({"a": "verified", "b": "implementing", "c": "pending"}) == []
+        assert graph.ready({"a": "verified", "b": "verified", "c": "pending"}) == ["c"]
+
+    def test_ready_orders_by_critical_path(self):
+        """Test the head of the heaviest chain starts first."""
+        jobs = [
+            job("quick", 8),
+            job("head", 1), job("mid", 5, ["head"]), job("tail", 13, ["mid"]),
+            job("other", 3),
+        ]
+        graph = JobGraph(jobs)
+
+        assert graph.priority["head"] == 19
+        assert graph.ready({}) == ["head", "quick", "other"]
+        assert graph.critical_path() == ["head", "mid", "tail"]
+
+    def test_failure_blocks_only_downstream_jobs(self):
+        """Test a failed job blocks its dependents but not independent work."""
+        graph = JobGraph([job("a"), job("b", deps=["a"]), job("c", deps=["b"]), job("d")])
+        statuses = {"a": "failed", "b": "pending", "c": "pending", "d": "pending"}
+
+        blocked = graph.blocked(statuses)
+
+        assert set(blocked) == {"b", "c"}
+        assert "a" in blocked["b"]
+        assert graph.ready(statuses) == ["d"]
+
+    def test_cycles_are_blocked(self):
+        """Test jobs on a dependency cycle are reported, not scheduled."""
+        graph = JobGraph([job("a", deps=["b"]), job("b", deps=["a"]), job("c")])
+
+        assert graph.cyclic == {"a", "b"}
+        assert graph.blocked({}) == {"a": "Dependency cycle", "b": "Dependency cycle"}
+        assert graph.ready({}) == ["c"]
+
+    def test_unknown_dependencies_are_blocked(self):
+        """Test dependencies on jobs outside the sprint are reported, not scheduled."""
+        graph = JobGraph([job("a", deps=["elsewhere"]), job("b", deps=["a"]), job("c")])
+
+        assert graph.unknown == {"a": ["elsewhere"]}
+        assert graph.ready({}) == ["c"]
+        assert graph.blocked({}) == {
+            "a": "Unknown dependency: elsewhere",
+            "b": "Blocked by failed dependency: a",
+        }
+
+
+class TestDependencyWaves:
+    """Tests for dependency waves through the implementation node."""
+
+    @pytest.mark.asyncio
+    async def test_dependents_wait_for_next_wave(self):
+        """Test dependents start only after verification, via routing."""
+        jobs = [job("a"), job("b", deps=["a"])]
+
+        first = await parallel_implementation_node({"jobs": jobs, "pool_size": 2})
+        assert first["jobs_implementing"] == ["a"]
+        assert first["jobs"] == {"a": {"status": "implementing"}}
+
+        jobs = patch_jobs(jobs, {"a": {"status": "verified"}})
+        assert should_continue_verification({"jobs": jobs}) == "implement"
+
+        second = await parallel_implementation_node(
+            {"jobs": jobs, "pool_size": 2, "jobs_verified": ["a"], "jobs_implementing": ["a"]}
+        )
+        assert second["jobs_implementing"] == ["b"]
+        assert second["jobs_verified"] == ["a"]
@@ -0,0 +1,147 @@
+"""Tests for the versioned checkpoint serializer."""
+
+import operator
+from datetime import datetime, timezone
+from typing import Annotated, Any, Dict, List, TypedDict
+
+import pytest
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import Send
+
+from graph.checkpoint import SqliteCheckpointSaver
+from graph.jobtable import JobTable
+from graph.serde import (
+    CODEC_ENV,
+    CheckpointSerializer,
+    LangGraphSerializer,
+    make_serializer,
+    migration,
+)
+
+
+STATE = {
+    "project_name": "demo",
+    "jobs": {"job-1": {"name": "a", "status": "pending", "story_points": 3, "todos": ["x", "y"]}},
+    "retry_counts": {"verification": 2},
+    "progress": 0.5,
+    "error": None,
+}
+
+
+class JobsState(TypedDict, total=False):
+    """Minimal state whose jobs change shape between schema versions."""
+
+    jobs: Any
+    log: Annotated[List[str], operator.add]
+
+
+class TestCheckpointSerializer:
+    """Tests for CheckpointSerializer."""
+
+    @pytest.mark.parametrize("codec", ["msgpack", "json"])
+    def test_round_trips_plain_state_with_version_tag(self, codec):
+        """Test plain state round-trips under a versioned type tag."""
+        serde = CheckpointSerializer(codec)
+
+        type_, data = serde.dumps_typed(STATE)
+
+        assert type_ == f"sw{serde.version}:{codec}"
+        assert serde.loads_typed((type_, data)) == STATE
+        assert serde.fallbacks == 0
+
+    @pytest.mark.parametrize("codec", ["msgpack", "json"])
+    def test_falls_back_for_other_values(self, codec):
+        """Test values the codec cannot hold go through the fallback."""
+        serde = CheckpointSerializer(codec)
+        values = [
+            datetime(2025, 1, 2, tzinfo=timezone.utc),
+            Send("node", {"job": "a"}),
+            {1: "int key"},
+            b"raw bytes",
+        ]
+
+        for value in values:
+            assert serde.loads_typed(serde.dumps_typed(value)) == value
+        assert serde.fallbacks == (2 if codec == "msgpack" else 4)
+        assert serde.dumps_typed(values[0])[0].startswith(f"sw{serde.version}:fallback:")
+
+    @pytest.mark.parametrize("serde", [CheckpointSerializer("msgpack"), CheckpointSerializer("json"), LangGraphSerializer()])
+    def test_job_tables_are_written_as_job_dicts(self, serde):
+        """Test a JobTable is stored as the JobSpec list it holds."""
+        jobs = [{"name": "a", "status": "verified", "story_points": 3}, {"name": "b"}]
+
+        assert serde.loads_typed(serde.dumps_typed(JobTable(jobs))) == jobs
+        if isinstance(serde, CheckpointSerializer):
+            assert serde.loads_typed(serde.dumps_typed({"jobs": JobTable(jobs)})) == {"jobs": jobs}
+
+    def test_reads_headerless_checkpoints_as_version_zero(self):
+        """Test values written by LangGraph's serializer load and migrate."""
+        seen = []
+        serde = CheckpointSerializer(migrations={0: lambda channel, value: seen.append(channel) or value})
+        legacy = JsonPlusSerializer().dumps_typed(STATE)
+
+        assert serde.loads_channel("jobs", legacy) == STATE
+        assert seen == ["jobs"]
+
+    def test_migrations_run_in_order_and_newer_versions_fail(self):
+        """Test each migration step runs once, oldest first."""
+        registry: Dict[int, Any] = {}
+
+        @migration(1, registry)
+        def add_one(channel, value):
+            return value + [1]
+
+        @migration(2, registry)
+        def add_two(channel, value):
+            return value + [2]
+
+        with pytest.raises(ValueError):
+            migration(1, registry)(add_one)
+        old = CheckpointSerializer(version=1).dumps_typed([])
+        newer = CheckpointSerializer(version=4).dumps_typed([])
+
+        assert CheckpointSerializer(version=3, migrations=registry).loads_typed(old) == [1, 2]
+        with pytest.raises(ValueError):
+            CheckpointSerializer(version=3, migrations=registry).loads_typed(newer)
+
+    def test_make_serializer_reads_environment(self, monkeypatch):
+        """Test the codec comes from the environment unless given."""
+        monkeypatch.setenv(CODEC_ENV, "json")
+
+        assert make_serializer().codec == "json"
+        assert make_serializer("msgpack").codec == "msgpack"
+        assert isinstance(make_serializer("langgraph"), LangGraphSerializer)
+        with pytest.raises(ValueError):
+            make_serializer("yaml")
+
+
+class TestSaverMigration:
+    """Tests for migrations applied by the SQLite checkpointer."""
+
+    def test_saver_migrates_channels_of_old_checkpoints(self, tmp_path):
+        """Test a checkpoint from an older schema is upgraded per channel on resume."""
+        def build():
+            graph = StateGraph(JobsState)
+            graph.add_node("work", lambda state: {"log": [f"jobs is a {type(state['jobs']).__name__}"]})
+            graph.add_edge(START, "work")
+            graph.add_edge("work", END)
+            return graph
+
+        db = str(tmp_path / "cp.db")
+        config = {"configurable": {"thread_id": "t"}}
+        saver = SqliteCheckpointSaver(db, serde=CheckpointSerializer(version=1))
+        build().compile(checkpointer=saver).invoke({"jobs": [{"name": "a"}], "log": []}, config)
+        saver.close()
+
+        def jobs_by_name(channel, value):
+            if channel == "jobs" and isinstance(value, list):
+                return {job["name"]: job for job in value}
+            return value
+
+        saver = SqliteCheckpointSaver(db, serde=CheckpointSerializer(version=2, migrations={1: jobs_by_name}))
+        state = build().compile(checkpointer=saver).get_state(config)
+        saver.close()
+
+        assert state.values["jobs"] == {"a": {"name": "a"}}
+        assert state.values["log"] == ["jobs is a list"]
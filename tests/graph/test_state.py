@@ -10,6 +10,10 @@ from graph.state import (
     ErrorRecord,
     WorkflowPhase,
     JobStatus,
+    job_list,
+    merge_dicts,
+    patch_jobs,
+    status_lists,
 )
 
 
@@ -236,6 +240,104 @@ class TestSprintWorkflowState:
         assert len(state["checkpoints"]) == 2
 
 
+class TestStateReducers:
+    """Tests for the reducers on SprintWorkflowState."""
+
+    def test_merge_dicts(self):
+        """Test merge_dicts keeps untouched keys and overrides changed ones."""
+        assert merge_dicts({"a": 1, "b": 1}, {"b": 2}) == {"a": 1, "b": 2}
+        assert merge_dicts(None, {"a": 1}) == {"a": 1}
+        assert merge_dicts({"a": 1}, None) == {"a": 1}
+
+    def test_nodes_return_deltas(self):
+        """Test list fields append and retry_counts merge across nodes."""
+        from langgraph.graph import StateGraph, START, END
+
+        def first(state):
+            return {
+                "status_messages": ["first"],
+                "retry_counts": {"gap_analysis": 1},
+                "errors": [{"job": "a", "error": "boom"}],
+            }
+
+        def second(state):
+            return {"status_messages": ["second"], "retry_counts": {"job_validation": 1}}
+
+        builder = StateGraph(SprintWorkflowState)
+        builder.add_node("first", first)
+        builder.add_node("second", second)
+        builder.add_edge(START, "first")
+        builder.add_edge("first", "second")
+        builder.add_edge("second", END)
+
+        result = builder.compile().invoke({
+            "status_messages": ["start"],
+            "retry_counts": {"gap_analysis": 0, "verification": 2},
+        })
+
+        assert result["status_messages"] == ["start", "first", "second"]
+        assert result["retry_counts"] == {"gap_analysis": 1, "verification": 2, "job_validation": 1}
+        assert result["errors"] == [{"job": "a", "error": "boom"}]
+
+
+class TestJobPatches:
+    """Tests for the per-job patch reducer on ``jobs``."""
+
+    def test_patches_touch_only_named_jobs(self):
+        """Test a patch merges into its job and leaves the others shared."""
+        jobs = patch_jobs({}, [{"id": "a", "name": "A", "status": "pending"},
+                               {"id": "b", "name": "B", "status": "pending"}])
+
+        patched = patch_jobs(jobs, {"a": {"status": "failed", "error_message": "boom"}})
+
+        assert patched["a"] == {"id": "a", "name": "A", "status": "failed", "error_message": "boom"}
+        assert patched["b"] is jobs["b"]
+        assert jobs["a"]["status"] == "pending"
+
+    def test_list_replaces_and_none_removes(self):
+        """Test a job list replaces the mapping and a None patch removes a job."""
+        jobs = patch_jobs([{"name": "a"}, {"name": "b"}], {"b": None, "c": {"name": "c"}})
+
+        assert list(jobs) == ["a", "c"]
+        assert list(patch_jobs(jobs, [{"id": "x", "name": "x"}])) == ["x"]
+        assert [job["name"] for job in job_list({"jobs": jobs})] == ["a", "c"]
+
+    def test_parallel_patches_to_different_jobs(self):
+        """Test patches from nodes in the same superstep both apply."""
+        from langgraph.graph import StateGraph, START, END
+
+        builder = StateGraph(SprintWorkflowState)
+        builder.add_node("left", lambda state: {"jobs": {"a": {"status": "verified"}}})
+        builder.add_node("right", lambda state: {"jobs": {"b": {"status": "failed"}}})
+        builder.add_edge(START, "left")
+        builder.add_edge(START, "right")
+        builder.add_edge("left", END)
+        builder.add_edge("right", END)
+
+        result = builder.compile().invoke({"jobs": [{"name": "a", "status": "pending"},
+                                                    {"name": "b", "status": "pending"}]})
+
+        assert {key: job["status"] for key, job in result["jobs"].items()} == {"a": "verified", "b": "failed"}
+
+
+    def test_status_lists_cover_every_job(self):
+        """Test status lists are derived from all jobs, keeping earlier order."""
+        state = {
+            "jobs": [{"name": n, "status": st} for n, st in
+                     [("a", "verified"), ("b", "implementing"), ("c", "verified"), ("d", "implementing")]],
+            "jobs_verified": ["c", "a"],
+            "jobs_implementing": ["b", "d"],
+        }
+
+        lists = status_lists(state, {"b": {"status": "verified"}, "d": {"status": "failed"}})
+
+        assert lists == {
+            "jobs_implementing": [],
+            "jobs_verifying": [],
+            "jobs_verified": ["c", "a", "b"],
+            "jobs_failed": ["d"],
+        }
+
 class TestTypeAliases:
     """Tests for type aliases."""
 
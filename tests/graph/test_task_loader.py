@@ -0,0 +1,91 @@
+"""Tests for the parallel, cached task file loader."""
+
+import os
+
+import pytest
+
+from graph.task_loader import (
+    DEFAULT_STORY_POINTS,
+    clear_task_cache,
+    load_task_files,
+    parse_task_content,
+    task_cache_info,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start every test with an empty task cache."""
+    clear_task_cache()
+    yield
+    clear_task_cache()
+
+
+class TestParseTaskContent:
+    """Tests for parse_task_content."""
+
+    def test_extracts_points_and_todos(self):
+        """Test story points and unchecked todos are extracted."""
+        content = "# Auth\n\nStory Points: 8\n\n- [ ] Add login\n  - [ ] Add logout\n- [x] Done\n"
+
+        parsed = parse_task_content("auth", "tasks/auth.md", content)
+
+        assert parsed["story_points"] == 8
+        assert parsed["todos"] == [" Add login", " Add logout"]
+        assert parsed["name"] == "auth"
+
+    def test_heading_without_digits_keeps_default(self):
+        """Test a Story Points heading with no number is ignored."""
+        parsed = parse_task_content("x", "x.md", "## Story Points\nsee below\n")
+
+        assert parsed["story_points"] == DEFAULT_STORY_POINTS
+
+    def test_extracts_files_to_modify(self):
+        """Test files come from a Files to modify line and heading bullets."""
+        content = (
+            "# Auth\n\nFiles to modify: `src/auth.py`, src/db.py\n\n"
+            "## Files to Modify\n- src/db.py\n- `tests/test_auth.py`\n\n"
+            "## Todos\n- [ ] Add login\n- not a file\n"
+        )
+
+        parsed = parse_task_content("auth", "tasks/auth.md", content)
+
+        assert parsed["files_to_modify"] == ["src/auth.py", "src/db.py", "tests/test_auth.py"]
+        assert parsed["todos"] == [" Add login"]
+
+
+class TestLoadTaskFiles:
+    """Tests for load_task_files."""
+
+    def test_loads_all_files(self, tmp_path):
+        """Test every markdown file becomes a parsed task."""
+        for i in range(20):
+            (tmp_path / f"job{i}.md").write_text(f"Story Points: {i}\n- [ ] todo {i}\n")
+        (tmp_path / "notes.txt").write_text("ignored")
+
+        tasks = load_task_files(str(tmp_path), max_workers=4)
+
+        assert sorted(t["name"] for t in tasks) == sorted(f"job{i}" for i in range(20))
+        by_name = {t["name"]: t for t in tasks}
+        assert by_name["job7"]["story_points"] == 7
+        assert by_name["job7"]["todos"] == [" todo 7"]
+
+    def test_unchanged_files_come_from_cache(self, tmp_path):
+        """Test a second load only reparses modified files."""
+        (tmp_path / "a.md").write_text("Story Points: 1\n")
+        (tmp_path / "b.md").write_text("Story Points: 2\n")
+        load_task_files(str(tmp_path))
+
+        changed = tmp_path / "b.md"
+        changed.write_text("Story Points: 13\n")
+        stat = changed.stat()
+        os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        tasks = {t["name"]: t for t in load_task_files(str(tmp_path))}
+
+        assert tasks["b"]["story_points"] == 13
+        assert task_cache_info() == {"hits": 1, "misses": 3, "size": 2}
+
+    def test_missing_directory_is_empty(self, tmp_path):
+        """Test a missing tasks directory yields no tasks."""
+        assert load_task_files(str(tmp_path / "missing")) == []
@@ -0,0 +1,255 @@
+"""Tests for parallel job verification."""
+
+import asyncio
+import sys
+import time
+
+import pytest
+
+from graph.nodes.implementation import verification_loop_node
+from graph.verification import (
+    BoundedBuffer,
+    narrow_command,
+    outcome_summary,
+    parse_failed_tests,
+    run_incremental,
+    run_test_command,
+    verify_in_parallel,
+)
+
+
+PY = sys.executable
+
+ESCAPES_KILL = (
+    "import subprocess, sys, time;"
+    " subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(5)'], start_new_session=True);"
+    " time.sleep(30)"
+)
+"""Command whose child leaves its process group and keeps the pipes open"""
+
+
+class TestBoundedBuffer:
+    """Tests for BoundedBuffer."""
+
+    def test_keeps_tail(self):
+        """Test only the last bytes are kept."""
+        buffer = BoundedBuffer(limit=4)
+        buffer.write(b"abc")
+        buffer.write(b"defg")
+
+        assert buffer.text() == "defg"
+        assert buffer.total == 7
+        assert buffer.truncated
+
+
+class TestRunTestCommand:
+    """Tests for run_test_command."""
+
+    @pytest.mark.asyncio
+    async def test_passing_command(self, tmp_path):
+        """Test a zero exit code passes and output is captured."""
+        outcome = await run_test_command(
+            "job", [PY, "-c", "import os; print(os.getcwd())"], cwd=str(tmp_path)
+        )
+
+        assert outcome["status"] == "passed"
+        assert outcome["passed"] is True
+        assert outcome["returncode"] == 0
+        assert outcome["stdout"].strip() == str(tmp_path)
+
+    @pytest.mark.asyncio
+    async def test_failing_command(self, tmp_path):
+        """Test a non-zero exit fails with stderr captured."""
+        outcome = await run_test_command(
+            "job", f"{PY} -c 'import sys; sys.exit(\"2 tests failed\")'", cwd=str(tmp_path)
+        )
+
+        assert outcome["status"] == "failed"
+        assert outcome["returncode"] == 1
+        assert "2 tests failed" in outcome["stderr"]
+        assert "2 tests failed" in outcome_summary(outcome)
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_command(self, tmp_path):
+        """Test a hung command is killed at its timeout."""
+        start = time.monotonic()
+        outcome = await run_test_command(
+            "job", [PY, "-c", "import time; time.sleep(30)"], cwd=str(tmp_path), timeout=0.3
+        )
+
+        assert outcome["status"] == "timeout"
+        assert outcome["returncode"] is None
+        assert time.monotonic() - start < 5
+
+    @pytest.mark.asyncio
+    async def test_timeout_does_not_wait_for_escaped_children(self, tmp_path, monkeypatch):
+        """Test output reading stops shortly after the kill even if the pipes stay open."""
+        monkeypatch.setattr("graph.verification.OUTPUT_GRACE", 0.2)
+        start = time.monotonic()
+        outcome = await run_test_command("job", [PY, "-c", ESCAPES_KILL], cwd=str(tmp_path), timeout=0.3)
+
+        assert outcome["status"] == "timeout"
+        assert time.monotonic() - start < 3
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_output_readers(self, tmp_path):
+        """Test cancelling a run kills it and returns without waiting on its pipes."""
+        task = asyncio.ensure_future(run_test_command("job", [PY, "-c", ESCAPES_KILL], cwd=str(tmp_path)))
+        await asyncio.sleep(0.3)
+        start = time.monotonic()
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert time.monotonic() - start < 2
+
+    @pytest.mark.asyncio
+    async def test_output_is_bounded(self, tmp_path):
+        """Test large output keeps only the tail."""
+        outcome = await run_test_command(
+            "job", [PY, "-c", "print('x' * 100000 + 'END')"], cwd=str(tmp_path), max_output=1024
+        )
+
+        assert len(outcome["stdout"]) == 1024
+        assert outcome["stdout"].strip().endswith("END")
+        assert outcome["truncated"] is True
+
+    @pytest.mark.asyncio
+    async def test_missing_worktree_is_an_error(self, tmp_path):
+        """Test a command that cannot start reports an error outcome."""
+        outcome = await run_test_command("job", [PY, "-V"], cwd=str(tmp_path / "missing"))
+
+        assert outcome["status"] == "error"
+        assert outcome["passed"] is False
+
+
+class TestVerifyInParallel:
+    """Tests for verify_in_parallel."""
+
+    @pytest.mark.asyncio
+    async def test_runs_jobs_concurrently(self, tmp_path):
+        """Test four 0.3s commands with concurrency 4 overlap."""
+        jobs = [{"name": f"job{i}", "worktree": str(tmp_path)} for i in range(4)]
+        command = [PY, "-c", "import time; time.sleep(0.3)"]
+
+        start = time.monotonic()
+        outcomes = await verify_in_parallel(jobs, lambda job: command, max_concurrency=4)
+
+        assert time.monotonic() - start < 1.0
+        assert all(outcome["passed"] for outcome in outcomes.values())
+        assert set(outcomes) == {"job0", "job1", "job2", "job3"}
+
+    @pytest.mark.asyncio
+    async def test_missing_command_is_an_error(self, tmp_path):
+        """Test a job without a command gets an error outcome."""
+        outcomes = await verify_in_parallel([{"name": "job"}], lambda job: None, max_concurrency=1)
+
+        assert outcomes["job"]["status"] == "error"
+
+
+class TestVerificationLoopNode:
+    """Tests for verification_loop_node."""
+
+    @pytest.mark.asyncio
+    async def test_runs_configured_test_commands(self, tmp_path):
+        """Test jobs pass or fail on their test command."""
+        jobs = [
+            {"id": "job-1", "name": "ok", "status": "implementing", "worktree_path": str(tmp_path),
+             "test_command": f"{PY} -c pass"},
+            {"id": "job-2", "name": "bad", "status": "implementing", "worktree_path": str(tmp_path),
+             "test_command": f"{PY} -c 'raise SystemExit(3)'"},
+            {"id": "job-3", "name": "stub", "status": "implementing"},
+        ]
+
+        earlier = {"old": {"status": "passed", "returncode": 0}}
+        result = await verification_loop_node({"jobs": jobs, "pool_size": 2, "verification_results": earlier})
+
+        assert sorted(result["jobs_verified"]) == ["job-1", "job-3"]
+        assert set(result["verification_results"]) == {"ok", "bad"}
+        assert result["jobs_failed"] == ["job-2"]
+        assert result["verification_results"]["bad"]["returncode"] == 3
+        assert result["jobs"]["job-2"] == {"failed_tests": [], "status": "failed",
+                                           "error_message": "Verification failed"}
+        assert jobs[1]["status"] == "implementing"
+
+
+FLAKY_SUITE = '''
+import pathlib
+
+HERE = pathlib.Path(__file__).parent
+
+
+def test_stable():
+    with open(HERE / "full_runs.txt", "a") as f:
+        f.write("x")
+
+
+def test_fixed_later():
+    assert (HERE / "fixed").exists()
+'''
+
+
+class TestIncrementalRetry:
+    """Tests for last-failed-first re-verification."""
+
+    def test_parse_and_narrow_pytest(self):
+        """Test pytest failures are parsed and appended as node ids."""
+        argv = ["python", "-m", "pytest", "-q"]
+        output = "FAILED tests/test_a.py::test_x - assert 1 == 2\nERROR tests/test_b.py::test_y\n"
+
+        failed = parse_failed_tests(argv, output)
+
+        assert failed == ["tests/test_a.py::test_x", "tests/test_b.py::test_y"]
+        assert narrow_command(argv, failed) == argv + failed
+        assert narrow_command(["pytest", "-p", "no:cov", "tests/", "-x"], ["t.py::a"]) == [
+            "pytest", "-p", "no:cov", "-x", "t.py::a"
+        ]
+
+    def test_narrow_pytest_keeps_option_values(self):
+        """Test option values stay attached and unknown options disable narrowing."""
+        argv = ["pytest", "--cov-report", "term", "--junitxml", "out.xml", "-W", "error",
+                "--rootdir", "d", "-kslow", "--tb=short", "-vv", "tests/"]
+
+        assert narrow_command(argv, ["t.py::a"]) == argv[:-1] + ["t.py::a"]
+        assert narrow_command(["pytest", "--custom-plugin-opt", "x", "tests/"], ["t.py::a"]) is None
+        assert narrow_command(["pytest", "-Z", "tests/"], ["t.py::a"]) is None
+
+    def test_parse_and_narrow_go(self):
+        """Test go test failures become a -run pattern."""
+        argv = ["go", "test", "./..."]
+
+        failed = parse_failed_tests(argv, "--- FAIL: TestLogin (0.01s)\n    --- FAIL: TestLogin/bad (0.00s)\n")
+
+        assert failed == ["TestLogin"]
+        assert narrow_command(argv, failed) == ["go", "test", "-run", "^(TestLogin)$", "./..."]
+
+    def test_unknown_runner_is_not_narrowed(self):
+        """Test commands we cannot target always run in full."""
+        assert narrow_command(["npm", "test"], ["anything"]) is None
+
+    @pytest.mark.asyncio
+    async def test_retry_runs_failures_first_then_full_suite(self, tmp_path):
+        """Test a retry only widens to the full suite once failures pass."""
+        (tmp_path / "test_suite.py").write_text(FLAKY_SUITE)
+        command = [PY, "-m", "pytest", "-q", "-p", "no:cacheprovider", "test_suite.py"]
+        full_runs = tmp_path / "full_runs.txt"
+
+        first = await run_incremental("job", command, str(tmp_path))
+        assert first["status"] == "failed"
+        assert first["failed_tests"] == ["test_suite.py::test_fixed_later"]
+        assert full_runs.read_text() == "x"
+
+        # Still failing: only the failing test runs
+        second = await run_incremental("job", command, str(tmp_path), first["failed_tests"])
+        assert second["narrowed"] is True
+        assert second["status"] == "failed"
+        assert second["failed_tests"] == first["failed_tests"]
+        assert full_runs.read_text() == "x"
+
+        # Fixed: the failing test passes, then the full suite runs
+        (tmp_path / "fixed").touch()
+        third = await run_incremental("job", command, str(tmp_path), second["failed_tests"])
+        assert third["passed"] is True
+        assert third["narrowed"] is False
+        assert third["failed_tests"] == []
+        assert full_runs.read_text() == "xx"
@@ -0,0 +1,166 @@
+"""Tests for pluggable verifier backends."""
+
+import random
+import sys
+
+import pytest
+
+from graph.verifiers import (
+    LatencyModel,
+    RecordingVerifier,
+    ReplayVerifier,
+    SimulatedVerifier,
+    SubprocessVerifier,
+    VerifierBackend,
+    make_verifier,
+)
+
+
+def job(name, retry_count=0, **fields):
+    return {"name": name, "retry_count": retry_count, **fields}
+
+
+class TestLatencyModel:
+    """Tests for LatencyModel."""
+
+    def test_parse(self):
+        """Test latency specs parse into distributions."""
+        assert LatencyModel.parse("0.25").params == (0.25,)
+        assert LatencyModel.parse("lognormal:0.5,0.8").kind == "lognormal"
+        with pytest.raises(ValueError):
+            LatencyModel.parse("uniform:1")
+        with pytest.raises(ValueError):
+            LatencyModel.parse("gamma:1,2")
+
+    def test_samples_stay_in_range(self):
+        """Test uniform samples fall inside their bounds."""
+        model = LatencyModel("uniform", 1, 2)
+        rng = random.Random(0)
+
+        assert all(1 <= model.sample(rng) <= 2 for _ in range(100))
+
+
+class TestSimulatedVerifier:
+    """Tests for SimulatedVerifier."""
+
+    def test_same_seed_same_outcomes(self):
+        """Test a seed reproduces every outcome and order does not matter."""
+        jobs = [job(f"job-{i}") for i in range(200)]
+        first = SimulatedVerifier(seed=7, latency=LatencyModel("exponential", 2.0))
+        second = SimulatedVerifier(seed=7, latency=LatencyModel("exponential", 2.0))
+
+        forward = [first.draw(j) for j in jobs]
+        backward = [second.draw(j) for j in reversed(jobs)][::-1]
+
+        assert forward == backward
+        assert forward != [SimulatedVerifier(seed=8).draw(j) for j in jobs]
+
+    def test_failure_rate_is_respected(self):
+        """Test the observed failure rate tracks the configured one."""
+        verifier = SimulatedVerifier(seed=1, failure_rate=0.3, timeout_rate=0.1)
+        outcomes = [verifier.draw(job(f"job-{i}")) for i in range(5000)]
+
+        failed = sum(o["status"] == "failed" for o in outcomes) / len(outcomes)
+        timeouts = sum(o["status"] == "timeout" for o in outcomes) / len(outcomes)
+        assert 0.27 < failed < 0.33
+        assert 0.08 < timeouts < 0.12
+
+    def test_pass_after_and_per_job_rates(self):
+        """Test forced passes after retries and per-job failure rates."""
+        verifier = SimulatedVerifier(failure_rate=0.0, failure_rates={"flaky": 1.0}, pass_after=3)
+
+        assert not verifier.draw(job("flaky", retry_count=2))["passed"]
+        assert verifier.draw(job("flaky", retry_count=3))["passed"]
+        assert verifier.draw(job("steady"))["passed"]
+        assert not SimulatedVerifier(failure_rate=1.0).draw(job("flaky", retry_count=10))["passed"]
+
+    @pytest.mark.asyncio
+    async def test_time_scale_zero_does_not_sleep(self):
+        """Test durations are reported without sleeping at time_scale 0."""
+        verifier = SimulatedVerifier(latency=LatencyModel("constant", 60), time_scale=0)
+
+        outcome = await verifier.verify(job("slow"))
+
+        assert outcome["duration"] == 60
+
+
+class TestReplayVerifier:
+    """Tests for recording and replaying traces."""
+
+    @pytest.mark.asyncio
+    async def test_recorded_trace_replays_per_job(self, tmp_path):
+        """Test a recorded run replays the same outcomes in the same order."""
+        recorder = RecordingVerifier(SimulatedVerifier(seed=3, failure_rate=0.5, time_scale=0))
+        attempts = [job("a", 0), job("b", 0), job("a", 1), job("b", 1)]
+        recorded = [await recorder.verify(j) for j in attempts]
+        path = tmp_path / "trace.jsonl"
+        recorder.save(str(path))
+
+        replay = make_verifier("replay", path=str(path))
+        replayed = [await replay.verify(j) for j in attempts]
+
+        assert replayed == recorded
+        assert replay.remaining() == 0
+
+    @pytest.mark.asyncio
+    async def test_recording_to_a_path_writes_as_it_goes(self, tmp_path):
+        """Test a recorder with a path leaves a replayable trace without save."""
+        path = tmp_path / "trace.jsonl"
+        path.write_text("stale\n")
+        recorder = make_verifier(
+            "record",
+            backend=SimulatedVerifier(seed=5, failure_rate=0.5, time_scale=0),
+            path=str(path),
+        )
+        assert path.read_text() == ""
+
+        attempts = [job("a", 0), job("a", 1)]
+        recorded = [await recorder.verify(j) for j in attempts]
+        replay = make_verifier("replay", path=str(path))
+
+        assert [await replay.verify(j) for j in attempts] == recorded
+
+    @pytest.mark.asyncio
+    async def test_exhausted_trace(self):
+        """Test a job past the end of its trace repeats or errors."""
+        trace = [{"job": "a", "status": "failed"}]
+
+        repeat = ReplayVerifier(trace)
+        strict = ReplayVerifier(trace, repeat_last=False)
+        await repeat.verify(job("a"))
+        await strict.verify(job("a"))
+
+        assert (await repeat.verify(job("a")))["returncode"] == 1
+        assert (await strict.verify(job("a")))["status"] == "error"
+        assert (await repeat.verify(job("unknown")))["status"] == "error"
+
+
+class TestSubprocessVerifier:
+    """Tests for SubprocessVerifier."""
+
+    @pytest.mark.asyncio
+    async def test_runs_command_or_falls_back(self, tmp_path):
+        """Test jobs run their command and jobs without one use the fallback."""
+        verifier = SubprocessVerifier(fallback=SimulatedVerifier(failure_rate=0.0, time_scale=0))
+        command = f"{sys.executable} -c 'raise SystemExit(3)'"
+
+        ran = await verifier.verify(job("real", test_command=command, worktree=str(tmp_path)))
+        simulated = await verifier.verify(job("sim"))
+
+        assert ran["returncode"] == 3
+        assert simulated["passed"] and simulated["command"] == []
+        assert (await SubprocessVerifier().verify(job("none")))["status"] == "error"
+
+
+class TestVerifierBackend:
+    """Tests for the backend base class."""
+
+    def test_verify_is_abstract(self):
+        """Test a backend without verify cannot be created."""
+        class Incomplete(VerifierBackend):
+            name = "incomplete"
+
+        with pytest.raises(TypeError):
+            VerifierBackend()
+        with pytest.raises(TypeError):
+            Incomplete()
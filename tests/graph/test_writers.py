@@ -0,0 +1,160 @@
+"""Tests for atomic and debounced file writers."""
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from graph.writers import BackgroundWriter, DebouncedWriter, atomic_write_text
+
+
+class TestAtomicWriteText:
+    """Tests for atomic_write_text."""
+
+    def test_replaces_content_without_leftovers(self, tmp_path):
+        """Test the file is replaced and no temp files remain."""
+        target = tmp_path / "status.md"
+        target.write_text("old")
+
+        atomic_write_text(str(target), "new")
+
+        assert target.read_text() == "new"
+        assert os.listdir(tmp_path) == ["status.md"]
+
+    def test_failed_write_keeps_old_file(self, tmp_path):
+        """Test an error while writing leaves the original untouched."""
+        target = tmp_path / "status.md"
+        target.write_text("old")
+
+        with pytest.raises(TypeError):
+            atomic_write_text(str(target), None)
+
+        assert target.read_text() == "old"
+        assert os.listdir(tmp_path) == ["status.md"]
+
+
+    def test_keeps_existing_mode_and_uses_umask_for_new_files(self, tmp_path, monkeypatch):
+        """Test permissions match the replaced file, or the umask defaults."""
+        target = tmp_path / "status.md"
+        target.write_text("old")
+        target.chmod(0o640)
+        synced = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+
+        atomic_write_text(str(target), "new")
+        atomic_write_text(str(tmp_path / "fresh.md"), "new")
+
+        mask = os.umask(0)
+        os.umask(mask)
+        assert target.stat().st_mode & 0o777 == 0o640
+        assert (tmp_path / "fresh.md").stat().st_mode & 0o777 == 0o666 & ~mask
+        assert len(synced) == 2
+
+class TestDebouncedWriter:
+    """Tests for DebouncedWriter."""
+
+    @pytest.mark.asyncio
+    async def test_bursts_are_coalesced(self, tmp_path):
+        """Test many updates within the interval produce two writes."""
+        target = tmp_path / "status.md"
+        rendered = []
+
+        def render(state):
+            rendered.append(state)
+            return f"count={state['count']}\n"
+
+        writer = DebouncedWriter(str(target), render, min_interval=60, snapshot=dict)
+        state = {"count": 0}
+        for i in range(1000):
+            state["count"] = i
+            writer.mark_dirty(state)
+        await writer.flush()
+
+        assert writer.writes == 2
+        assert rendered[0]["count"] == 0
+        assert rendered[-1]["count"] == 999
+        assert target.read_text() == "count=999\n"
+        assert not writer.dirty
+
+    @pytest.mark.asyncio
+    async def test_updates_after_interval_are_written(self, tmp_path):
+        """Test a pending update is written once the interval passes."""
+        target = tmp_path / "status.md"
+        writer = DebouncedWriter(str(target), str, min_interval=0.01)
+
+        writer.mark_dirty("first")
+        writer.mark_dirty("second")
+        await asyncio.sleep(0.1)
+
+        assert writer.writes == 2
+        assert target.read_text() == "second"
+
+    @pytest.mark.asyncio
+    async def test_render_runs_off_the_event_loop(self, tmp_path):
+        """Test rendering happens in a worker thread."""
+        threads = []
+
+        def render(state):
+            threads.append(threading.get_ident())
+            return "x"
+
+        writer = DebouncedWriter(str(tmp_path / "status.md"), render)
+        writer.mark_dirty({})
+        await writer.flush()
+
+        assert threads and threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_flush_without_updates_writes_nothing(self, tmp_path):
+        """Test flush is a no-op when nothing is dirty."""
+        writer = DebouncedWriter(str(tmp_path / "status.md"), str)
+
+        await writer.flush()
+
+        assert writer.writes == 0
+        assert not (tmp_path / "status.md").exists()
+
+
+class TestBackgroundWriter:
+    """Tests for BackgroundWriter."""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_before_the_write(self, tmp_path, monkeypatch):
+        """Test submit does not wait for disk and drain waits for every write."""
+        release = threading.Event()
+        import graph.writers as writers
+        real_write = writers.atomic_write_text
+
+        def slow_write(path, content):
+            release.wait(5)
+            real_write(path, content)
+
+        monkeypatch.setattr(writers, "atomic_write_text", slow_write)
+        writer = BackgroundWriter(max_workers=2)
+        for i in range(5):
+            writer.submit(str(tmp_path / f"report-{i}.md"), f"report {i}\n")
+
+        assert writer.pending == 5
+        assert not list(tmp_path.iterdir())
+
+        release.set()
+        await writer.drain()
+        writer.close()
+
+        assert writer.pending == 0
+        assert sorted(p.name for p in tmp_path.iterdir()) == [f"report-{i}.md" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_drain_raises_failed_writes(self, tmp_path):
+        """Test a failed write surfaces from drain after the others finish."""
+        writer = BackgroundWriter()
+        writer.submit(str(tmp_path / "missing" / "report.md"), "x")
+        writer.submit(str(tmp_path / "ok.md"), "ok")
+
+        with pytest.raises(OSError):
+            await writer.drain()
+
+        assert (tmp_path / "ok.md").read_text() == "ok"
+        writer.close()
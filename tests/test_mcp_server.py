@@ -0,0 +1,654 @@
+"""Tests for the LangGraph sprint executor MCP server."""
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "mcp-servers"))
+
+import langgraph_sprint_executor as executor
+
+
+class RecordingWriter:
+    """Collects lines written by the dispatcher."""
+
+    def __init__(self):
+        self.lines = []
+
+    async def __call__(self, line: str):
+        self.lines.append(json.loads(line))
+
+
+class TestRequestDispatcher:
+    """Tests for concurrent JSON-RPC request dispatching."""
+
+    @pytest.mark.asyncio
+    async def test_slow_request_does_not_block_fast_one(self):
+        """Test a cheap request is answered while a slow one is in flight."""
+        release = asyncio.Event()
+
+        async def handler(request):
+            if request["method"] == "slow":
+                await release.wait()
+            return {"method": request["method"]}
+
+        writer = RecordingWriter()
+        dispatcher = executor.RequestDispatcher(handler=handler, write_line=writer)
+
+        dispatcher.dispatch(json.dumps({"jsonrpc": "2.0", "id": 1, "method": "slow"}))
+        fast = dispatcher.dispatch(json.dumps({"jsonrpc": "2.0", "id": 2, "method": "fast"}))
+        await fast
+
+        assert [line["id"] for line in writer.lines] == [2]
+        assert dispatcher.inflight == [1]
+
+        release.set()
+        await dispatcher.drain()
+
+        assert [line["id"] for line in writer.lines] == [2, 1]
+        assert writer.lines[1]["result"] == {"method": "slow"}
+        assert dispatcher.inflight == []
+
+    @pytest.mark.asyncio
+    async def test_notifications_get_no_response(self):
+        """Test requests without an id are handled but not answered."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request["method"])
+            return {}
+
+        writer = RecordingWriter()
+        dispatcher = executor.RequestDispatcher(handler=handler, write_line=writer)
+
+        dispatcher.dispatch(json.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"}))
+        await dispatcher.drain()
+
+        assert calls == ["notifications/initialized"]
+        assert writer.lines == []
+
+    @pytest.mark.asyncio
+    async def test_errors_are_reported_per_request(self):
+        """Test parse errors, unknown methods and handler crashes."""
+        async def handler(request):
+            if request["method"] == "crash":
+                raise RuntimeError("boom")
+            return await executor.handle_mcp_request(request)
+
+        writer = RecordingWriter()
+        dispatcher = executor.RequestDispatcher(handler=handler, write_line=writer)
+
+        dispatcher.dispatch("not json")
+        dispatcher.dispatch(json.dumps({"jsonrpc": "2.0", "id": 7, "method": "bogus"}))
+        dispatcher.dispatch(json.dumps({"jsonrpc": "2.0", "id": 8, "method": "crash"}))
+        await dispatcher.drain()
+
+        by_id = {line["id"]: line["error"] for line in writer.lines}
+        assert by_id[None]["code"] == -32700
+        assert by_id[7]["code"] == -32601
+        assert by_id[8]["code"] == -32603
+        assert "boom" in by_id[8]["message"]
+
+    @pytest.mark.asyncio
+    async def test_unhashable_ids_are_invalid_requests(self):
+        """Test ids that are not a string, integer or null are rejected."""
+        writer = RecordingWriter()
+        dispatcher = executor.RequestDispatcher(write_line=writer)
+
+        for bad_id in ({"x": 1}, [1], 1.5, True):
+            dispatcher.dispatch(json.dumps({"jsonrpc": "2.0", "id": bad_id, "method": "tools/list"}))
+        dispatcher.dispatch(json.dumps({"jsonrpc": "2.0", "id": None, "method": "tools/list"}))
+        await dispatcher.drain()
+
+        errors = [line["error"]["code"] for line in writer.lines if "error" in line]
+        assert errors == [-32600] * 4
+        assert [line["id"] for line in writer.lines if "result" in line] == [None]
+        assert dispatcher.inflight == []
+
+    @pytest.mark.asyncio
+    async def test_tools_list_round_trip(self):
+        """Test tools/list is wrapped in a JSON-RPC result envelope."""
+        writer = RecordingWriter()
+        dispatcher = executor.RequestDispatcher(write_line=writer)
+
+        dispatcher.dispatch(json.dumps({"jsonrpc": "2.0", "id": "a", "method": "tools/list"}))
+        await dispatcher.drain()
+
+        assert writer.lines[0]["jsonrpc"] == "2.0"
+        assert writer.lines[0]["id"] == "a"
+        tool_names = [tool["name"] for tool in writer.lines[0]["result"]["tools"]]
+        assert "execute_sprint" in tool_names
+
+
+class TestStdioTransport:
+    """Tests for the native pipe transport."""
+
+    @pytest.mark.asyncio
+    async def test_reads_lines_and_coalesces_writes(self):
+        """Test lines are read from the pipe and writes flush together."""
+        in_read, in_write = os.pipe()
+        out_read, out_write = os.pipe()
+        stdin = os.fdopen(in_read, "rb")
+        stdout = os.fdopen(out_write, "wb")
+
+        transport = executor.StdioTransport(stdin=stdin, stdout=stdout)
+        await transport.start()
+
+        os.write(in_write, b'{"id": 1}\n{"id": 2}\n')
+        os.close(in_write)
+        assert await transport.readline() == '{"id": 1}\n'
+        assert await transport.readline() == '{"id": 2}\n'
+        assert await transport.readline() == ""
+
+        await asyncio.gather(transport.write_line("first"), transport.write_line("second"))
+        await transport.close()
+
+        # Both lines arrive in one write, so a single read returns them
+        assert os.read(out_read, 1024) == b"first\nsecond\n"
+        stdin.close()
+        os.close(out_read)
+
+    @pytest.mark.asyncio
+    async def test_failed_start_leaves_stdin_usable(self, tmp_path):
+        """Test a writer that cannot attach detaches the reader again."""
+        in_read, in_write = os.pipe()
+        stdin = os.fdopen(in_read, "rb")
+        stdout = open(tmp_path / "out.txt", "wb")
+
+        assert not executor.StdioTransport.supported(stdin, stdout)
+        with pytest.raises(ValueError):
+            await executor.StdioTransport(stdin=stdin, stdout=stdout).start()
+        await asyncio.sleep(0)
+
+        assert os.get_blocking(in_read)
+        os.write(in_write, b"still here\n")
+        assert stdin.readline() == b"still here\n"
+        for f in (stdin, stdout):
+            f.close()
+        os.close(in_write)
+
+
+@pytest.fixture
+def sprint_dir(tmp_path, monkeypatch):
+    """Working directory with two small task files."""
+    (tmp_path / "tasks").mkdir()
+    for name in ("alpha", "beta"):
+        (tmp_path / "tasks" / f"{name}.md").write_text(
+            "# Job\n\nStory Points: 3\n\n- [ ] Do the thing\n"
+        )
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+async def run_app_state(run_id):
+    """Latest checkpointed state of a run."""
+    run = executor.get_sprint_run(run_id)
+    return (await run.app.aget_state(run.config)).values
+
+
+class TestSprintRuns:
+    """Tests for background sprint runs and their tools."""
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_run_id_and_await_finishes(self, sprint_dir):
+        """Test execute_sprint returns immediately and await_sprint completes."""
+        started = await executor.execute_sprint("demo", "prd.md", "todos.md")
+
+        assert started["status"] == "running"
+        assert started["thread_id"] == "sprint-demo"
+
+        info = await executor.await_sprint(started["run_id"], timeout=30)
+
+        assert info["timed_out"] is False
+        assert info["status"] == "completed"
+        assert info["result"]["phase"] == "complete"
+        assert info["result"]["jobs_verified"] + info["result"]["jobs_failed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_status_and_await_timeout_while_running(self, sprint_dir):
+        """Test status can be polled and await_sprint times out cleanly."""
+        started = await executor.execute_sprint("demo", "prd.md", "todos.md")
+
+        info = await executor.await_sprint(started["run_id"], timeout=0.01)
+        assert info["timed_out"] is True
+        assert info["status"] == "running"
+
+        status = await executor.sprint_status(started["run_id"])
+        assert status["run_id"] == started["run_id"]
+
+        await executor.cancel_sprint(started["run_id"])
+
+    @pytest.mark.asyncio
+    async def test_cancel_sprint(self, sprint_dir):
+        """Test a running sprint can be cancelled."""
+        started = await executor.execute_sprint("demo", "prd.md", "todos.md")
+
+        info = await executor.cancel_sprint(started["run_id"])
+
+        assert info["status"] == "cancelled"
+        assert info["finished_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_second_live_run_on_same_thread_is_rejected(self, sprint_dir):
+        """Test two concurrent runs cannot share a checkpoint thread."""
+        started = await executor.execute_sprint("demo", "prd.md", "todos.md")
+
+        with pytest.raises(executor.MCPError):
+            await executor.execute_sprint("demo", "prd.md", "todos.md")
+
+        await executor.cancel_sprint(started["run_id"])
+
+    @pytest.mark.asyncio
+    async def test_unknown_run_id(self):
+        """Test tools reject run ids they did not hand out."""
+        with pytest.raises(executor.MCPError) as excinfo:
+            await executor.sprint_status("missing")
+
+        assert excinfo.value.code == -32602
+
+    @pytest.mark.asyncio
+    async def test_tools_list_includes_run_tools(self):
+        """Test the run management tools are advertised."""
+        result = await executor.handle_mcp_request({"method": "tools/list"})
+        names = {tool["name"] for tool in result["tools"]}
+
+        assert {"execute_sprint", "sprint_status", "await_sprint", "cancel_sprint"} <= names
+
+
+class TestProgressNotifier:
+    """Tests for rate-limited progress notifications."""
+
+    @pytest.mark.asyncio
+    async def test_bursts_are_coalesced(self):
+        """Test a burst of node updates becomes two notifications."""
+        sent = []
+
+        async def send(method, params):
+            sent.append((method, params))
+
+        notifier = executor.ProgressNotifier("run-1", send=send, min_interval=60)
+        values = {"phase": "verifying", "jobs": [{}] * 10, "jobs_verified": ["a"], "jobs_failed": []}
+
+        for _ in range(1000):
+            notifier.update("verify", values)
+        await notifier.close()
+
+        assert notifier.sent == 2
+        assert [method for method, _ in sent] == ["notifications/progress"] * 2
+        final = sent[-1][1]
+        assert final["progressToken"] == "run-1"
+        assert final["progress"] == 1
+        assert final["total"] == 10
+        assert "verify x999" in final["message"]
+
+    @pytest.mark.asyncio
+    async def test_updates_after_interval_are_sent(self):
+        """Test updates spaced beyond the interval are each reported."""
+        sent = []
+
+        async def send(method, params):
+            sent.append(params)
+
+        notifier = executor.ProgressNotifier("run-2", send=send, min_interval=0.01)
+
+        notifier.update("initialize", {"phase": "implementing"})
+        await asyncio.sleep(0.05)
+        notifier.update("verify", {"phase": "verifying"})
+        await asyncio.sleep(0.05)
+        await notifier.close()
+
+        assert [params["message"].split("]")[0] for params in sent] == ["[implementing", "[verifying"]
+
+    @pytest.mark.asyncio
+    async def test_sprint_run_streams_progress(self, sprint_dir, monkeypatch):
+        """Test a background run forwards node updates to the client."""
+        sent = []
+
+        async def sink(method, params):
+            sent.append(params)
+
+        monkeypatch.setattr(executor, "_notification_sink", sink)
+
+        started = await executor.execute_sprint("demo", "prd.md", "todos.md", progress_token="tok")
+        await executor.await_sprint(started["run_id"], timeout=30)
+
+        assert sent
+        assert {params["progressToken"] for params in sent} == {"tok"}
+        assert sent[-1]["progress"] == 2
+        assert "final_report" in sent[-1]["message"]
+
+
+class TestDurableSprintRuns:
+    """Tests for SQLite checkpointing and resume in the MCP server."""
+
+    @pytest.mark.asyncio
+    async def test_resume_after_restart(self, sprint_dir):
+        """Test a cancelled run resumes from its SQLite checkpoint."""
+        db = str(sprint_dir / "checkpoints.db")
+        started = await executor.execute_sprint("durable", "prd.md", "todos.md", checkpoint_db=db)
+
+        # Let the run checkpoint at least one node, then simulate a crash
+        for _ in range(100):
+            if (await executor.sprint_status(started["run_id"])).get("phase"):
+                break
+            await asyncio.sleep(0.01)
+        await executor.cancel_sprint(started["run_id"])
+        executor.invalidate_compiled_graphs()
+
+        resumed = await executor.execute_sprint(
+            "durable", "prd.md", "todos.md", checkpoint_db=db, resume=True
+        )
+        info = await executor.await_sprint(resumed["run_id"], timeout=30)
+        executor.invalidate_compiled_graphs()
+
+        assert resumed["resumed"] is True
+        assert info["status"] == "completed"
+        assert info["result"]["phase"] == "complete"
+
+    @pytest.mark.asyncio
+    async def test_in_memory_resume_uses_previous_run(self, sprint_dir):
+        """Test an in-memory resume continues the thread's last run, isolated from others."""
+        started = await executor.execute_sprint("volatile", "prd.md", "todos.md")
+        for _ in range(100):
+            if (await executor.sprint_status(started["run_id"])).get("phase"):
+                break
+            await asyncio.sleep(0.01)
+        await executor.cancel_sprint(started["run_id"])
+
+        with pytest.raises(executor.MCPError):
+            await executor.execute_sprint("other", "prd.md", "todos.md", resume=True)
+        resumed = await executor.execute_sprint("volatile", "prd.md", "todos.md", resume=True)
+        info = await executor.await_sprint(resumed["run_id"], timeout=30)
+
+        assert info["status"] == "completed"
+        assert info["result"]["phase"] == "complete"
+
+    @pytest.mark.asyncio
+    async def test_resume_without_checkpoint_is_rejected(self, sprint_dir):
+        """Test resume fails clearly when the thread has no checkpoint."""
+        db = str(sprint_dir / "empty.db")
+        try:
+            with pytest.raises(executor.MCPError):
+                await executor.execute_sprint(
+                    "nothing", "prd.md", "todos.md", checkpoint_db=db, resume=True
+                )
+        finally:
+            executor.invalidate_compiled_graphs()
+
+
+class TestStatusDashboard:
+    """Tests for the debounced sprint_status.md writer."""
+
+    @pytest.mark.asyncio
+    async def test_sprint_writes_final_dashboard(self, sprint_dir):
+        """Test a run coalesces dashboard writes and ends with the final state."""
+        started = await executor.execute_sprint("dash", "prd.md", "todos.md")
+        await executor.await_sprint(started["run_id"], timeout=30)
+
+        writer = executor.get_dashboard_writer()
+        content = (sprint_dir / "sprint_status.md").read_text()
+
+        assert not writer.dirty
+        assert "## Current Phase: COMPLETE" in content
+        assert "- Total: 2" in content
+        assert "- Total: 6" in content
+        assert [p.name for p in sprint_dir.iterdir() if p.name.startswith(".sprint_status")] == []
+
+    def test_render_matches_state(self):
+        """Test the rendered dashboard reflects jobs, points and repos."""
+        job = {
+            "name": "alpha", "task_file": "tasks/alpha.md", "worktree": "wt", "repo_root": ".",
+            "branch": "feat-alpha", "todos": [], "story_points": 5, "status": "failed",
+            "retry_count": 5, "error_message": "boom",
+        }
+        state = {
+            "phase": "verifying", "jobs": [job], "jobs_implementing": [], "jobs_verifying": [],
+            "jobs_verified": [], "jobs_failed": ["alpha"],
+            "repos": [{"path": "/repo", "has_remote": False, "branches": []}],
+        }
+
+        content = executor.render_status_dashboard(executor.snapshot_dashboard_state(state))
+
+        assert "[✗] **alpha** (failed)" in content
+        assert "  - Error: boom" in content
+        assert "  - Retries: 5/5" in content
+        assert "- Failed: 5" in content
+        assert "- /repo (local only)" in content
+
+
+class TestDependencyScheduling:
+    """Tests for dependency-aware scheduling in the executor."""
+
+    @pytest.mark.asyncio
+    async def test_dependent_job_runs_after_dependency(self, sprint_dir, monkeypatch):
+        """Test a job with dependencies starts once they are verified."""
+        (sprint_dir / "tasks" / "gamma.md").write_text(
+            "# Job\n\nStory Points: 2\nDependencies: alpha, beta\n\n- [ ] Build on both\n"
+        )
+        started = []
+
+        async def implement_job(job):
+            started.append(job["name"])
+
+        monkeypatch.setattr(executor, "implement_job", implement_job)
+
+        run = await executor.execute_sprint("deps", "prd.md", "todos.md", pool_size=3)
+        info = await executor.await_sprint(run["run_id"], timeout=30)
+
+        assert info["status"] == "completed"
+        assert started[-1] == "gamma"
+        assert set(started[:2]) == {"alpha", "beta"}
+
+
+class TestVerification:
+    """Tests for subprocess verification in the executor."""
+
+    @pytest.mark.asyncio
+    async def test_test_command_failures_fail_the_job(self, sprint_dir):
+        """Test a failing test command exhausts retries and is reported."""
+        worktree = sprint_dir / "worktrees" / "feat-alpha"
+        worktree.mkdir(parents=True)
+        (sprint_dir / "tasks" / "alpha.md").write_text(
+            "# Job\n\nStory Points: 3\n"
+            f"Test Command: {sys.executable} -c 'raise SystemExit(\"boom\")'\n"
+        )
+
+        run = await executor.execute_sprint("verify", "prd.md", "todos.md")
+        info = await executor.await_sprint(run["run_id"], timeout=30)
+        state = await run_app_state(run["run_id"])
+
+        assert info["status"] == "completed"
+        assert info["result"]["jobs_failed"] == 1
+        assert state["verification_results"]["alpha"]["status"] == "failed"
+        assert state["verification_results"]["alpha"]["returncode"] == 1
+        report = info["result"]["errors"][0]["report"]
+        assert "boom" in (sprint_dir / report).read_text()
+
+    @pytest.mark.asyncio
+    async def test_seeded_simulation_is_reproducible(self, sprint_dir, monkeypatch):
+        """Test two simulated runs with the same seed retry identically."""
+        for name in ("gamma", "delta", "epsilon"):
+            (sprint_dir / "tasks" / f"{name}.md").write_text("# Job\n\nStory Points: 1\n")
+        monkeypatch.setenv("SPRINT_VERIFIER", "simulate")
+        monkeypatch.setenv("SPRINT_SIM_SEED", "11")
+        monkeypatch.setenv("SPRINT_SIM_FAILURE_RATE", "0.5")
+        monkeypatch.setenv("SPRINT_SIM_TIME_SCALE", "0")
+
+        retries = []
+        for project in ("sim-1", "sim-2"):
+            run = await executor.execute_sprint(project, "prd.md", "todos.md")
+            await executor.await_sprint(run["run_id"], timeout=30)
+            state = await run_app_state(run["run_id"])
+            retries.append({job["name"]: job["retry_count"] for job in state["jobs"]})
+
+        assert retries[0] == retries[1]
+        assert any(retries[0].values())
+
+    def test_only_explicit_simulation_forces_passes(self, monkeypatch):
+        """Test the auto backend's simulated fallback never forces a pass."""
+        monkeypatch.setenv("SPRINT_VERIFIER", "auto")
+        assert executor.create_verifier().fallback.pass_after is None
+
+        monkeypatch.setenv("SPRINT_VERIFIER", "simulate")
+        assert executor.create_verifier().pass_after == 3
+        monkeypatch.setenv("SPRINT_SIM_PASS_AFTER", "none")
+        assert executor.create_verifier().pass_after is None
+
+    @pytest.mark.asyncio
+    async def test_recorded_run_replays(self, sprint_dir, monkeypatch, tmp_path):
+        """Test a run recorded with SPRINT_VERIFIER=record replays identically."""
+        for name in ("gamma", "delta"):
+            (sprint_dir / "tasks" / f"{name}.md").write_text("# Job\n\nStory Points: 1\n")
+        trace = tmp_path / "trace.jsonl"
+        monkeypatch.setenv("SPRINT_VERIFIER_TRACE", str(trace))
+        monkeypatch.setenv("SPRINT_RECORD_BACKEND", "simulate")
+        monkeypatch.setenv("SPRINT_SIM_SEED", "11")
+        monkeypatch.setenv("SPRINT_SIM_FAILURE_RATE", "0.5")
+        monkeypatch.setenv("SPRINT_SIM_TIME_SCALE", "0")
+
+        results = []
+        for kind in ("record", "replay"):
+            monkeypatch.setenv("SPRINT_VERIFIER", kind)
+            run = await executor.execute_sprint(f"{kind}-run", "prd.md", "todos.md")
+            await executor.await_sprint(run["run_id"], timeout=30)
+            state = await run_app_state(run["run_id"])
+            results.append({job["name"]: job["retry_count"] for job in state["jobs"]})
+
+        assert trace.read_text().strip()
+        assert results[0] == results[1]
+
+    @pytest.mark.parametrize("env, setting", [
+        ({"SPRINT_VERIFIER": "simulated"}, "SPRINT_VERIFIER"),
+        ({"SPRINT_VERIFIER": "replay"}, "SPRINT_VERIFIER_TRACE"),
+        ({"SPRINT_VERIFIER": "record"}, "SPRINT_VERIFIER_TRACE"),
+        ({"SPRINT_VERIFIER": "replay", "SPRINT_VERIFIER_TRACE": "missing.jsonl"}, "SPRINT_VERIFIER_TRACE"),
+        (
+            {"SPRINT_VERIFIER": "record", "SPRINT_VERIFIER_TRACE": "t.jsonl", "SPRINT_RECORD_BACKEND": "replay"},
+            "SPRINT_RECORD_BACKEND",
+        ),
+    ])
+    @pytest.mark.asyncio
+    async def test_bad_verifier_settings_are_rejected(self, sprint_dir, monkeypatch, env, setting):
+        """Test execute_sprint names a bad verifier setting before starting a run."""
+        monkeypatch.delenv("SPRINT_VERIFIER_TRACE", raising=False)
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+
+        with pytest.raises(ValueError, match=setting):
+            executor.create_verifier()
+        with pytest.raises(executor.MCPError, match=setting):
+            await executor.execute_sprint("bad-config", "prd.md", "todos.md")
+        assert all(run.project_name != "bad-config" for run in executor._sprint_runs.values())
+
+
+
+class TestMergeTrain:
+    """Tests for the executor's merge train mode."""
+
+    @pytest.mark.asyncio
+    async def test_verified_branches_land_on_main(self, sprint_dir, monkeypatch):
+        """Test a local-only sprint lands every verified branch after one test run."""
+        import subprocess
+
+        def git(*args):
+            subprocess.run(["git", *args], cwd=sprint_dir, check=True, capture_output=True)
+
+        for key, value in {
+            "GIT_AUTHOR_NAME": "test", "GIT_AUTHOR_EMAIL": "test@example.com",
+            "GIT_COMMITTER_NAME": "test", "GIT_COMMITTER_EMAIL": "test@example.com",
+        }.items():
+            monkeypatch.setenv(key, value)
+        git("init", "-q", "-b", "main")
+        (sprint_dir / ".gitignore").write_text("worktrees/\nsprint_status.md\n")
+        git("add", ".")
+        git("commit", "-q", "-m", "init")
+        for name in ("alpha", "beta"):
+            git("worktree", "add", "-q", "-b", f"feat-{name}", f"worktrees/feat-{name}")
+            worktree = sprint_dir / "worktrees" / f"feat-{name}"
+            (worktree / f"{name}.txt").write_text(f"{name}\n")
+            subprocess.run(["git", "add", "."], cwd=worktree, check=True)
+            subprocess.run(["git", "commit", "-q", "-m", name], cwd=worktree, check=True)
+
+        monkeypatch.setattr(executor, "MERGE_TRAIN", True)
+        monkeypatch.setenv("SPRINT_TEST_COMMAND", "true")
+
+        run = await executor.execute_sprint("train", "prd.md", "todos.md")
+        info = await executor.await_sprint(run["run_id"], timeout=30)
+        state = await run_app_state(run["run_id"])
+
+        assert info["status"] == "completed"
+        assert [r["status"] for r in state["merge_status"]] == ["merged", "merged"]
+        assert (sprint_dir / "alpha.txt").exists() and (sprint_dir / "beta.txt").exists()
+        assert any("2/2 branches with 1 test runs" in m for m in state["status_messages"])
+
+
+class TestFileOverlap:
+    """Tests for the file-overlap index in the executor."""
+
+    @pytest.mark.asyncio
+    async def test_overlap_is_indexed_and_reported(self, sprint_dir):
+        """Test shared files are indexed at load time and summarized in the report."""
+        for name, files in (("alpha", "src/db.py, src/a.py"), ("beta", "src/db.py")):
+            (sprint_dir / "tasks" / f"{name}.md").write_text(
+                f"# Job\n\nStory Points: 3\nFiles to modify: {files}\n"
+            )
+
+        run = await executor.execute_sprint("overlap", "prd.md", "todos.md")
+        info = await executor.await_sprint(run["run_id"], timeout=30)
+        state = await run_app_state(run["run_id"])
+
+        assert info["status"] == "completed"
+        assert sorted(state["file_overlap"]["files"]["src/db.py"]) == ["alpha", "beta"]
+        report = next(sprint_dir.glob("sprint_report_*.md")).read_text()
+        assert "## File Overlap" in report
+        assert "- Shared Files: 1" in report
+        assert "- `src/db.py`:" in report
+
+    @pytest.mark.asyncio
+    async def test_push_and_merge_follows_overlap_order(self, sprint_dir, capsys, monkeypatch):
+        """Test the default merge path lands isolated branches before overlapping ones."""
+        monkeypatch.setattr(executor, "MERGE_TRAIN", False)
+        monkeypatch.setattr(executor, "SIMULATED_DELAY", 0)
+        jobs = [
+            {"name": name, "status": "verified", "story_points": 1, "files_to_modify": files,
+             "repo_root": str(sprint_dir)}
+            for name, files in (("alpha", ["db.py"]), ("beta", ["ui.js"]), ("gamma", ["db.py"]))
+        ]
+        state = executor.new_sprint_state("order", "prd.md", "todos.md", 3)
+        state.update(jobs=jobs, jobs_verified=["alpha", "beta", "gamma"],
+                     repos=[{"path": str(sprint_dir), "has_remote": False, "branches": []}],
+                     file_overlap=executor.OverlapIndex(jobs).to_dict())
+
+        await executor.push_and_merge(state)
+
+        merged = [line.split(":")[0].split()[-1] for line in capsys.readouterr().err.splitlines()
+                  if "merge locally" in line]
+        assert merged == ["beta", "alpha", "gamma"]
+
+    @pytest.mark.asyncio
+    async def test_push_and_merge_lands_each_branch_in_its_own_repo(self, tmp_path, capsys, monkeypatch):
+        """Test the default merge path merges a job only into its repo_root."""
+        monkeypatch.setattr(executor, "MERGE_TRAIN", False)
+        monkeypatch.setattr(executor, "SIMULATED_DELAY", 0)
+        local, remote = str(tmp_path / "local"), str(tmp_path / "remote")
+        jobs = [
+            {"name": name, "status": "verified", "story_points": 1, "files_to_modify": [], "repo_root": root}
+            for name, root in (("alpha", local), ("beta", remote), ("gamma", str(tmp_path / "gone")))
+        ]
+        state = executor.new_sprint_state("repos", "prd.md", "todos.md", 3)
+        state.update(jobs=jobs, jobs_verified=["alpha", "beta", "gamma"],
+                     repos=[{"path": local, "has_remote": False, "branches": []},
+                            {"path": remote, "has_remote": True, "branches": []}])
+
+        await executor.push_and_merge(state)
+
+        lines = [line.strip() for line in capsys.readouterr().err.splitlines() if "→" in line]
+        assert lines == [
+            "→ alpha: merge locally",
+            "→ beta: push + PR + auto-merge",
+            "→ gamma: skipped, repository not detected",
+        ]